@@ -0,0 +1,66 @@
+"""Benchmarks C# to Python collection conversion in TypeCast against the previous item-by-item conversion.
+
+Run with: python -m benchmarks.bench_collections [--output results.json]
+Requires Python.NET, the FlaUI assemblies are not needed.
+"""
+
+from typing import Any, Callable, Dict, List
+
+import clr  # noqa: F401
+from System import Array, Double, Int32, String  # pyright: ignore
+from System.Collections.Generic import Dictionary, List as CSList  # pyright: ignore
+
+from benchmarks.harness import measure, parse_args, write_results
+from flaui.lib.collections import TypeCast
+
+SIZES = (10, 1_000, 100_000)
+
+
+def _legacy_py_list(raw: Any) -> List[Any]:
+    """Item-by-item list conversion used before the bulk converters."""
+    return list(map(lambda x: x, raw))
+
+
+def _legacy_py_dict(raw: Any) -> Dict[Any, Any]:
+    """KeyValuePair enumeration used before the bulk converters."""
+    return {_.Key: _.Value for _ in raw.GetEnumerator()}
+
+
+def _collections(size: int) -> Dict[str, Any]:
+    """Builds the C# collections of the given size to convert."""
+    int_list = CSList[Int32]()
+    dictionary = Dictionary[String, Int32]()
+    for value in range(size):
+        int_list.Add(value)
+        dictionary[str(value)] = value
+    return {
+        "int_array": Array[Int32](list(range(size))),
+        "double_array": Array[Double]([float(_) for _ in range(size)]),
+        "string_array": Array[String]([str(_) for _ in range(size)]),
+        "int_list": int_list,
+        "dictionary": dictionary,
+    }
+
+
+def run(repeat: int = 5) -> List[Dict[str, Any]]:
+    """Runs every conversion case for every collection size.
+
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    results = []
+    for size in SIZES:
+        for name, raw in _collections(size).items():
+            converters: Dict[str, Callable[[], Any]] = (
+                {"legacy": lambda raw=raw: _legacy_py_dict(raw), "bulk": lambda raw=raw: TypeCast.py_dict(raw)}
+                if name == "dictionary"
+                else {"legacy": lambda raw=raw: _legacy_py_list(raw), "bulk": lambda raw=raw: TypeCast.py_list(raw)}
+            )
+            for variant, func in converters.items():
+                results.append({"case": name, "variant": variant, "size": size, **measure(func, repeat=repeat)})
+    return results
+
+
+if __name__ == "__main__":
+    args = parse_args(__doc__)
+    write_results("collections", run(repeat=args.repeat), args.output)
@@ -0,0 +1,53 @@
+"""Benchmarks Python to C# date conversion in TypeCast against the previous string formatting and parsing.
+
+Run with: python -m benchmarks.bench_datetimes [--output results.json]
+Requires Python.NET and arrow, the FlaUI assemblies are not needed.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+import arrow
+import clr  # noqa: F401
+from System import DateTime as CSDateTime  # pyright: ignore
+
+from benchmarks.harness import measure, parse_args, write_results
+from flaui.lib.collections import TypeCast
+
+SIZES = (1, 31, 365)
+
+
+def _legacy_cs_datetimes(dates: List[date]) -> List[Any]:
+    """String round trip conversion used before the tick based converters."""
+    return [CSDateTime.Parse(arrow.get(_).strftime("%Y-%m-%d")) for _ in dates]
+
+
+def _legacy_py_dates(raw: Any) -> List[date]:
+    """ISO string round trip conversion used before the tick based converters."""
+    return [arrow.get(_.ToString("o")).date() for _ in raw]
+
+
+def run(repeat: int = 5) -> List[Dict[str, Any]]:
+    """Runs every conversion case for every number of dates.
+
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    results = []
+    for size in SIZES:
+        dates = [date(2024, 1, 1) + timedelta(days=_) for _ in range(size)]
+        raw = TypeCast.cs_datetimes(dates)
+        cases = {
+            ("to_csharp", "legacy"): lambda dates=dates: _legacy_cs_datetimes(dates),
+            ("to_csharp", "ticks"): lambda dates=dates: TypeCast.cs_datetimes(dates),
+            ("to_python", "legacy"): lambda raw=raw: _legacy_py_dates(raw),
+            ("to_python", "ticks"): lambda raw=raw: TypeCast.py_dates(raw),
+        }
+        for (name, variant), func in cases.items():
+            results.append({"case": name, "variant": variant, "size": size, **measure(func, repeat=repeat)})
+    return results
+
+
+if __name__ == "__main__":
+    args = parse_args(__doc__)
+    write_results("datetimes", run(repeat=args.repeat), args.output)
@@ -0,0 +1,56 @@
+"""Benchmarks the trajectory planner and the timing jitter of replaying a trajectory at its planned cadence.
+
+Run with: python -m benchmarks.bench_trajectory [--output results.json]
+Requires NumPy only, no Python.NET or FlaUI assemblies are needed.
+"""
+
+from typing import Any, Dict, List
+
+from benchmarks.harness import measure, parse_args, write_results
+from flaui.lib.trajectory import Easing, plan_bezier, plan_linear, plan_rotation, replay
+
+# (duration, interval) in milliseconds
+CASES = ((200, 10), (2_000, 10), (2_000, 1))
+
+
+def run(repeat: int = 5) -> List[Dict[str, Any]]:
+    """Measures planning time for every path type and replays the linear path once to report its jitter.
+
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    results = []
+    for duration_ms, interval_ms in CASES:
+        planners = {
+            "linear": lambda duration_ms=duration_ms, interval_ms=interval_ms: plan_linear(
+                [((0, 0), (800, 600))], duration_ms, interval_ms
+            ),
+            "ease_in_out": lambda duration_ms=duration_ms, interval_ms=interval_ms: plan_linear(
+                [((0, 0), (800, 600))], duration_ms, interval_ms, Easing.EaseInOut
+            ),
+            "bezier": lambda duration_ms=duration_ms, interval_ms=interval_ms: plan_bezier(
+                [(0, 0), (200, 600), (600, -200), (800, 600)], duration_ms, interval_ms
+            ),
+            "rotation": lambda duration_ms=duration_ms, interval_ms=interval_ms: plan_rotation(
+                (400, 300), 200, 0.0, 6.28, duration_ms, interval_ms
+            ),
+        }
+        for name, func in planners.items():
+            results.append(
+                {
+                    "case": f"plan_{name}",
+                    "duration_ms": duration_ms,
+                    "interval_ms": interval_ms,
+                    **measure(func, repeat=repeat),
+                }
+            )
+        report = replay(planners["linear"](), lambda points: None)
+        results.append(
+            {"case": "replay_linear", "duration_ms": duration_ms, "interval_ms": interval_ms, **report.model_dump()}
+        )
+    return results
+
+
+if __name__ == "__main__":
+    args = parse_args(__doc__)
+    write_results("trajectory", run(repeat=args.repeat), args.output)
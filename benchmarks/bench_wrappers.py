@@ -0,0 +1,144 @@
+"""Benchmarks the Python wrapper layer against the simulated UIA backend of `benchmarks.fake_backend`.
+
+Covers element wrapping, find_all_*, property reads, Grid extraction, Retry waits and STA executor throughput at
+100 to 100k nodes. Only the Python side is measured, interop and UIA costs are not simulated.
+
+Run with: python -m benchmarks.bench_wrappers [--output results.json]
+Runs on any platform, neither Python.NET nor the FlaUI assemblies are needed.
+"""
+
+from benchmarks import fake_backend
+
+fake_backend.install()
+
+import time  # noqa: E402
+from typing import Any, Callable, Dict, List, Optional, Sequence  # noqa: E402
+
+from benchmarks.harness import measure, parse_args, write_results  # noqa: E402
+from flaui.core.automation_elements import AutomationElement, Grid  # noqa: E402
+from flaui.core.definitions import ControlType  # noqa: E402
+from flaui.core.tools import Retry  # noqa: E402
+from flaui.lib import identity_map  # noqa: E402
+from flaui.lib.threading_utils import get_sta_executor  # noqa: E402
+
+SIZES = (100, 1_000, 10_000, 100_000)
+GRID_COLUMNS = 10
+RETRY_POLLS = (1, 10)
+RETRY_INTERVAL_MS = 1
+
+
+def _number(size: int) -> Optional[int]:
+    """Calls per repetition: auto-calibrated for small sizes, one call for large ones to bound the run time."""
+    return None if size <= 1_000 else 1
+
+
+def _reusing(func: Callable[[], Any]) -> Any:
+    """Calls the function with element wrappers reused through an identity map.
+
+    :param func: Function to call
+    :return: Return value of the function
+    """
+    with identity_map.reuse_elements():
+        return func()
+
+
+def _tree_cases(size: int, repeat: int) -> List[Dict[str, Any]]:
+    """Measures wrapping, searching and property reads on a tree of the given size.
+
+    :param size: Number of nodes
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    raw_root = fake_backend.build_tree(size)
+    raw_elements = list(raw_root.iter_descendants())
+    root = AutomationElement(raw_element=raw_root)
+    elements = root.find_all_descendants()
+    buttons = root.condition_factory.by_control_type(ControlType.Button)
+    cases = {
+        "wrap": lambda: [AutomationElement(raw_element=_) for _ in raw_elements],
+        "find_all_children": lambda: root.find_all_children(),
+        "find_all_descendants": lambda: root.find_all_descendants(),
+        "find_all_descendants_condition": lambda: root.find_all_descendants(buttons),
+        "find_all_descendants_reused": lambda: _reusing(lambda: [root.find_all_descendants() for _ in range(2)]),
+        "read_name": lambda: [_.name for _ in elements],
+        "read_control_type": lambda: [_.control_type for _ in elements],
+    }
+    return [
+        {"case": name, "size": size, **measure(func, number=_number(size), repeat=repeat)}
+        for name, func in cases.items()
+    ]
+
+
+def _grid_cases(size: int, repeat: int) -> List[Dict[str, Any]]:
+    """Measures the columnar extraction of a grid with the given number of cells.
+
+    :param size: Number of cells
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    grid = Grid(raw_element=fake_backend.build_grid(max(size // GRID_COLUMNS, 1), GRID_COLUMNS))
+    return [
+        {
+            "case": "grid_to_columns",
+            "size": size,
+            **measure(lambda: grid.to_columns(), number=_number(size), repeat=repeat),
+        }
+    ]
+
+
+def _executor_cases(size: int, repeat: int) -> List[Dict[str, Any]]:
+    """Measures the round trip of dispatching the given number of calls through the STA executor.
+
+    :param size: Number of calls
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    executor = get_sta_executor()
+    calls = range(size)
+    timings = measure(lambda: [executor.run(abs, _) for _ in calls], number=_number(size), repeat=repeat)
+    return [{"case": "executor_run", "size": size, **timings, "calls_per_s": size / timings["median_us"] * 1e6}]
+
+
+def _retry_cases(repeat: int) -> List[Dict[str, Any]]:
+    """Measures how much longer a Retry wait takes than its polls and intervals strictly require.
+
+    :param repeat: Repetitions per case
+    :return: Benchmark results
+    """
+    results = []
+    for polls in RETRY_POLLS:
+        overheads = []
+        for _ in range(repeat):
+            answers = iter([False] * (polls - 1) + [True])
+            start = time.perf_counter()
+            Retry.WhileFalse(lambda answers=answers: next(answers), timeout=10_000, interval=RETRY_INTERVAL_MS)
+            overheads.append((time.perf_counter() - start) * 1000.0 - (polls - 1) * RETRY_INTERVAL_MS)
+        results.append(
+            {
+                "case": "retry_while_false",
+                "polls": polls,
+                "interval_ms": RETRY_INTERVAL_MS,
+                "min_overhead_ms": min(overheads),
+                "max_overhead_ms": max(overheads),
+                "repeat": repeat,
+            }
+        )
+    return results
+
+
+def run(repeat: int = 5, sizes: Sequence[int] = SIZES) -> List[Dict[str, Any]]:
+    """Runs every case for every size.
+
+    :param repeat: Repetitions per case
+    :param sizes: Node, cell and call counts
+    :return: Benchmark results
+    """
+    results = []
+    for size in sizes:
+        results += _tree_cases(size, repeat) + _grid_cases(size, repeat) + _executor_cases(size, repeat)
+    return results + _retry_cases(repeat)
+
+
+if __name__ == "__main__":
+    args = parse_args(__doc__)
+    write_results("wrappers", run(repeat=args.repeat), args.output)
@@ -0,0 +1,474 @@
+"""Simulated UIA backend so the benchmarks run on any platform, without .NET or the FlaUI assemblies.
+
+`install()` registers stand-in modules for `clr`, `System` and `FlaUI`: every name imported from them resolves to a
+stub type, so the flaui modules import unchanged. `FakeElement` mimics the raw FlaUI AutomationElement wrapped in
+`raw_element` (properties, property and pattern accessors, FindAll*/FindFirst*, condition factory, grid rows and
+headers) on a plain Python tree built by `build_tree` or `build_grid`.
+
+The backend measures the cost of the Python wrapper layer only, the interop and UIA costs of a real session are not
+simulated. Call `install()` before importing any flaui module.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import itertools
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Root packages replaced by stand-in modules
+FAKE_PACKAGES = ("clr", "System", "FlaUI")
+
+
+class _StubType(type):
+    """Metaclass of the stub types: every unknown attribute resolves to a nested stub type (eg. an enum member)."""
+
+    def __getattr__(cls, name: str) -> Any:
+        """Resolves unknown attributes to nested stub types, cached on the type."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name == "ToString":
+            return lambda: cls.__name__
+        nested = _stub_type(name, cls.__module__, cls)
+        setattr(cls, name, nested)
+        return nested
+
+    def __getitem__(cls, item: Any) -> Any:
+        """Generic types (eg. Array[Int32]) resolve to the type itself."""
+        return cls
+
+    def __repr__(cls) -> str:
+        """Names the stub type."""
+        return f"<stub {cls.__qualname__}>"
+
+
+class _Stub(metaclass=_StubType):
+    """Base of the stub types, instances accept any arguments and answer every call with another stub."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.args = args
+
+    def __getattr__(self, name: str) -> Any:
+        """Answers every unknown attribute with another stub."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Answers every call with another stub."""
+        return _Stub()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Stubs are empty collections."""
+        return iter(())
+
+
+def _stub_type(name: str, module: str, parent: Optional[type] = None) -> type:
+    """Creates a stub type, names ending with Exception derive from Exception so they can be caught.
+
+    :param name: Type name
+    :param module: Name of the fake module the type belongs to
+    :param parent: Enclosing stub type, if any
+    :return: Stub type
+    """
+    bases = (Exception, _Stub) if name.endswith("Exception") else (_Stub,)
+    namespace = {"__module__": module, "__qualname__": f"{parent.__qualname__}.{name}" if parent else name}
+    if bases[0] is Exception:
+        namespace.update(__init__=Exception.__init__, __getattr__=_Stub.__getattr__)
+    return _StubType(name, bases, namespace)
+
+
+class _FakeThread:
+    """Stand-in for System.Threading.Thread running the thread start on a Python daemon thread."""
+
+    def __init__(self, start: Callable[[], None]) -> None:
+        self._thread = threading.Thread(target=start, daemon=True)
+        self.IsBackground = True
+
+    def SetApartmentState(self, state: Any) -> None:
+        """Ignored, Python threads have no COM apartment."""
+
+    def Start(self) -> None:
+        """Starts the thread."""
+        self._thread.start()
+
+
+# Stand-ins with behaviour, by module and name
+_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "System.Threading": {"Thread": _FakeThread, "ThreadStart": lambda start: start},
+}
+
+
+class _FakeModule(ModuleType):
+    """Stand-in module: every imported name resolves to a stub type, submodules are created on demand."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__path__: List[str] = []
+        for key, value in _OVERRIDES.get(name, {}).items():
+            setattr(self, key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolves imported names to stub types, cached on the module."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _stub_type(name, self.__name__)
+        setattr(self, name, value)
+        return value
+
+
+class _FakeFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import hook creating the stand-in modules of the fake packages."""
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        """Claims the modules of the fake packages."""
+        if fullname.split(".")[0] in FAKE_PACKAGES:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec: Any) -> ModuleType:
+        """Creates the stand-in module."""
+        return _FakeModule(spec.name)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Nothing to run, stand-in modules resolve their names on demand."""
+
+
+def install() -> None:
+    """Registers the stand-in modules, has to be called before any flaui module is imported."""
+    if not any(isinstance(_, _FakeFinder) for _ in sys.meta_path):
+        sys.meta_path.insert(0, _FakeFinder())
+
+
+def _cs(module: str, name: str) -> Any:
+    """Resolves a (stub) type of a fake module.
+
+    :param module: Module name
+    :param name: Type name
+    :return: Stub type
+    """
+    return getattr(importlib.import_module(module), name)
+
+
+class FakeProperty:
+    """Mimics AutomationProperty: a value read through Value or ValueOrDefault."""
+
+    __slots__ = ("Value",)
+
+    def __init__(self, value: Any) -> None:
+        self.Value = value
+
+    @property
+    def ValueOrDefault(self) -> Any:
+        """Returns the value."""
+        return self.Value
+
+
+class FakePattern:
+    """Mimics AutomationPattern: the pattern object read through Pattern or PatternOrDefault."""
+
+    __slots__ = ("Pattern",)
+
+    def __init__(self, pattern: Any) -> None:
+        self.Pattern = pattern
+
+    @property
+    def PatternOrDefault(self) -> Any:
+        """Returns the pattern object, None if not supported."""
+        return self.Pattern
+
+    @property
+    def IsSupported(self) -> bool:
+        """Tells if the element supports the pattern."""
+        return self.Pattern is not None
+
+
+class _Properties:
+    """Mimics FrameworkAutomationElement.Properties, properties are read from the element."""
+
+    def __init__(self, element: FakeElement) -> None:
+        self._element = element
+
+    def __getattr__(self, name: str) -> FakeProperty:
+        """Returns the element attribute as property, None if the element has no such attribute."""
+        return FakeProperty(getattr(self._element, name, None))
+
+
+class _Patterns:
+    """Mimics FrameworkAutomationElement.Patterns: value and grid item patterns are supported by cells."""
+
+    def __init__(self, element: FakeElement) -> None:
+        self._element = element
+
+    @property
+    def Value(self) -> FakePattern:
+        """Value pattern, supported by elements with a value."""
+        value = self._element.Value
+        return FakePattern(_Namespace(Value=FakeProperty(value)) if value is not None else None)
+
+    @property
+    def GridItem(self) -> FakePattern:
+        """Grid item pattern, supported by elements with a row."""
+        row = self._element.Row
+        return FakePattern(_Namespace(Row=FakeProperty(row)) if row is not None else None)
+
+    def __getattr__(self, name: str) -> FakePattern:
+        """Other patterns are not supported."""
+        return FakePattern(None)
+
+
+class _Namespace:
+    """Plain attribute container."""
+
+    def __init__(self, **attributes: Any) -> None:
+        self.__dict__.update(attributes)
+
+
+class FakeCondition:
+    """Mixin of the fake conditions: evaluates the condition against a fake element."""
+
+    # Set per condition by `_fake_condition`, conditions without predicate (eg. TrueCondition) match every element
+    predicate: Callable[[FakeElement], bool] = staticmethod(lambda element: True)
+
+    def matches(self, element: FakeElement) -> bool:
+        """Evaluates the condition.
+
+        :param element: Fake element
+        :return: True if the element matches the condition
+        """
+        return self.predicate(element)
+
+    def And(self, other: FakeCondition) -> FakeCondition:
+        """Combines the conditions, both have to match."""
+        return _fake_condition("AndCondition", lambda element: self.matches(element) and other.matches(element))
+
+    def Or(self, other: FakeCondition) -> FakeCondition:
+        """Combines the conditions, either has to match."""
+        return _fake_condition("OrCondition", lambda element: self.matches(element) or other.matches(element))
+
+    def Not(self) -> FakeCondition:
+        """Negates the condition."""
+        return _fake_condition("NotCondition", lambda element: not self.matches(element))
+
+
+_CONDITION_TYPES: Dict[str, type] = {}
+
+
+def _fake_type(methods: type, stub: type) -> type:
+    """Creates a type implementing a stub type, named like the stub type so it is recorded under the FlaUI name.
+
+    :param methods: Mixin with the implementation
+    :param stub: Stub type
+    :return: Implementing type
+    """
+    return type(stub.__name__, (methods, stub), {"__module__": stub.__module__, "__qualname__": stub.__qualname__})
+
+
+def _fake_condition(kind: str, predicate: Callable[[FakeElement], bool]) -> Any:
+    """Creates a condition which is an instance of the FlaUI condition stub type of the given kind.
+
+    :param kind: PropertyCondition, AndCondition, OrCondition or NotCondition
+    :param predicate: Evaluates the condition against a fake element
+    :return: Fake condition
+    """
+    if kind not in _CONDITION_TYPES:
+        _CONDITION_TYPES[kind] = _fake_type(FakeCondition, _cs("FlaUI.Core.Conditions", kind))
+    condition = _CONDITION_TYPES[kind]()
+    condition.predicate = predicate
+    return condition
+
+
+def property_condition(name: str, value: Any) -> Any:
+    """Creates a fake PropertyCondition comparing an element property.
+
+    :param name: Property name (eg. AutomationId)
+    :param value: Expected value
+    :return: Fake condition
+    """
+    condition = _fake_condition("PropertyCondition", lambda element: getattr(element, name, None) == value)
+    condition.Property, condition.Value = name, value
+    return condition
+
+
+class _ConditionFactoryMethods:
+    """Mimics FlaUI's ConditionFactory for the property conditions used by the wrappers."""
+
+    def ByAutomationId(self, value: str, flags: Any = None) -> Any:
+        """Matches elements by AutomationId."""
+        return property_condition("AutomationId", value)
+
+    def ByName(self, value: str, flags: Any = None) -> Any:
+        """Matches elements by Name."""
+        return property_condition("Name", value)
+
+    def ByClassName(self, value: str, flags: Any = None) -> Any:
+        """Matches elements by ClassName."""
+        return property_condition("ClassName", value)
+
+    def ByControlType(self, value: Any) -> Any:
+        """Matches elements by ControlType."""
+        return property_condition("ControlType", value)
+
+
+_CONDITION_FACTORY: List[Any] = []
+
+
+def condition_factory() -> Any:
+    """Returns the shared fake condition factory, an instance of the FlaUI ConditionFactory stub type.
+
+    :return: Fake condition factory
+    """
+    if not _CONDITION_FACTORY:
+        factory_type = _fake_type(_ConditionFactoryMethods, _cs("FlaUI.Core.Conditions", "ConditionFactory"))
+        _CONDITION_FACTORY.append(factory_type())
+    return _CONDITION_FACTORY[0]
+
+
+# Source of the RuntimeIds of the fake elements, unique within the process
+_RUNTIME_IDS = itertools.count(1)
+
+
+class FakeElement:
+    """Mimics the raw FlaUI AutomationElement held in `raw_element`."""
+
+    Automation = _Stub()
+
+    def __init__(
+        self,
+        control_type: str = "Custom",
+        name: str = "",
+        automation_id: str = "",
+        class_name: str = "",
+        value: Optional[str] = None,
+        row: Optional[int] = None,
+        children: Sequence[FakeElement] = (),
+    ) -> None:
+        self.ControlType = getattr(_cs("FlaUI.Core.Definitions", "ControlType"), control_type)
+        self.Name = name
+        self.AutomationId = automation_id
+        self.ClassName = class_name
+        self.Value = value
+        self.Row = row
+        self.IsEnabled = True
+        self.IsOffscreen = False
+        self.RuntimeId = [42, next(_RUNTIME_IDS)]
+        self.Parent: Optional[FakeElement] = None
+        self.children: List[FakeElement] = []
+        for child in children:
+            self.add(child)
+        self.Properties = _Properties(self)
+        self.Patterns = _Patterns(self)
+
+    def add(self, child: FakeElement) -> FakeElement:
+        """Appends a child element.
+
+        :param child: Child element
+        :return: The child element
+        """
+        child.Parent = self
+        self.children.append(child)
+        return child
+
+    def iter_descendants(self) -> Iterator[FakeElement]:
+        """Iterates the descendants depth first."""
+        stack = list(reversed(self.children))
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
+
+    @property
+    def ConditionFactory(self) -> Any:
+        """Shared fake condition factory."""
+        return condition_factory()
+
+    @property
+    def CachedChildren(self) -> List[FakeElement]:
+        """Child elements, every property of the fake elements counts as cached."""
+        return self.children
+
+    def FindAllChildren(self, condition: Optional[FakeCondition] = None) -> List[FakeElement]:
+        """Children matching the condition."""
+        return [_ for _ in self.children if condition is None or condition.matches(_)]
+
+    def FindAllDescendants(self, condition: Optional[FakeCondition] = None) -> List[FakeElement]:
+        """Descendants matching the condition, depth first."""
+        return [_ for _ in self.iter_descendants() if condition is None or condition.matches(_)]
+
+    def FindFirstChild(self, condition: Optional[FakeCondition] = None) -> Optional[FakeElement]:
+        """First child matching the condition, None if there is none."""
+        return next((_ for _ in self.children if condition is None or condition.matches(_)), None)
+
+    def FindFirstDescendant(self, condition: Optional[FakeCondition] = None) -> Optional[FakeElement]:
+        """First descendant matching the condition, depth first, None if there is none."""
+        return next((_ for _ in self.iter_descendants() if condition is None or condition.matches(_)), None)
+
+    @property
+    def Rows(self) -> List[FakeElement]:
+        """Rows of a grid: the DataItem children."""
+        data_item = _cs("FlaUI.Core.Definitions", "ControlType").DataItem
+        return [_ for _ in self.children if _.ControlType is data_item]
+
+    @property
+    def Header(self) -> Optional[Any]:
+        """Header of a grid with the column texts, None if the grid has no Header child."""
+        header = _cs("FlaUI.Core.Definitions", "ControlType").Header
+        found = next((_ for _ in self.children if _.ControlType is header), None)
+        return _Namespace(Columns=[_Namespace(Text=_.Name) for _ in found.children]) if found is not None else None
+
+
+_CONTROL_TYPES = ("Button", "Edit", "Text", "CheckBox", "ListItem")
+
+
+def build_tree(nodes: int, fanout: int = 10) -> FakeElement:
+    """Builds a window with the given number of descendants, `fanout` children per container.
+
+    Leaves cycle through a few control types and are named item_<index> (automation id and name).
+
+    :param nodes: Number of descendants
+    :param fanout: Children per container, defaults to 10
+    :return: Root (Window) element
+    """
+    root = FakeElement("Window", name="Fake window", automation_id="root")
+    counter = itertools.count()
+    containers = [root]
+    created = 0
+    while created < nodes:
+        next_level: List[FakeElement] = []
+        for parent in containers:
+            for _ in range(fanout):
+                if created >= nodes:
+                    break
+                index = next(counter)
+                is_leaf = created + len(containers) * fanout >= nodes
+                element = FakeElement(
+                    "Pane" if not is_leaf else _CONTROL_TYPES[index % len(_CONTROL_TYPES)],
+                    name=f"item_{index}",
+                    automation_id=f"item_{index}",
+                )
+                parent.add(element)
+                next_level.append(element)
+                created += 1
+        containers = next_level
+    return root
+
+
+def build_grid(rows: int, columns: int) -> FakeElement:
+    """Builds a data grid with a header and rows of cells exposing the value and grid item patterns.
+
+    :param rows: Number of rows
+    :param columns: Number of columns
+    :return: Grid (DataGrid) element
+    """
+    grid = FakeElement("DataGrid", automation_id="grid")
+    grid.add(FakeElement("Header", children=[FakeElement("HeaderItem", name=f"Column {_}") for _ in range(columns)]))
+    for row in range(rows):
+        cells = [
+            FakeElement("DataItem", name=f"{row}.{column}", value=f"{row}.{column}", row=row)
+            for column in range(columns)
+        ]
+        grid.add(FakeElement("DataItem", name=f"Row {row}", row=row, children=cells))
+    return grid
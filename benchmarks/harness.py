@@ -0,0 +1,67 @@
+"""Shared helpers to time benchmark cases and report the results as JSON."""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+
+def measure(func: Callable[[], Any], number: Optional[int] = None, repeat: int = 5) -> Dict[str, float]:
+    """Times a callable and returns per-call statistics.
+
+    :param func: Callable to time
+    :param number: Calls per repetition, auto-calibrated to roughly 0.2s per repetition when None
+    :param repeat: Number of repetitions
+    :return: Per-call timings in microseconds (min, median, max) along with the call count
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    runs = [elapsed / number * 1e6 for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min_us": min(runs),
+        "median_us": statistics.median(runs),
+        "max_us": max(runs),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    """Parses the common command line options of a benchmark module.
+
+    :param description: Benchmark description shown in --help
+    :return: Parsed arguments (output, repeat)
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", "-o", default=None, help="JSON file to write the results to, defaults to stdout")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Repetitions per benchmark case")
+    return parser.parse_args()
+
+
+def write_results(suite: str, results: List[Dict[str, Any]], output: Optional[str] = None) -> Dict[str, Any]:
+    """Writes benchmark results as JSON so that runs can be compared between commits.
+
+    :param suite: Name of the benchmark suite
+    :param results: One dict per benchmark case
+    :param output: File path to write to, defaults to stdout
+    :return: The full report
+    """
+    report = {
+        "suite": suite,
+        "timestamp": time.time(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if output is None:
+        print(text)
+    else:
+        with open(output, "w", encoding="utf-8") as handle:
+            handle.write(text)
+    return report
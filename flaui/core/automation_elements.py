@@ -9,10 +9,11 @@ from __future__ import annotations
 import abc
 from datetime import date
 import logging
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union, overload
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union, overload
 
-import arrow
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+import numpy as np
+from PIL import Image
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
 from System import NullReferenceException  # pyright: ignore
 
 from flaui.core.automation_type import AutomationType
@@ -21,13 +22,20 @@ from flaui.core.definitions import (
     ControlType,
     ExpandCollapseState,
     RowOrColumnMajor,
+    ScrollAmount,
     ToggleState,
     TreeScope,
     TreeTraversalOptions,
 )
 from flaui.core.framework_types import FrameworkType
+from flaui.lib import cache_profile, capture_cache, identity_map, property_cache
+from flaui.lib.cache_profile import prefetches
 from flaui.lib.collections import TypeCast
+from flaui.lib.events import EventKind, EventQueue
 from flaui.lib.exceptions import ElementNotFound, handle_csharp_exceptions
+from flaui.lib.property_cache import invalidates_properties
+from flaui.lib.screenshots import PixelOrder, bitmap_to_array, to_image
+from flaui.lib.tables import TableFormat, to_columns
 from flaui.lib.system.drawing import (
     Color,
     ColorData,
@@ -40,6 +48,17 @@ from flaui.lib.system.drawing import (
     Size,
 )
 
+
+def _event_action(action: Union[Callable[..., None], EventQueue], kind: EventKind) -> Callable[..., None]:
+    """Resolves the handler passed to a register_*_event method.
+
+    :param action: Event handler, or an EventQueue receiving the events
+    :param kind: Event kind recorded by the EventQueue
+    :return: Event handler
+    """
+    return action.callback(kind) if isinstance(action, EventQueue) else action
+
+
 # ================================================================================
 #   Element base Pydantic abstract class
 # ================================================================================
@@ -51,6 +70,109 @@ class ElementModel(BaseModel, abc.ABC):  # pragma: no cover
     raw_element: Any = Field(
         ..., title="Automation Element", description="Contains the C# automation element in raw form"
     )  # Consider making this a private property
+    # RuntimeId of the element, None until it is read, () if the element has none
+    _runtime_id: Optional[Tuple[int, ...]] = PrivateAttr(default=None)
+    # Values cached by the property cache, created on first use
+    _property_values: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # Cache profile the element was prefetched with by a profiled find, if any
+    _cache_profile: Any = PrivateAttr(default=None)
+
+    def __new__(cls, *args: Any, **data: Any) -> Any:
+        """Returns the live handle of the element while an identity map is active, a new wrapper otherwise.
+
+        A reused handle takes over the raw element of the latest find, so that it holds what this find cached.
+        """
+        handles = identity_map.active
+        if handles is None or data.get("raw_element") is None:
+            return super().__new__(cls)
+
+        def create(key: Optional[Tuple[int, ...]]) -> ElementModel:
+            """Builds and validates the handle of an element not in the map yet."""
+            element = super(ElementModel, cls).__new__(cls)
+            BaseModel.__init__(element, **data)
+            element._runtime_id = key or ()
+            return element
+
+        element = handles.get_or_create(cls, data["raw_element"], create)
+        if element.raw_element is not data["raw_element"]:
+            # The latest raw element carries what the find prefetched, the profile of the old one does not apply to it
+            element.raw_element = data["raw_element"]
+            element._cache_profile = None
+        return element
+
+    def __init__(self, /, **data: Any) -> None:
+        """Validates the raw element, unless the handle was built (or reused) by the identity map."""
+        if self.__dict__:
+            return
+        super().__init__(**data)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compares the elements by RuntimeId, falls back to the C# comparison if either has none.
+
+        :param other: Another element
+        :return: True/False
+        """
+        if self is other:
+            return True
+        if not isinstance(other, ElementModel):
+            return NotImplemented
+        mine, theirs = self.runtime_key, other.runtime_key
+        if mine is not None and theirs is not None:
+            return mine == theirs
+        return bool(self.raw_element.Equals(other.raw_element))
+
+    def __hash__(self) -> int:
+        """Hashes the RuntimeId, elements without one share a hash.
+
+        :return: Hash
+        """
+        return hash(self.runtime_key)
+
+    @property
+    def runtime_key(self) -> Optional[Tuple[int, ...]]:
+        """The RuntimeId of the element as a tuple, read once per handle
+
+        :return: RuntimeId, None if the element has none
+        """
+        if self._runtime_id is None:
+            self._runtime_id = identity_map.runtime_id(self.raw_element) or ()
+        return self._runtime_id or None
+
+    def _cached(self, name: str, fetch: Callable[[], Any]) -> Any:
+        """Reads a property through the active property cache, directly if there is none.
+
+        :param name: Property name
+        :param fetch: Reads the property from the element
+        :return: Property value
+        """
+        profiles = cache_profile.active
+        if profiles is not None:
+            fetch = profiles.fetch(self, name, fetch)
+        cache = property_cache.active
+        if cache is None:
+            return fetch()
+        return cache.read(self._property_values_or_new(), name, fetch)
+
+    def _property_values_or_new(self) -> Dict[str, Any]:
+        """Values cached for this element, created on first use
+
+        :return: Cached values
+        """
+        if self._property_values is None:
+            self._property_values = {}
+        return self._property_values
+
+    def invalidate_properties(self, *names: str) -> None:
+        """Drops the values cached for this element.
+
+        :param names: Properties to drop, defaults to all
+        """
+        if self._property_values is None:
+            return
+        if not names:
+            self._property_values.clear()
+        for name in names:
+            self._property_values.pop(name, None)
 
     @field_validator("raw_element")
     def validate_element_exists(cls, v: Any, info: ValidationInfo) -> Any:  # pragma: no cover
@@ -92,7 +214,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Automation ID
         """
-        return self.raw_element.AutomationId
+        return self._cached("automation_id", lambda: self.raw_element.AutomationId)
 
     @property
     @handle_csharp_exceptions
@@ -101,7 +223,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Automation Type
         """
-        return AutomationType[self.raw_element.AutomationType.ToString()]
+        return self._cached("automation_type", lambda: AutomationType[self.raw_element.AutomationType.ToString()])
 
     @property
     @handle_csharp_exceptions
@@ -110,7 +232,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Bounding Rectangle
         """
-        return Rectangle(raw_value=self.raw_element.BoundingRectangle)
+        return self._cached("bounding_rectangle", lambda: Rectangle(raw_value=self.raw_element.BoundingRectangle))
 
     @property
     @handle_csharp_exceptions
@@ -137,7 +259,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Class Name
         """
-        return self.raw_element.ClassName
+        return self._cached("class_name", lambda: self.raw_element.ClassName)
 
     @property
     @handle_csharp_exceptions
@@ -155,7 +277,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Control type
         """
-        return ControlType[self.raw_element.ControlType.ToString()]
+        return self._cached("control_type", lambda: ControlType[self.raw_element.ControlType.ToString()])
 
     @property
     @handle_csharp_exceptions
@@ -179,6 +301,13 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
     def framework_type(self) -> FrameworkType:
         """The direct framework type of the element. Results in 'FrameworkType.Unknown' if it couldn't be resolved
 
+        :return: Framework Type
+        """
+        return self._cached("framework_type", self._read_framework_type)
+
+    def _read_framework_type(self) -> FrameworkType:
+        """Reads the framework type of the element
+
         :return: Framework Type
         """
         raw = self.raw_element.FrameworkType  # type: ignore
@@ -191,7 +320,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Help text
         """
-        return self.raw_element.HelpText
+        return self._cached("help_text", lambda: self.raw_element.HelpText)
 
     @property
     @handle_csharp_exceptions
@@ -209,7 +338,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Element enabled state
         """
-        return self.raw_element.IsEnabled
+        return self._cached("is_enabled", lambda: self.raw_element.IsEnabled)
 
     @property
     @handle_csharp_exceptions
@@ -218,7 +347,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Offscreen flag
         """
-        return self.raw_element.IsOffscreen
+        return self._cached("is_offscreen", lambda: self.raw_element.IsOffscreen)
 
     @property
     @handle_csharp_exceptions
@@ -227,7 +356,7 @@ class ElementBase(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: Element name
         """
-        return self.raw_element.Name
+        return self._cached("name", lambda: self.raw_element.Name)
 
     @property
     @handle_csharp_exceptions
@@ -264,6 +393,7 @@ class InvokeAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
     """An element that supports the InvokePattern"""
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def invoke(self) -> None:
         """Invokes the element."""
         self.raw_element.Invoke()
@@ -279,10 +409,11 @@ class ToggleAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: ToggleState
         """
-        return ToggleState(self.raw_element.ToggleState)
+        return self._cached("toggle_state", lambda: ToggleState(self.raw_element.ToggleState))
 
     @toggle_state.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def toggle_state(self, value: ToggleState) -> None:
         """Sets the current toggle state.
 
@@ -299,6 +430,7 @@ class ToggleAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
         return self.raw_element.IsToggled
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def toggle(self) -> None:
         """Toggles the element."""
         self.raw_element.Toggle()
@@ -326,9 +458,10 @@ class SelectionItemAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
 
         :return: True if element is selected, else False
         """
-        return self.raw_element.IsSelected
+        return self._cached("is_selected", lambda: self.raw_element.IsSelected)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select(self: T) -> T:
         """Selects the element.
 
@@ -337,6 +470,7 @@ class SelectionItemAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
         return self.__class__(raw_element=self.raw_element.Select())
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_to_selection(self: T) -> T:
         """Adds the element to the selection.
 
@@ -345,6 +479,7 @@ class SelectionItemAutomationElement(ElementModel, abc.ABC):  # pragma: no cover
         return self.__class__(raw_element=self.raw_element.AddToSelection())
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def remove_from_selection(self: T) -> T:
         """Removes the element to the selection.
 
@@ -377,7 +512,7 @@ class AutomationElement(ElementBase):
 
         :return: Item status value
         """
-        return self.raw_element.ItemStatus
+        return self._cached("item_status", lambda: self.raw_element.ItemStatus)
 
     @handle_csharp_exceptions
     def capture(self) -> Any:
@@ -397,6 +532,35 @@ class AutomationElement(ElementBase):
         self.raw_element.CaptureToFile(file_path)
 
     @handle_csharp_exceptions
+    def capture_array(
+        self, order: PixelOrder = "BGRA", out: Optional[np.ndarray] = None, cached: bool = True
+    ) -> np.ndarray:
+        """Captures the object as screenshot into a NumPy array, copying the pixels once without encoding them.
+
+        While a capture cache is active (see `capture_cache`) and no `out` array is given, repeated captures between two
+        actions return the same read-only array.
+
+        :param order: Channel order of the array, "BGRA" is the bitmap layout and needs no conversion, defaults to "BGRA"
+        :param out: Array to fill, reused if it has the size of the capture, defaults to None
+        :param cached: Serve the capture from the active capture cache, pass False to watch the screen change (eg. when
+            polling or recording), defaults to True
+        :return: (height, width, 4) uint8 array
+        """
+        cache = capture_cache.active
+        if cache is not None and out is None and cached:
+            return cache.get(self, order, lambda: bitmap_to_array(self.raw_element.Capture(), order=order))
+        return bitmap_to_array(self.raw_element.Capture(), order=order, out=out)
+
+    @handle_csharp_exceptions
+    def capture_image(self) -> Image.Image:
+        """Captures the object as screenshot into a Pillow image, without encoding it.
+
+        :return: RGBA image
+        """
+        return to_image(self.capture_array(order="RGBA"), order="RGBA")
+
+    @handle_csharp_exceptions
+    @invalidates_properties
     def click(
         self, move_mouse: bool = False, post_wait: Optional[Union[bool, float, Callable[[], None]]] = None
     ) -> None:
@@ -411,6 +575,7 @@ class AutomationElement(ElementBase):
         Mouse._apply_post_wait(post_wait)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def double_click(self, move_mouse: bool = False) -> None:
         """Performs a double left click on the element.
 
@@ -436,9 +601,10 @@ class AutomationElement(ElementBase):
         :param other_element: Another element
         :return: True/False
         """
-        return self.raw_element.Equals(another_element.raw_element)
+        return self == another_element
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all(self, tree_scope: TreeScope, condition: PropertyCondition) -> List[AutomationElement]:
         """Finds all children with the condition.
 
@@ -451,6 +617,7 @@ class AutomationElement(ElementBase):
         ]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all_by_x_path(self, x_path: str) -> List[AutomationElement]:
         """Finds all items which match the given xpath.
 
@@ -460,6 +627,7 @@ class AutomationElement(ElementBase):
         return [AutomationElement(raw_element=_) for _ in self.raw_element.FindAllByXPath(x_path)]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all_children(self, condition: Optional[PropertyCondition] = None) -> List[AutomationElement]:
         """Finds all children with the condition.
 
@@ -472,6 +640,7 @@ class AutomationElement(ElementBase):
             return [AutomationElement(raw_element=_) for _ in self.raw_element.FindAllChildren(condition.cs_condition)]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all_descendants(self, condition: Optional[PropertyCondition] = None) -> List[AutomationElement]:
         """Finds all descendants with the condition.
 
@@ -486,6 +655,7 @@ class AutomationElement(ElementBase):
             ]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all_nested(self, condition: PropertyCondition) -> List[AutomationElement]:
         """Finds all elements by iterating thru all conditions.
 
@@ -495,6 +665,7 @@ class AutomationElement(ElementBase):
         return [AutomationElement(raw_element=_) for _ in self.raw_element.FindAllNested(condition.cs_condition)]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_all_with_options(
         self,
         tree_scope: TreeScope,
@@ -518,6 +689,7 @@ class AutomationElement(ElementBase):
         ]
 
     @handle_csharp_exceptions
+    @prefetches
     def find_at(self, tree_scope: TreeScope, index: int, condition: PropertyCondition) -> AutomationElement:
         """Finds the element with the given index with the given condition.
 
@@ -529,6 +701,7 @@ class AutomationElement(ElementBase):
         return AutomationElement(raw_element=self.raw_element.FindAt(tree_scope.value, index, condition.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_child_at(self, index: int, condition: PropertyCondition) -> AutomationElement:
         """Finds the child at the given position with the condition.
 
@@ -539,6 +712,7 @@ class AutomationElement(ElementBase):
         return AutomationElement(raw_element=self.raw_element.FindChildAt(index, condition.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first(self, tree_scope: TreeScope, condition: PropertyCondition) -> AutomationElement:
         """Finds the first element in the given scope with the given condition.
 
@@ -549,6 +723,7 @@ class AutomationElement(ElementBase):
         return AutomationElement(raw_element=self.raw_element.FindFirst(tree_scope.value, condition.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first_by_x_path(self, x_path: str) -> AutomationElement:
         """Finds for the first item which matches the given xpath.
 
@@ -558,6 +733,7 @@ class AutomationElement(ElementBase):
         return AutomationElement(raw_element=self.raw_element.FindFirstByXPath(x_path))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first_child(self, condition: Optional[PropertyCondition] = None) -> AutomationElement:
         """Finds the first child.
 
@@ -570,6 +746,7 @@ class AutomationElement(ElementBase):
             return AutomationElement(raw_element=self.raw_element.FindFirstChild(condition.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first_descendant(self, condition: Optional[PropertyCondition] = None) -> AutomationElement:
         """Finds the first descendant.
 
@@ -582,6 +759,7 @@ class AutomationElement(ElementBase):
             return AutomationElement(raw_element=self.raw_element.FindFirstDescendant(condition.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first_nested(self, conditions: Union[PropertyCondition, List[PropertyCondition]]) -> AutomationElement:
         """Finds the first element by iterating thru all conditions.
 
@@ -602,6 +780,7 @@ class AutomationElement(ElementBase):
             return AutomationElement(raw_element=self.raw_element.FindFirstNested(conditions.cs_condition))
 
     @handle_csharp_exceptions
+    @prefetches
     def find_first_with_options(
         self, tree_scope: TreeScope, condition: PropertyCondition, traversal_options: TreeTraversalOptions, root: Any
     ) -> AutomationElement:
@@ -620,11 +799,13 @@ class AutomationElement(ElementBase):
         )
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def focus(self) -> None:
         """Sets the focus to a control. If the control is a window, brings it to the foreground"""
         self.raw_element.Focus()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def focus_native(self) -> None:
         """Sets the focus by using the Win32 SetFocus() method"""
         self.raw_element.FocusNative()
@@ -707,65 +888,91 @@ class AutomationElement(ElementBase):
         return self.raw_element.IsPropertySupportedDirect(property)
 
     @handle_csharp_exceptions
-    def register_active_text_position_changed_event(self, tree_scope: TreeScope, action: Any) -> Any:
+    def register_active_text_position_changed_event(
+        self, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue]
+    ) -> Any:
         """Registers a active text position changed event.
 
         :param tree_scope: Treescope object
-        :param action: Action object
-        :return: Registered event
+        :param action: Called with the sender and the text range, or an EventQueue receiving the events
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # return self.raw_element.RegisterActiveTextPositionChangedEvent(tree_scope.value, action)
-        pass
+        return self.raw_element.RegisterActiveTextPositionChangedEvent(
+            tree_scope.value, _event_action(action, "active_text_position_changed")
+        )
 
     @handle_csharp_exceptions
-    def register_automation_event(self, event: Any, tree_scope: TreeScope, action: Any) -> Any:
+    def register_automation_event(
+        self, event: Any, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue]
+    ) -> Any:
         """Registers the given automation event.
 
-        :param event: Event object
+        :param event: Event id, eg. automation.EventLibrary.Invoke.InvokedEvent
         :param tree_scope: Treescope object
-        :param action: Action object
-        :return: Registered event
+        :param action: Called with the sender and the event id, or an EventQueue receiving the events
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # return self.raw_element.RegisterAutomationEvent(event, tree_scope, action)
-        pass
+        return self.raw_element.RegisterAutomationEvent(event, tree_scope.value, _event_action(action, "automation"))
 
     @handle_csharp_exceptions
-    def register_notification_event(self) -> Any:
+    def register_notification_event(self, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue]) -> Any:
         """Registers a notification event.
 
-        :return: None
+        :param tree_scope: Treescope object
+        :param action: Called with the sender, notification kind, notification processing, display string and
+            activity id, or an EventQueue receiving the events
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # self.raw_element.RegisterNotificationEvent
-        pass
+        return self.raw_element.RegisterNotificationEvent(tree_scope.value, _event_action(action, "notification"))
 
     @handle_csharp_exceptions
-    def register_property_changed_event(self) -> Any:
-        """Registers a property changed event with the given property.
+    def register_property_changed_event(
+        self, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue], properties: List[Any]
+    ) -> Any:
+        """Registers a property changed event with the given properties.
 
-        :return: None
+        :param tree_scope: Treescope object
+        :param action: Called with the sender, the property id and the new value, or an EventQueue receiving the events
+        :param properties: Property ids to watch, eg. automation.PropertyLibrary.Element.Name
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # self.raw_element.RegisterPropertyChangedEvent
-        pass
+        return self.raw_element.RegisterPropertyChangedEvent(
+            tree_scope.value, _event_action(action, "property_changed"), *properties
+        )
 
     @handle_csharp_exceptions
-    def register_structure_changed_event(self) -> Any:
+    def register_structure_changed_event(
+        self, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue]
+    ) -> Any:
         """Registers a structure changed event.
 
-        :return: None
+        :param tree_scope: Treescope object
+        :param action: Called with the sender, the structure change type and the runtime id of the changed element, or
+            an EventQueue receiving the events
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # self.raw_element.RegisterStructureChangedEvent
-        pass
+        return self.raw_element.RegisterStructureChangedEvent(
+            tree_scope.value, _event_action(action, "structure_changed")
+        )
 
     @handle_csharp_exceptions
-    def register_text_edit_text_changed_event_handler(self) -> Any:
+    def register_text_edit_text_changed_event_handler(
+        self, text_edit_change_type: Any, tree_scope: TreeScope, action: Union[Callable[..., None], EventQueue]
+    ) -> Any:
         """Registers a text edit text changed event.
 
-        :return: None
+        :param text_edit_change_type: TextEditChangeType to watch
+        :param tree_scope: Treescope object
+        :param action: Called with the sender, the change type and the changed data, or an EventQueue receiving the
+            events
+        :return: Registered event handler, call Dispose() on it to unregister
         """
-        # self.raw_element.RegisterTextEditTextChangedEventHandler
-        pass
+        return self.raw_element.RegisterTextEditTextChangedEventHandler(
+            tree_scope.value, text_edit_change_type, _event_action(action, "text_edit_text_changed")
+        )
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def right_click(self, move_mouse: bool = False) -> None:
         """Performs a right click on the element.
 
@@ -774,6 +981,7 @@ class AutomationElement(ElementBase):
         self.raw_element.RightClick(move_mouse)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def right_double_click(self, move_mouse: bool = False) -> None:
         """Performs a double right click on the element.
 
@@ -782,11 +990,13 @@ class AutomationElement(ElementBase):
         self.raw_element.RightDoubleClick(move_mouse)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def set_focus(self) -> None:
         """Sets the focus to a control. If the control is a window, brings it to the foreground"""
         self.raw_element.SetFocus()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def set_foreground(self) -> None:
         """Brings a window to the foreground"""
         self.raw_element.SetForeground()
@@ -1125,9 +1335,10 @@ class Calendar(AutomationElement):
 
         :return: Selected dates
         """
-        return [arrow.get(_.ToString("o")).date() for _ in self.raw_element.SelectedDates]
+        return TypeCast.py_dates(self.raw_element.SelectedDates)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select_date(self, date: date) -> None:
         """Deselects other selected dates and selects the specified date.
 
@@ -1136,6 +1347,7 @@ class Calendar(AutomationElement):
         self.raw_element.SelectDate(TypeCast.cs_datetime(date))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select_range(self, dates: List[date]) -> None:
         """For WPF calendar with SelectionMode="MultipleRange" this method deselects other selected dates and selects the specified range.
         For any other type of SelectionMode it deselects other selected dates and selects only the last date in the range.
@@ -1145,9 +1357,10 @@ class Calendar(AutomationElement):
 
         :param dates: Date ranges
         """
-        self.raw_element.SelectRange([TypeCast.cs_datetime(_) for _ in dates])
+        self.raw_element.SelectRange(TypeCast.cs_datetimes(dates))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_to_selection(self, date: date) -> None:
         """For WPF calendar with SelectionMode="MultipleRange" this method adds the specified date to current selection.
         For any other type of SelectionMode it deselects other selected dates and selects the specified date.
@@ -1158,6 +1371,7 @@ class Calendar(AutomationElement):
         self.raw_element.AddToSelection(TypeCast.cs_datetime(date))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_range_to_selection(self, dates: List[date]) -> None:
         """For WPF calendar with SelectionMode="MultipleRange" this method adds the specified range to current selection.
         For any other type of SelectionMode it deselects other selected dates and selects only the last date in the range.
@@ -1165,7 +1379,7 @@ class Calendar(AutomationElement):
 
         :param dates: Date ranges
         """
-        self.raw_element.AddRangeToSelection([TypeCast.cs_datetime(_) for _ in dates])
+        self.raw_element.AddRangeToSelection(TypeCast.cs_datetimes(dates))
 
 
 class CheckBox(AutomationElement, ToggleAutomationElement):
@@ -1224,6 +1438,7 @@ class ComboBox(AutomationElement):
 
     @editable_text.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def editable_text(self, value: str) -> None:
         """Sets the text of the editable element inside the combobox.
         Only works if the combobox is editable.
@@ -1293,19 +1508,22 @@ class ComboBox(AutomationElement):
 
         :return: Expand/Collapse state
         """
-        return ExpandCollapseState(self.raw_element.ExpandCollapseState)
+        return self._cached("expand_collapse_state", lambda: ExpandCollapseState(self.raw_element.ExpandCollapseState))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def expand(self) -> None:
         """Expands the element"""
         self.raw_element.Expand()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def collapse(self) -> None:
         """Collapses the element"""
         self.raw_element.Collapse()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select(self, value: Union[int, str]) -> ComboBoxItem:
         """Select an item by index/the first item which matches the given text..
 
@@ -1328,6 +1546,57 @@ class ComboBoxItem(AutomationElement, SelectionItemAutomationElement):  # pragma
         return self.raw_element.Text
 
 
+def _read_cached_rows(
+    raw_element: Any,
+    read_rows: Callable[[], Any],
+    is_cell: Callable[[Any], bool],
+    cell_value: Callable[[Any], Any],
+    read_header: bool = True,
+) -> Tuple[List[Optional[str]], List[Tuple[Optional[int], List[Any]]]]:
+    """Reads the header texts and the realised rows of a grid with a single cached FindAll per element type.
+
+    The rows are fetched while a CacheRequest with subtree scope is active, so the cells and their Name, ClassName,
+    ControlType, Value and GridItem.Row properties are delivered in the same call and every further read is served from
+    the cache.
+
+    :param raw_element: Raw C# grid element
+    :param read_rows: Returns the raw C# rows of the grid, called while the cache request is active
+    :param is_cell: Returns True for the cached row children which are cells
+    :param cell_value: Returns the value of a cell from the cache
+    :param read_header: Whether to read the header texts, defaults to True
+    :return: Tuple[header texts, (row index or None if not exposed by the cells, cell values) per row]
+    """
+    from flaui.core.cache_request import CacheRequest
+
+    automation = raw_element.Automation
+    properties = automation.PropertyLibrary
+    cache_request = CacheRequest()
+    cache_request.tree_scope = TreeScope.Subtree
+    for property_id in (
+        properties.Element.ControlType,
+        properties.Element.ClassName,
+        properties.Element.Name,
+        properties.Value.Value,
+        properties.GridItem.Row,
+    ):
+        cache_request.add_property(property_id)
+    cache_request.add_pattern(automation.PatternLibrary.ValuePattern)
+    cache_request.add_pattern(automation.PatternLibrary.GridItemPattern)
+
+    headers: List[Optional[str]] = []
+    rows: List[Tuple[Optional[int], List[Any]]] = []
+    with cache_request.activate():
+        if read_header:
+            raw_header = raw_element.Header
+            headers = [_.Text for _ in raw_header.Columns] if raw_header is not None else []
+        for row in read_rows():
+            cells = [_ for _ in row.CachedChildren if is_cell(_)]
+            grid_item = cells[0].Patterns.GridItem.PatternOrDefault if cells else None
+            row_index = grid_item.Row.ValueOrDefault if grid_item is not None else None
+            rows.append((row_index, [cell_value(_) for _ in cells]))
+    return headers, rows
+
+
 class DataGridView(AutomationElement):
     """Class to interact with a WinForms DataGridView"""
 
@@ -1368,6 +1637,31 @@ class DataGridView(AutomationElement):
         """
         return [DataGridViewRow(raw_element=_) for _ in self.raw_element.Rows]  # type: ignore
 
+    @handle_csharp_exceptions
+    def to_columns(self, output: TableFormat = "dict") -> Any:
+        """Reads the whole grid column by column in a single cached pass instead of one call per cell.
+        Rows and cells are selected the same way as `rows` and `DataGridViewRow.cells`, column names are taken from `header`.
+
+        :param output: dict (dict of lists), numpy (dict of arrays), pandas (DataFrame) or arrow (pyarrow Table)
+        :return: Cell values keyed by column name in the requested format
+        """
+
+        def is_cell(cell: Any) -> bool:
+            """Matches the cells selected by DataGridViewRow.Cells."""
+            return (
+                cell.Properties.ControlType.ValueOrDefault
+                not in (ControlType.Header.value, ControlType.HeaderItem.value)
+                and cell.Properties.ClassName.ValueOrDefault != "DataGridDetailsPresenter"
+            )
+
+        def cell_value(cell: Any) -> Optional[str]:
+            """Reads DataGridViewCell.Value, the value of the value pattern."""
+            pattern = cell.Patterns.Value.PatternOrDefault
+            return pattern.Value.ValueOrDefault if pattern is not None else None
+
+        headers, rows = _read_cached_rows(self.raw_element, lambda: self.raw_element.Rows, is_cell, cell_value)
+        return to_columns(headers, [values for _, values in rows], output)
+
 
 class DataGridViewHeader(AutomationElement):
     """Creates a DataGridViewHeader element"""
@@ -1422,6 +1716,7 @@ class DataGridViewCell(AutomationElement):
 
     @value.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def value(self, value: str) -> None:
         """Sets the Value in the cell.
 
@@ -1442,11 +1737,11 @@ class DateTimePicker(AutomationElement):
 
         :return: date object if exists, else None
         """
-        _raw_date = self.raw_element.SelectedDate
-        return arrow.get(_raw_date.Year, _raw_date.Month, _raw_date.Day).date() if _raw_date else None
+        return TypeCast.py_date(self.raw_element.SelectedDate)
 
     @selected_date.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def selected_date(self, date: date) -> None:
         """Sets the selected date in the DateTimePicker.
         For Win32, setting SelectedDate to null will uncheck the DateTimePicker control and disable it.
@@ -1542,6 +1837,103 @@ class Grid(AutomationElement):
         """
         return GridRow(raw_element=self.raw_element.SelectedItem)
 
+    @handle_csharp_exceptions
+    def to_columns(self, output: TableFormat = "dict") -> Any:
+        """Reads the grid column by column in a single cached pass instead of one call per cell.
+        Rows and cells are selected the same way as `rows` and `GridRow.cells`, column names are taken from `header`.
+        Like `rows`, only the rows which are currently visible to UIA are read in virtualized grids.
+
+        :param output: dict (dict of lists), numpy (dict of arrays), pandas (DataFrame) or arrow (pyarrow Table)
+        :return: Cell values keyed by column name in the requested format
+        """
+        headers, rows = self._read_visible_rows(read_header=True)
+        return to_columns(headers, [values for _, values in rows], output)
+
+    @handle_csharp_exceptions
+    def _read_visible_rows(
+        self, read_header: bool = False
+    ) -> Tuple[List[Optional[str]], List[Tuple[Optional[int], List[Any]]]]:
+        """Reads the rows which are currently realised in one cached batch, cells are selected like `GridRow.cells`.
+
+        :param read_header: Whether to read the header texts, defaults to False
+        :return: Tuple[header texts, (row index, cell values) per row]
+        """
+        return _read_cached_rows(
+            self.raw_element,
+            lambda: self.raw_element.Rows,
+            lambda cell: cell.Properties.ControlType.ValueOrDefault != ControlType.HeaderItem.value,
+            lambda cell: cell.Properties.Name.ValueOrDefault,
+            read_header=read_header,
+        )
+
+    @handle_csharp_exceptions
+    def _scroll_page(self, to_top: bool = False) -> bool:
+        """Scrolls the grid vertically by one page using the scroll pattern.
+
+        :param to_top: Scroll to the top instead of one page down, defaults to False
+        :return: True if the grid was scrolled, False if it is not scrollable or already at the end
+        """
+        pattern = self.raw_element.Patterns.Scroll.PatternOrDefault
+        if pattern is None or not pattern.VerticallyScrollable.ValueOrDefault:
+            return False
+        if to_top:
+            # -1 leaves the horizontal position unchanged (UIA_ScrollPatternNoScroll)
+            pattern.SetScrollPercent(-1, 0)
+            return True
+        if pattern.VerticalScrollPercent.ValueOrDefault >= 100:
+            return False
+        pattern.Scroll(ScrollAmount.NoAmount.value, ScrollAmount.LargeIncrement.value)
+        return True
+
+    @handle_csharp_exceptions
+    def _vertical_scroll_percent(self) -> Optional[float]:
+        """Gets the vertical scroll position using the scroll pattern.
+
+        :return: Vertical scroll position in percent, None if the grid has no scroll pattern
+        """
+        pattern = self.raw_element.Patterns.Scroll.PatternOrDefault
+        return pattern.VerticalScrollPercent.ValueOrDefault if pattern is not None else None
+
+    def iter_rows(self, from_top: bool = True, max_stalled_pages: int = 2) -> Iterator[Tuple[int, List[Any]]]:
+        """Streams all rows of the grid, including the ones not realised yet in virtualized grids.
+        The grid is scrolled page by page and the realised rows of every page are read in one cached batch (see `to_columns`).
+        Rows whose cells expose their row index are yielded once, in order, deduplicated by that index so only one page is
+        held in memory at a time.
+        Rows whose cells do not expose their row index cannot be told apart from identical rows: they are numbered in
+        reading order and yielded for every scroll position, so such rows realised on two pages are yielded twice.
+
+        :param from_top: Scroll to the top of the grid before reading, defaults to True
+        :param max_stalled_pages: Stop after this many consecutive pages without new rows, defaults to 2
+        :return: Iterator of (row index, cell values) tuples
+        """
+        if from_top:
+            self._scroll_page(to_top=True)
+        row_count = self.row_count
+        last_index = -1  # Last row index read from the cells
+        position = -1  # Index of the last yielded row
+        previous_percent: Any = object()
+        stalled_pages = 0
+        while True:
+            scroll_percent = self._vertical_scroll_percent()
+            _, rows = self._read_visible_rows()
+            new_rows = 0
+            for row_index, values in rows:
+                if row_index is None:
+                    if scroll_percent == previous_percent:
+                        # The grid did not scroll since the previous page, the same rows were read again
+                        continue
+                elif row_index <= last_index:
+                    continue
+                else:
+                    last_index = row_index
+                position = row_index if row_index is not None else position + 1
+                new_rows += 1
+                yield position, values
+            previous_percent = scroll_percent
+            stalled_pages = 0 if new_rows else stalled_pages + 1
+            if last_index >= row_count - 1 or stalled_pages >= max_stalled_pages or not self._scroll_page():
+                return
+
     @handle_csharp_exceptions
     def _retry_while_null_reference_exception(self, func: Callable, message: str) -> Any:
         """Retries the function call if a NullReferenceException is thrown.
@@ -1591,6 +1983,7 @@ class Grid(AutomationElement):
     """
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select(
         self, row_index: Optional[int] = None, column_index: Optional[int] = None, text_to_find: Optional[str] = None
     ) -> GridRow:
@@ -1646,6 +2039,7 @@ class Grid(AutomationElement):
     """
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_to_selection(
         self, row_index: Optional[int] = None, column_index: Optional[int] = None, text_to_find: Optional[str] = None
     ) -> GridRow:
@@ -1685,6 +2079,7 @@ class Grid(AutomationElement):
         self, row_index: None = None, column_index: int = ..., text_to_find: str = ...
     ) -> "GridRow": ...
     @handle_csharp_exceptions
+    @invalidates_properties
     def remove_from_selection(
         self, row_index: Optional[int] = None, column_index: Optional[int] = None, text_to_find: Optional[str] = None
     ) -> GridRow:
@@ -1798,6 +2193,7 @@ class GridRow(SelectionItemAutomationElement):
         return GridCell(raw_element=self.raw_element.FindCellByText(text_to_find))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def scroll_into_view(self) -> GridRow:
         """Scrolls the row into view.
 
@@ -1900,6 +2296,7 @@ class ListBox(AutomationElement):
         return ListBoxItem(raw_element=self.raw_element.SelectedItem)
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select(self, value: Union[str, int]) -> ListBoxItem:
         """Selects an item by index or text.
 
@@ -1909,6 +2306,7 @@ class ListBox(AutomationElement):
         return ListBoxItem(raw_element=self.raw_element.Select(value))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_to_selection(self, value: Union[str, int]) -> ListBoxItem:
         """Add a row to the selection by index/by text.
 
@@ -1918,6 +2316,7 @@ class ListBox(AutomationElement):
         return ListBoxItem(raw_element=self.raw_element.AddToSelection(value))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def remove_from_selection(self, value: Union[str, int]) -> ListBoxItem:
         """Remove a row to the selection by index/by text.
 
@@ -1940,6 +2339,7 @@ class ListBoxItem(SelectionItemAutomationElement):
         return self.raw_element.Text
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def scroll_into_view(self) -> ListBoxItem:
         """Scrolls the element into view.
 
@@ -1958,6 +2358,7 @@ class ListBoxItem(SelectionItemAutomationElement):
 
     @is_checked.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def is_checked(self, value: bool) -> None:
         """Sets if the listbox item is checked, if checking is supported
 
@@ -2047,6 +2448,7 @@ class MenuItem(AutomationElement):
         return [MenuItem(raw_element=_) for _ in self.raw_element.Items]
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def invoke(self) -> MenuItem:
         """Invokes the element.
 
@@ -2055,6 +2457,7 @@ class MenuItem(AutomationElement):
         return MenuItem(raw_element=self.raw_element.Invoke())
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def expand(self) -> MenuItem:
         """Expands the element.
 
@@ -2063,6 +2466,7 @@ class MenuItem(AutomationElement):
         return MenuItem(raw_element=self.raw_element.Expand())
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def collapse(self) -> MenuItem:
         """Collapses the element.
 
@@ -2083,6 +2487,7 @@ class MenuItem(AutomationElement):
 
     @is_checked.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def is_checked(self, value: bool) -> None:
         """Sets if a menu item is checked or unchecked, if checking is supported.
         /// For some applications, like WPF, setting this property doesn't execute the action that happens when a user clicks the menu item, only the checked state is changed.
@@ -2094,6 +2499,7 @@ class MenuItem(AutomationElement):
         self.raw_element.IsChecked = value
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def set_is_checked(self, value: bool) -> None:
         """Sets if a menu item is checked or unchecked, if checking is supported.
         /// For some applications, like WPF, setting this property doesn't execute the action that happens when a user clicks the menu item, only the checked state is changed.
@@ -2159,6 +2565,7 @@ class RadioButton(AutomationElement):
 
     @is_checked.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def is_checked(self, value: bool) -> None:
         """Flag to set the selection of this element.
 
@@ -2252,6 +2659,7 @@ class Slider(AutomationElement):
 
     @value.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def value(self, value: float) -> None:
         """Sets the value of the slider
 
@@ -2260,21 +2668,25 @@ class Slider(AutomationElement):
         self.raw_element.Value = value
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def small_increment(self):
         """Performs a small increment."""
         self.raw_element.SmallIncrement()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def small_decrement(self):
         """Performs a small decrement."""
         self.raw_element.SmallDecrement()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def large_increment(self):
         """Performs a large increment."""
         self.raw_element.LargeIncrement()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def large_decrement(self):
         """Performs a large decrement."""
         self.raw_element.LargeDecrement()
@@ -2347,6 +2759,7 @@ class Spinner(AutomationElement):
 
     @value.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def value(self, value: float) -> None:
         """Sets the value of the spinner
 
@@ -2355,11 +2768,13 @@ class Spinner(AutomationElement):
         self.raw_element.Value = value
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def increment(self):
         """Performs a increment."""
         self.raw_element.Increment()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def decrement(self):
         """Performs a decrement."""
         self.raw_element.Decrement()
@@ -2419,6 +2834,7 @@ class Tab(AutomationElement):
     """
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select_tab_item(
         self,
         index: Optional[int] = None,
@@ -2462,6 +2878,7 @@ class TextBox(AutomationElement):
 
     @text.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def text(self, value: str) -> None:
         """Sets the text of the element
 
@@ -2479,6 +2896,7 @@ class TextBox(AutomationElement):
         return self.raw_element.IsReadOnly
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def enter(self, value: str, post_wait: Optional[Union[bool, float, Callable[[], None]]] = None):
         """Simulate typing in text. This is slower than setting Text but raises more events.
 
@@ -2551,6 +2969,7 @@ class ToggleButton(AutomationElement):
     """Class to interact with a toggle button element."""
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def toggle(self):
         """Toggles the toggle button.
         **Note**: In some WPF scenarios, the bounded command might not be fired. Use AutomationElement.Click instead in that case.
@@ -2608,7 +3027,7 @@ class TreeItem(AutomationElement):
 
         :return: True if selected else False
         """
-        return self.raw_element.IsSelected
+        return self._cached("is_selected", lambda: self.raw_element.IsSelected)
 
     @property
     @handle_csharp_exceptions
@@ -2617,24 +3036,28 @@ class TreeItem(AutomationElement):
 
         :return: Current state enum object
         """
-        return ExpandCollapseState(self.raw_element.ExpandCollapseState)
+        return self._cached("expand_collapse_state", lambda: ExpandCollapseState(self.raw_element.ExpandCollapseState))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def expand(self):
         """Expands the element."""
         self.raw_element.Expand()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def collapse(self):
         """Collapses the element."""
         self.raw_element.Collapse()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def select(self):
         """Selects the element."""
         self.raw_element.Select()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def add_to_selection(self) -> TreeItem:
         """Add the element to the selection.
 
@@ -2643,6 +3066,7 @@ class TreeItem(AutomationElement):
         return TreeItem(raw_element=self.raw_element.AddToSelection())
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def remove_from_selection(self) -> TreeItem:
         """Remove the element to the selection.
 
@@ -2661,6 +3085,7 @@ class TreeItem(AutomationElement):
 
     @is_checked.setter
     @handle_csharp_exceptions
+    @invalidates_properties
     def is_checked(self, value: bool) -> None:
         """Sets the tree item as checked, if checking is supported
 
@@ -2756,11 +3181,13 @@ class Window(AutomationElement):
         return Menu(raw_element=self.raw_element.GetContextMenuByFrameworkType(framework_type))
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def close(self):
         """Closes the window."""
         self.raw_element.Close()
 
     @handle_csharp_exceptions
+    @invalidates_properties
     def move(self, x: int, y: int):
         """Moves the window to the given coordinates.
 
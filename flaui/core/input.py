@@ -1,38 +1,64 @@
 """This module acts as a wrapper for classes listed in FlaUI.Core.Input namespace. It provides methods to interact with the keyboard and mouse."""
 
+import ctypes
 from enum import Enum
-import time
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 from FlaUI.Core.Input import (  # pyright: ignore
-    Interpolation as CSInterpolation,
     Keyboard as CSKeyboard,
     Mouse as CSMouse,
     MouseButton as CSMouseButton,
     Touch as CSTouch,
     Wait as CSWait,
 )
+from System import IntPtr  # pyright: ignore
 
 from flaui.core.automation_elements import AutomationElement
 from flaui.core.windows_api import VirtualKeyShort
+from flaui.lib.capture_cache import invalidates_captures
 from flaui.lib.collections import TypeCast
+from flaui.lib.post_wait import PostWaitMode, PostWaitRecord, wait_after_input
 from flaui.lib.system.drawing import Point
+from flaui.lib.trajectory import Easing, ReplayReport, Trajectory, plan_linear, plan_rotation, replay
 
 
 class Wait:
     """Various helper tools used in various places, wrapper over Wait class in FlaUI.Core.Input namespace"""
 
     DEFAULT_TIMEOUT = 1  # in seconds
+    # "fixed" sleeps for the whole post-wait, "idle" returns as soon as the foreground application is idle
+    POST_WAIT_MODE: PostWaitMode = "fixed"
 
     @staticmethod
-    def until_input_is_processed(wait_timeout_in_secs: Optional[float] = None):
+    def _foreground_is_idle(remaining: float) -> bool:
+        """Idle probe: waits until the foreground window has processed all pending messages (including the input).
+
+        :param remaining: Remaining wait budget in seconds
+        :return: True if the foreground window is idle, False if it did not respond in time
+        """
+        hwnd = ctypes.windll.user32.GetForegroundWindow() if hasattr(ctypes, "windll") else 0
+        if not hwnd:
+            return True
+        return CSWait.UntilResponsive(IntPtr(hwnd), TypeCast.cs_timespan(remaining * 1000))
+
+    @staticmethod
+    def until_input_is_processed(
+        wait_timeout_in_secs: Optional[float] = None, until: Optional[Callable[[], bool]] = None
+    ) -> PostWaitRecord:
         """
         Waits a little to allow inputs (mouse, keyboard, ...) to be processed.
 
+        In "fixed" mode (see POST_WAIT_MODE) the whole timeout is slept, in "idle" mode the wait returns as soon as the
+        foreground application is idle. With `until`, the wait returns as soon as the condition is met in either mode.
+        Every wait is recorded in `flaui.lib.post_wait.telemetry`.
+
         :param wait_timeout_in_secs: An optional timeout. If no value or None is passed, the timeout is 100ms.
+        :param until: Optional expected state, eg. `lambda: button.is_enabled`
+        :return: Timing of the wait
         """
         wait_time = wait_timeout_in_secs if wait_timeout_in_secs is not None else 0.1  # default to 100ms
-        time.sleep(wait_time)
+        probe = Wait._foreground_is_idle if Wait.POST_WAIT_MODE == "idle" else None
+        return wait_after_input(wait_time, probe=probe, condition=until)
 
     @staticmethod
     def until_responsive(automation_element: AutomationElement, timeout_in_secs: Optional[float] = None):
@@ -43,9 +69,8 @@ class Wait:
         :param timeout_in_secs: The timeout of the waiting.
         :return: True if the element was responsive, false otherwise.
         """
-        return CSWait.UntilResponsive(
-            automation_element, timeout_in_secs if timeout_in_secs is not None else Wait.DEFAULT_TIMEOUT
-        )
+        timeout = timeout_in_secs if timeout_in_secs is not None else Wait.DEFAULT_TIMEOUT
+        return CSWait.UntilResponsive(automation_element.raw_element, TypeCast.cs_timespan(timeout * 1000))
 
     @staticmethod
     def until_responsive_hwnd(hWnd: Any, timeout: Optional[float] = None):
@@ -56,13 +81,15 @@ class Wait:
         :param timeout: The timeout of the waiting.
         :return: True if the hwnd was responsive, false otherwise.
         """
-        return CSWait.UntilResponsiveHwnd(hWnd, timeout if timeout is not None else Wait.DEFAULT_TIMEOUT)
+        timeout = timeout if timeout is not None else Wait.DEFAULT_TIMEOUT
+        return CSWait.UntilResponsive(hWnd, TypeCast.cs_timespan(timeout * 1000))
 
 
 class Keyboard:
     """Simulates Key input, wrapper over Keyboard class in FlaUI.Core.Input namespace"""
 
     @staticmethod
+    @invalidates_captures
     def type(text: Union[str, List[VirtualKeyShort]]) -> None:
         """Types the given character.
 
@@ -71,6 +98,7 @@ class Keyboard:
         CSKeyboard.Type(text if isinstance(text, str) else [_.value for _ in text])
 
     @staticmethod
+    @invalidates_captures
     def type_key(virtual_key: VirtualKeyShort) -> None:
         """Types a single virtual key (press and release).
 
@@ -79,6 +107,7 @@ class Keyboard:
         CSKeyboard.Type(virtual_key.value)
 
     @staticmethod
+    @invalidates_captures
     def type_simultaneously(text: List[VirtualKeyShort]) -> None:
         """Types the given keys simultaneously (starting with the first).
 
@@ -87,6 +116,7 @@ class Keyboard:
         CSKeyboard.TypeSimultaneously([_.value for _ in text])
 
     @staticmethod
+    @invalidates_captures
     def type_scan_code(scan_code: int, is_extended_key: bool) -> None:
         """Types the given scan-code.
 
@@ -96,6 +126,7 @@ class Keyboard:
         CSKeyboard.TypeScanCode(scan_code, is_extended_key)
 
     @staticmethod
+    @invalidates_captures
     def type_virtual_key_code(virtual_keycode: int) -> None:
         """Types the given virtual key-code.
 
@@ -104,6 +135,7 @@ class Keyboard:
         CSKeyboard.TypeVirtualKeyCode(virtual_keycode)
 
     @staticmethod
+    @invalidates_captures
     def press(virtual_key: VirtualKeyShort) -> None:
         """Presses the given key.
 
@@ -112,6 +144,7 @@ class Keyboard:
         CSKeyboard.Press(virtual_key.value)
 
     @staticmethod
+    @invalidates_captures
     def press_scan_code(scan_code: int, is_extended_key: bool) -> None:
         """Presses the given scan-code.
 
@@ -121,6 +154,7 @@ class Keyboard:
         CSKeyboard.PressScanCode(scan_code, is_extended_key)
 
     @staticmethod
+    @invalidates_captures
     def press_virtual_key_code(virtual_keycode: int) -> None:
         """Presses the given virtual key-code.
 
@@ -129,6 +163,7 @@ class Keyboard:
         CSKeyboard.PressVirtualKeyCode(virtual_keycode)
 
     @staticmethod
+    @invalidates_captures
     def release(virtual_key: VirtualKeyShort) -> None:
         """Releases the given key
 
@@ -137,6 +172,7 @@ class Keyboard:
         CSKeyboard.Release(virtual_key.value)
 
     @staticmethod
+    @invalidates_captures
     def release_scan_code(scan_code: int, is_extended_key: bool) -> None:
         """Releases the given scan-code.
 
@@ -146,6 +182,7 @@ class Keyboard:
         CSKeyboard.ReleaseScanCode(scan_code, is_extended_key)
 
     @staticmethod
+    @invalidates_captures
     def release_virtual_key_code(virtual_keycode: int) -> None:
         """Releases the given virtual key-code.
 
@@ -154,6 +191,7 @@ class Keyboard:
         CSKeyboard.ReleaseVirtualKeyCode(virtual_keycode)
 
     @staticmethod
+    @invalidates_captures
     def pressing(virtual_keys: List[VirtualKeyShort]) -> None:
         """Presses the given keys and releases them when the returned object is disposed.
 
@@ -208,13 +246,11 @@ class Mouse:
         if callable(post_wait):
             post_wait()
             return
-        if isinstance(post_wait, (int, float)):
-            Wait.until_input_is_processed(float(post_wait))
-            return
-        # post_wait is True
-        Wait.until_input_is_processed()
+        # True is an int too, it selects the default wait instead of a one second one
+        Wait.until_input_is_processed(None if post_wait is True else float(post_wait))
 
     @staticmethod
+    @invalidates_captures
     def move_by(
         delta_x: int,
         delta_y: int,
@@ -230,6 +266,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def move_to(
         new_x: Optional[int] = None,
         new_y: Optional[int] = None,
@@ -252,6 +289,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def click(
         point: Optional[Point] = None,
         mouse_button: MouseButton = MouseButton.Left,
@@ -267,6 +305,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def double_click(
         point: Optional[Point] = None,
         mouse_button: MouseButton = MouseButton.Left,
@@ -284,6 +323,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def down(
         mouse_button: MouseButton = MouseButton.Left,
         post_wait: Optional[Union[bool, float, Callable[[], None]]] = None,
@@ -297,6 +337,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def up(
         mouse_button: MouseButton = MouseButton.Left,
         post_wait: Optional[Union[bool, float, Callable[[], None]]] = None,
@@ -310,6 +351,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def scroll(lines: int, post_wait: Optional[Union[bool, float, Callable[[], None]]] = None) -> None:
         """Simulates scrolling of the mouse wheel up or down.
 
@@ -320,6 +362,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def horizontal_scroll(lines: int, post_wait: Optional[Union[bool, float, Callable[[], None]]] = None) -> None:
         """Simulates horizontal scrolling of the mouse wheel left or right.
 
@@ -330,6 +373,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def drag_horizontally(
         starting_point: Point,
         distance: int,
@@ -347,6 +391,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def drag_vertically(
         starting_point: Point,
         distance: int,
@@ -364,6 +409,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def drag(
         starting_point: Point,
         ending_point: Optional[Point] = None,
@@ -390,6 +436,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def left_click(point: Optional[Point], post_wait: Optional[Union[bool, float, Callable[[], None]]] = None) -> None:
         """Performs a left click.
 
@@ -400,6 +447,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def left_double_click(
         point: Optional[Point], post_wait: Optional[Union[bool, float, Callable[[], None]]] = None
     ) -> None:
@@ -412,6 +460,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def right_click(point: Optional[Point], post_wait: Optional[Union[bool, float, Callable[[], None]]] = None) -> None:
         """Performs a right click.
 
@@ -422,6 +471,7 @@ class Mouse:
         Mouse._apply_post_wait(post_wait)
 
     @staticmethod
+    @invalidates_captures
     def right_double_click(
         point: Optional[Point], post_wait: Optional[Union[bool, float, Callable[[], None]]] = None
     ) -> None:
@@ -433,9 +483,53 @@ class Mouse:
         CSMouse.RightDoubleClick() if point is None else CSMouse.RightDoubleClick(point.raw_value)
         Mouse._apply_post_wait(post_wait)
 
+    @staticmethod
+    @invalidates_captures
+    def move_along(
+        trajectory: Trajectory, post_wait: Optional[Union[bool, float, Callable[[], None]]] = None
+    ) -> ReplayReport:
+        """Moves the mouse along a planned trajectory (see `flaui.lib.trajectory`) at its planned cadence.
+
+        :param trajectory: Planned trajectory, only the first point of every step is used
+        :param post_wait: Optional wait after operation. True=100ms, float=custom seconds, callable=custom function
+        :return: Timing report of the move
+        """
+        report = replay(trajectory, lambda points: CSMouse.MoveTo(int(points[0, 0]), int(points[0, 1])))
+        Mouse._apply_post_wait(post_wait)
+        return report
+
+    @staticmethod
+    @invalidates_captures
+    def drag_along(
+        trajectory: Trajectory,
+        mouse_button: MouseButton = MouseButton.Left,
+        post_wait: Optional[Union[bool, float, Callable[[], None]]] = None,
+    ) -> ReplayReport:
+        """Drags the mouse along a planned trajectory, pressing the button at the first step and releasing it after the last.
+
+        :param trajectory: Planned trajectory, only the first point of every step is used
+        :param mouse_button: The mouse button to use for dragging, defaults to MouseButton.Left
+        :param post_wait: Optional wait after operation. True=100ms, float=custom seconds, callable=custom function
+        :return: Timing report of the drag
+        """
+        if len(trajectory):
+            start = trajectory.points[0, 0]
+            CSMouse.MoveTo(int(start[0]), int(start[1]))
+        CSMouse.Down(mouse_button.value)
+        try:
+            report = replay(trajectory, lambda points: CSMouse.MoveTo(int(points[0, 0]), int(points[0, 1])))
+        finally:
+            CSMouse.Up(mouse_button.value)
+        Mouse._apply_post_wait(post_wait)
+        return report
+
 
 class Interpolation:
-    """Interpolation tool to transition points during a time frame, wrapper over Interpolation class in FlaUI.Core.Input namespace"""
+    """Interpolation tool to transition points during a time frame, mirrors the Interpolation class in FlaUI.Core.Input namespace.
+
+    The whole trajectory is planned up front with NumPy (see `flaui.lib.trajectory`) and replayed from Python at the
+    requested interval, instead of FlaUI calling back from C# into Python on every tick.
+    """
 
     @staticmethod
     def execute(
@@ -444,7 +538,8 @@ class Interpolation:
         duration_ms: int,
         interval_ms: int = 10,
         skip_initial_position: bool = False,
-    ) -> None:
+        easing: Easing = Easing.Linear,
+    ) -> ReplayReport:
         """Transitions the given points from start to end in the given duration.
 
         :param action: The action (callable) to execute for each interval with Point[] argument
@@ -452,34 +547,17 @@ class Interpolation:
         :param duration_ms: The total duration for the transition in milliseconds
         :param interval_ms: The interval of each step in milliseconds, defaults to 10
         :param skip_initial_position: Skip firing action for initial position, defaults to False
-        """
-        from System import (  # pyright: ignore
-            Action as CSAction,  # pyright: ignore
-            Array,
-            Tuple as CSTuple,
-        )
-        from System.Drawing import Point as CSPoint  # pyright: ignore
-
-        # Convert Python action to C# Action<Point[]>
-        def cs_action_wrapper(points):
-            """Wrapper to convert C# Point[] to Python Point list and call the Python action."""
-            # Convert C# Point[] to Python Point list
-            py_points = [Point(raw_value=p) for p in points]
-            action(py_points)
-
-        cs_action = CSAction[Array[CSPoint]](cs_action_wrapper)
-
-        # Convert start/end points to C# Tuple<Point, Point>[]
-        cs_tuples = [CSTuple.Create(p[0].raw_value, p[1].raw_value) for p in start_end_points]
-        cs_array = Array[CSTuple[CSPoint, CSPoint]](cs_tuples)
-
-        CSInterpolation.Execute(
-            cs_action,
-            cs_array,
-            TypeCast.cs_timespan(duration_ms),
-            TypeCast.cs_timespan(interval_ms),
+        :param easing: Easing curve of the transition, defaults to Easing.Linear
+        :return: Timing report of the transition
+        """
+        trajectory = plan_linear(
+            [((start.x, start.y), (end.x, end.y)) for start, end in start_end_points],
+            duration_ms,
+            interval_ms,
+            easing,
             skip_initial_position,
         )
+        return replay(trajectory, lambda points: action([Point(raw_value=tuple(_)) for _ in points.tolist()]))
 
     @staticmethod
     def execute_single(
@@ -489,7 +567,8 @@ class Interpolation:
         duration_ms: int,
         interval_ms: int = 10,
         skip_initial_position: bool = False,
-    ) -> None:
+        easing: Easing = Easing.Linear,
+    ) -> ReplayReport:
         """Transitions a single point from start to end in the given duration.
 
         :param action: The action (callable) to execute for each interval with Point argument
@@ -498,25 +577,17 @@ class Interpolation:
         :param duration_ms: The total duration for the transition in milliseconds
         :param interval_ms: The interval of each step in milliseconds, defaults to 10
         :param skip_initial_position: Skip firing action for initial position, defaults to False
-        """
-        from System import Action as CSAction  # pyright: ignore
-        from System.Drawing import Point as CSPoint  # pyright: ignore
-
-        # Convert Python action to C# Action<Point>
-        def cs_action_wrapper(point):
-            """Wrapper to convert C# Point to Python Point and call the Python action."""
-            action(Point(raw_value=point))
-
-        cs_action = CSAction[CSPoint](cs_action_wrapper)
-
-        CSInterpolation.Execute(
-            cs_action,
-            start_point.raw_value,
-            end_point.raw_value,
-            TypeCast.cs_timespan(duration_ms),
-            TypeCast.cs_timespan(interval_ms),
+        :param easing: Easing curve of the transition, defaults to Easing.Linear
+        :return: Timing report of the transition
+        """
+        trajectory = plan_linear(
+            [((start_point.x, start_point.y), (end_point.x, end_point.y))],
+            duration_ms,
+            interval_ms,
+            easing,
             skip_initial_position,
         )
+        return replay(trajectory, lambda points: action(Point(raw_value=tuple(points[0].tolist()))))
 
     @staticmethod
     def execute_rotation(
@@ -528,7 +599,8 @@ class Interpolation:
         duration_ms: int,
         interval_ms: int = 10,
         skip_initial_position: bool = False,
-    ) -> None:
+        easing: Easing = Easing.Linear,
+    ) -> ReplayReport:
         """Performs a rotation transition around the given point.
 
         :param action: The action (callable) to execute for each interval with Point argument
@@ -539,33 +611,27 @@ class Interpolation:
         :param duration_ms: The total duration for the transition in milliseconds
         :param interval_ms: The interval of each step in milliseconds, defaults to 10
         :param skip_initial_position: Skip firing action for initial position, defaults to False
+        :param easing: Easing curve of the transition, defaults to Easing.Linear
+        :return: Timing report of the transition
         """
-        from System import Action as CSAction  # pyright: ignore
-        from System.Drawing import Point as CSPoint  # pyright: ignore
-
-        # Convert Python action to C# Action<Point>
-        def cs_action_wrapper(point):
-            """Wrapper to convert C# Point to Python Point and call the Python action."""
-            action(Point(raw_value=point))
-
-        cs_action = CSAction[CSPoint](cs_action_wrapper)
-
-        CSInterpolation.ExecuteRotation(
-            cs_action,
-            center_point.raw_value,
+        trajectory = plan_rotation(
+            (center_point.x, center_point.y),
             radius,
             start_angle,
             end_angle,
-            TypeCast.cs_timespan(duration_ms),
-            TypeCast.cs_timespan(interval_ms),
+            duration_ms,
+            interval_ms,
+            easing,
             skip_initial_position,
         )
+        return replay(trajectory, lambda points: action(Point(raw_value=tuple(points[0].tolist()))))
 
 
 class Touch:
     """Touch class to simulate touch input, wrapper over Touch class in FlaUI.Core.Input namespace"""
 
     @staticmethod
+    @invalidates_captures
     def tap(points: Optional[List[Point]] = None) -> None:
         """Performs a tap on the given point or points.
 
@@ -574,6 +640,7 @@ class Touch:
         CSTouch.Tap() if points is None else CSTouch.Tap([_.raw_value for _ in points])
 
     @staticmethod
+    @invalidates_captures
     def hold(duration: int, points: Optional[List[Point]] = None) -> None:
         """Performs a hold on the given point or points.
 
@@ -583,6 +650,7 @@ class Touch:
         CSTouch.Hold(TypeCast.cs_timespan(duration), [_.raw_value for _ in points] if points else None)
 
     @staticmethod
+    @invalidates_captures
     def pinch(center: Point, start_radius: int, end_radius: int, duration: int, angle: int = 45) -> None:
         """Performs a pinch with two fingers.
 
@@ -595,6 +663,7 @@ class Touch:
         CSTouch.Pinch(center.raw_value, start_radius, end_radius, TypeCast.cs_timespan(duration), angle)
 
     @staticmethod
+    @invalidates_captures
     def transition(duration: int, start_end_points: Tuple[Point, Point]) -> None:
         """Transitions all the points from the start point to the end points.
 
@@ -604,6 +673,7 @@ class Touch:
         CSTouch.Transition(TypeCast.cs_timespan(duration), [_.raw_value for _ in start_end_points])
 
     @staticmethod
+    @invalidates_captures
     def drag(duration: int, start_point: Point, end_point: Point) -> None:
         """Performs a touch-drag from the start point to the end point.
 
@@ -614,6 +684,7 @@ class Touch:
         CSTouch.Drag(TypeCast.cs_timespan(duration), start_point.raw_value, end_point.raw_value)
 
     @staticmethod
+    @invalidates_captures
     def rotate(center: Point, radius: int, start_angle: int, end_angle: int, duration: int) -> None:
         """Performs a 2-finger rotation around the given point where the first finger is at the center and the second is rotated around.
 
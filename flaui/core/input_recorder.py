@@ -0,0 +1,370 @@
+"""This module records input workflows to a JSONL stream and replays them deterministically, faster than recorded.
+
+`InputRecorder` wraps the `Mouse`, `Keyboard` and `Touch` calls of `flaui.core.input` and the element actions (click,
+invoke, select, ...) while active, and logs every outermost call with its arguments and a timestamp. `replay_recording`
+runs a recording back with a speed-up factor: idle gaps are capped, and fixed `post_wait` sleeps are replaced by a
+readiness wait on the application under test.
+
+Like `flaui.core.input_sequence`, FlaUI is only imported when input is recorded or replayed, the recording format
+and the replay schedule are plain Python.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+import functools
+import inspect
+import json
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flaui.core.automation_elements import AutomationElement
+
+RECORDING_FORMAT = "flaui-input-recording"
+RECORDING_VERSION = 1
+
+# (target name, class, method names) patched while recording
+RecordTarget = Tuple[str, type, Sequence[str]]
+
+
+class RecordedEvent(BaseModel):
+    """A recorded input call."""
+
+    t: float  # Seconds since the recording started
+    target: str  # Mouse, Keyboard, Touch or element
+    method: str
+    args: Dict[str, Any] = Field(default_factory=dict)  # Encoded arguments by parameter name
+    element: Optional[Dict[str, Any]] = None  # Locator of the element for element actions
+
+
+class InputRecording(BaseModel):
+    """A recorded input workflow, stored as JSONL: a header line followed by one event per line."""
+
+    events: List[RecordedEvent] = Field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Recorded wall time in seconds, from the start of the recording to the last event."""
+        return self.events[-1].t if self.events else 0.0
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Writes the recording as JSONL.
+
+        :param path: Output file path
+        """
+        with Path(path).open("w", encoding="utf-8") as stream:
+            stream.write(json.dumps({"format": RECORDING_FORMAT, "version": RECORDING_VERSION}) + "\n")
+            for event in self.events:
+                stream.write(event.model_dump_json(exclude_none=True) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> InputRecording:
+        """Reads a JSONL recording.
+
+        :param path: Recording file path
+        :raises ValueError: If the file is not a recording or has an unsupported version
+        :return: The recording
+        """
+        with Path(path).open(encoding="utf-8") as stream:
+            header = json.loads(stream.readline() or "{}")
+            if header.get("format") != RECORDING_FORMAT or header.get("version") != RECORDING_VERSION:
+                raise ValueError(f"{path} is not a version {RECORDING_VERSION} {RECORDING_FORMAT} file")
+            return cls(events=[RecordedEvent.model_validate_json(_) for _ in stream if _.strip()])
+
+
+class ReplayStats(BaseModel):
+    """Outcome of a replay."""
+
+    events: int
+    recorded_duration: float  # Seconds
+    replay_duration: float  # Seconds
+    replaced_waits: int  # Fixed post_wait sleeps replaced by readiness waits
+
+
+def _encode(value: Any) -> Any:
+    """Encodes an argument value as JSON compatible data.
+
+    Trajectories keep their timestamps and points so `move_along`/`drag_along` replay the same path.
+
+    :param value: Argument value
+    :return: Encoded value, None for values which cannot be recorded (eg. callables)
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {"enum": type(value).__name__, "name": value.name}
+    if isinstance(value, (list, tuple)):
+        return [_encode(_) for _ in value]
+    if hasattr(value, "times_ms") and hasattr(value, "points"):
+        return {"trajectory": {"times_ms": value.times_ms.tolist(), "points": value.points.tolist()}}
+    if hasattr(value, "x") and hasattr(value, "y") and not callable(value):
+        return {"point": [int(value.x), int(value.y)]}
+    return None
+
+
+def _locator(element: Any) -> Dict[str, Any]:
+    """Builds a locator for an element wrapper, used to find the element again on replay.
+
+    :param element: Element wrapper
+    :return: Wrapper class name, automation id and name of the element
+    """
+    locator: Dict[str, Any] = {"class": type(element).__name__}
+    for key in ("automation_id", "name"):
+        try:
+            locator[key] = getattr(element, key)
+        except Exception:
+            locator[key] = None
+    return locator
+
+
+def _default_targets() -> List[RecordTarget]:
+    """Lists the input classes and element actions recorded by default.
+
+    :return: Record targets
+    """
+    from flaui.core import automation_elements as elements
+    from flaui.core.input import Keyboard, Mouse, Touch
+
+    def public_static(cls: type) -> List[str]:
+        """Names of the public static methods of a class."""
+        return [name for name, value in vars(cls).items() if isinstance(value, staticmethod) and name[0] != "_"]
+
+    return [
+        ("Mouse", Mouse, public_static(Mouse)),
+        ("Keyboard", Keyboard, public_static(Keyboard)),
+        ("Touch", Touch, public_static(Touch)),
+        ("element", elements.AutomationElement, ("click", "double_click", "right_click", "focus")),
+        ("element", elements.InvokeAutomationElement, ("invoke",)),
+        ("element", elements.SelectionItemAutomationElement, ("select",)),
+        ("element", elements.ComboBox, ("select",)),
+        ("element", elements.ListBox, ("select",)),
+        ("element", elements.MenuItem, ("invoke",)),
+    ]
+
+
+class InputRecorder:
+    """Context manager recording input calls while active.
+
+    Only the outermost call is recorded when a recorded method calls another recorded method.
+    """
+
+    def __init__(self, targets: Optional[List[RecordTarget]] = None, clock: Callable[[], float] = time.perf_counter):
+        """Creates a recorder.
+
+        :param targets: Classes and methods to record, defaults to Mouse, Keyboard, Touch and the element actions
+        :param clock: Monotonic clock in seconds, defaults to time.perf_counter
+        """
+        self._targets = targets
+        self._clock = clock
+        self._start = 0.0
+        self._patched: List[Tuple[type, str, Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.recording = InputRecording()
+
+    def _wrap(self, target: str, func: Callable[..., Any], is_static: bool) -> Callable[..., Any]:
+        """Wraps a method to record its calls.
+
+        :param target: Target name
+        :param func: Original function
+        :param is_static: Whether the method is a static method
+        :return: Recording wrapper
+        """
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Records the call if it is the outermost recorded call, then calls the original function."""
+            depth = getattr(self._local, "depth", 0)
+            if depth == 0:
+                bound = signature.bind(*args, **kwargs)
+                arguments = dict(bound.arguments)
+                element = None if is_static else _locator(arguments.pop(next(iter(signature.parameters))))
+                event = RecordedEvent(
+                    t=self._clock() - self._start,
+                    target=target,
+                    method=func.__name__,
+                    args={name: _encode(value) for name, value in arguments.items()},
+                    element=element,
+                )
+                with self._lock:
+                    self.recording.events.append(event)
+            self._local.depth = depth + 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.depth = depth
+
+        return wrapper
+
+    def __enter__(self) -> InputRecorder:
+        """Starts recording."""
+        self._start = self._clock()
+        for target, cls, names in self._targets if self._targets is not None else _default_targets():
+            for name in names:
+                original = vars(cls)[name]
+                is_static = isinstance(original, staticmethod)
+                func = original.__func__ if is_static else original
+                wrapper = self._wrap(target, func, is_static)
+                setattr(cls, name, staticmethod(wrapper) if is_static else wrapper)
+                self._patched.append((cls, name, original))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stops recording and restores the original methods."""
+        while self._patched:
+            cls, name, original = self._patched.pop()
+            setattr(cls, name, original)
+
+
+def schedule(events: Sequence[RecordedEvent], speed: float = 1.0, max_gap: Optional[float] = 0.5) -> List[float]:
+    """Computes the replay time of every event: gaps between events are capped at max_gap and divided by speed.
+
+    :param events: Recorded events
+    :param speed: Speed-up factor, defaults to 1.0
+    :param max_gap: Longest idle gap kept in seconds before applying speed, None keeps all gaps, defaults to 0.5
+    :raises ValueError: On a non-positive speed
+    :return: Replay offset of every event in seconds
+    """
+    if speed <= 0:
+        raise ValueError("`speed` must be positive")
+    offsets: List[float] = []
+    offset = previous = 0.0
+    for event in events:
+        gap = max(event.t - previous, 0.0)
+        offset += (min(gap, max_gap) if max_gap is not None else gap) / speed
+        offsets.append(offset)
+        previous = event.t
+    return offsets
+
+
+def _decode(value: Any) -> Any:
+    """Decodes an encoded argument value.
+
+    :param value: Encoded value
+    :return: Argument value
+    """
+    if isinstance(value, list):
+        return [_decode(_) for _ in value]
+    if not isinstance(value, dict):
+        return value
+    if "point" in value:
+        from flaui.lib.system.drawing import Point
+
+        return Point(raw_value=tuple(value["point"]))
+    if "trajectory" in value:
+        import numpy as np
+
+        from flaui.lib.trajectory import Trajectory
+
+        return Trajectory(
+            times_ms=np.asarray(value["trajectory"]["times_ms"], dtype=float),
+            points=np.asarray(value["trajectory"]["points"], dtype=np.int32),
+        )
+    from flaui.core import input as flaui_input, windows_api
+
+    enum_type = getattr(flaui_input, value["enum"], None) or getattr(windows_api, value["enum"])
+    return enum_type[value["name"]]
+
+
+def _resolve(root: AutomationElement, locator: Dict[str, Any]) -> Any:
+    """Finds a recorded element below the root element and wraps it in its recorded class.
+
+    :param root: Element to search from (eg. the main window)
+    :param locator: Recorded element locator
+    :raises ElementNotFound: If the element cannot be found
+    :return: Element wrapper
+    """
+    from flaui.core import automation_elements as elements
+    from flaui.lib.exceptions import ElementNotFound
+
+    if locator.get("automation_id"):
+        condition = root.condition_factory.by_automation_id(locator["automation_id"])
+    elif locator.get("name"):
+        condition = root.condition_factory.by_name(locator["name"])
+    else:
+        raise ElementNotFound(f"Recorded element {locator} has neither an automation id nor a name")
+    found = root.find_first_descendant(condition)
+    return getattr(elements, locator["class"], elements.AutomationElement)(raw_element=found.raw_element)
+
+
+def _iter_calls(
+    recording: InputRecording, root: Optional[AutomationElement], ready: Optional[Callable[[], Any]]
+) -> Iterator[Tuple[Callable[..., Any], Dict[str, Any], bool]]:
+    """Resolves the callable and arguments of every recorded event.
+
+    :param recording: The recording
+    :param root: Element to find recorded elements from
+    :param ready: Readiness wait replacing fixed post_wait sleeps
+    :return: Iterator of (callable, keyword arguments, post_wait replaced flag)
+    """
+    from flaui.core import input as flaui_input
+
+    for event in recording.events:
+        kwargs = {name: _decode(value) for name, value in event.args.items()}
+        replaced = False
+        if ready is not None and "post_wait" in kwargs and kwargs["post_wait"] not in (None, False):
+            kwargs["post_wait"], replaced = ready, True
+        if event.target == "element":
+            if root is None:
+                raise ValueError("Replaying element actions requires the `root` element")
+            func = getattr(_resolve(root, event.element or {}), event.method)
+        else:
+            func = getattr(getattr(flaui_input, event.target), event.method)
+        yield func, kwargs, replaced
+
+
+def replay_recording(
+    recording: Union[InputRecording, str, Path],
+    speed: float = 1.0,
+    max_gap: Optional[float] = 0.5,
+    root: Optional[AutomationElement] = None,
+    ready: Optional[Callable[[], Any]] = None,
+    readiness_timeout: float = 5.0,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayStats:
+    """Replays a recording.
+
+    Events are scheduled with `schedule`. Fixed `post_wait` sleeps are replaced by the readiness wait, which defaults
+    to waiting until the root element's application responds to messages again.
+
+    :param recording: The recording or the path of a JSONL recording
+    :param speed: Speed-up factor, defaults to 1.0
+    :param max_gap: Longest idle gap kept in seconds before applying speed, None keeps all gaps, defaults to 0.5
+    :param root: Element to find recorded elements from (eg. the main window), required for element actions
+    :param ready: Readiness wait, defaults to Wait.until_responsive on the root element if given
+    :param readiness_timeout: Timeout of the default readiness wait in seconds, defaults to 5.0
+    :param clock: Monotonic clock in seconds, defaults to time.perf_counter
+    :param sleep: Sleep function in seconds, defaults to time.sleep
+    :return: Replay statistics
+    """
+    if not isinstance(recording, InputRecording):
+        recording = InputRecording.load(recording)
+    if ready is None and root is not None:
+        from flaui.core.input import Wait
+
+        def ready() -> Any:
+            """Waits until the application of the root element is responsive."""
+            return Wait.until_responsive(root, readiness_timeout)
+
+    offsets = schedule(recording.events, speed, max_gap)
+    replaced_waits = 0
+    start = clock()
+    for offset, (func, kwargs, replaced) in zip(offsets, _iter_calls(recording, root, ready)):  # noqa: B905
+        remaining = start + offset - clock()
+        if remaining > 0:
+            sleep(remaining)
+        func(**kwargs)
+        replaced_waits += replaced
+    return ReplayStats(
+        events=len(recording.events),
+        recorded_duration=recording.duration,
+        replay_duration=clock() - start,
+        replaced_waits=replaced_waits,
+    )
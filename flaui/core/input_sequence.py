@@ -0,0 +1,339 @@
+"""This module provides a builder for keyboard and mouse input scripts which are executed in a single dispatch.
+
+Every call on `Keyboard` and `Mouse` is an individual interop call, usually followed by a `post_wait` sleep. An
+`InputSequence` records the steps first, compiles them into a compact list of events (adjacent sleeps merged, adjacent
+text typing joined) and executes the whole list in one dispatch on the STA thread.
+
+The builder and the compiled events are plain Python: nothing touches FlaUI until `execute` is called without
+`dry_run`, so scripts can be built and inspected on any platform.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flaui.core.input import MouseButton
+    from flaui.core.windows_api import VirtualKeyShort
+    from flaui.lib.system.drawing import Point
+
+EventKind = Literal[
+    "type",
+    "type_key",
+    "type_simultaneously",
+    "press",
+    "release",
+    "move_to",
+    "move_by",
+    "click",
+    "double_click",
+    "down",
+    "up",
+    "scroll",
+    "horizontal_scroll",
+    "drag",
+    "sleep",
+]
+
+Coordinates = Tuple[int, int]
+PointLike = Union["Point", Coordinates]
+KeyLike = Union["VirtualKeyShort", str]
+ButtonLike = Union["MouseButton", str]
+
+
+class InputEvent(BaseModel):
+    """A single compiled input event, keys and mouse buttons are kept by name so events can be serialized."""
+
+    kind: EventKind
+    args: Tuple[Any, ...] = ()
+
+
+def _coordinates(point: PointLike) -> Coordinates:
+    """Converts a Point or (x, y) tuple to integer coordinates.
+
+    :param point: Point or (x, y) tuple
+    :return: (x, y) coordinates
+    """
+    if isinstance(point, tuple):
+        return int(point[0]), int(point[1])
+    return int(point.x), int(point.y)
+
+
+def _name(value: Union[KeyLike, ButtonLike]) -> str:
+    """Returns the enum member name of a key or mouse button.
+
+    :param value: Enum member or member name
+    :return: Member name
+    """
+    return value if isinstance(value, str) else value.name
+
+
+class InputSequence:
+    """Builder for keyboard and mouse input scripts, every step method returns the sequence so calls can be chained.
+
+    Example: `InputSequence().type("abc").type_key(VirtualKeyShort.TAB).click(point).execute()`
+    """
+
+    def __init__(self) -> None:
+        self._events: List[InputEvent] = []
+
+    def __len__(self) -> int:
+        """Number of recorded steps, before compilation."""
+        return len(self._events)
+
+    def _add(self, kind: EventKind, *args: Any, post_wait: Optional[float] = None) -> InputSequence:
+        """Records a step followed by an optional wait.
+
+        :param kind: Event kind
+        :param args: Event arguments
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        self._events.append(InputEvent(kind=kind, args=args))
+        if post_wait:
+            self.wait(post_wait)
+        return self
+
+    def wait(self, seconds: float) -> InputSequence:
+        """Waits for the given time, adjacent waits are merged into one.
+
+        :param seconds: Time to wait in seconds
+        :return: The sequence
+        """
+        self._events.append(InputEvent(kind="sleep", args=(float(seconds),)))
+        return self
+
+    def type(self, text: str, post_wait: Optional[float] = None) -> InputSequence:
+        """Types the given text.
+
+        :param text: Text to type
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("type", text, post_wait=post_wait)
+
+    def type_key(self, key: KeyLike, post_wait: Optional[float] = None) -> InputSequence:
+        """Types the given key (press and release).
+
+        :param key: Virtual key
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("type_key", _name(key), post_wait=post_wait)
+
+    def type_simultaneously(self, *keys: KeyLike, post_wait: Optional[float] = None) -> InputSequence:
+        """Presses all given keys in order and releases them in reverse order (eg. CONTROL + A).
+
+        :param keys: Virtual keys
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("type_simultaneously", *[_name(_) for _ in keys], post_wait=post_wait)
+
+    def press(self, key: KeyLike, post_wait: Optional[float] = None) -> InputSequence:
+        """Presses the given key.
+
+        :param key: Virtual key
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("press", _name(key), post_wait=post_wait)
+
+    def release(self, key: KeyLike, post_wait: Optional[float] = None) -> InputSequence:
+        """Releases the given key.
+
+        :param key: Virtual key
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("release", _name(key), post_wait=post_wait)
+
+    def move_to(self, point: PointLike, post_wait: Optional[float] = None) -> InputSequence:
+        """Moves the mouse to the given position.
+
+        :param point: Point or (x, y) tuple
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("move_to", *_coordinates(point), post_wait=post_wait)
+
+    def move_by(self, delta_x: int, delta_y: int, post_wait: Optional[float] = None) -> InputSequence:
+        """Moves the mouse by the given delta from the current position.
+
+        :param delta_x: The delta for the x-axis
+        :param delta_y: The delta for the y-axis
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("move_by", int(delta_x), int(delta_y), post_wait=post_wait)
+
+    def click(
+        self, point: Optional[PointLike] = None, mouse_button: ButtonLike = "Left", post_wait: Optional[float] = None
+    ) -> InputSequence:
+        """Clicks the mouse button, at the given position if any.
+
+        :param point: Optional position to move to before clicking
+        :param mouse_button: The mouse button to click, defaults to Left
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        coordinates = _coordinates(point) if point is not None else None
+        return self._add("click", _name(mouse_button), coordinates, post_wait=post_wait)
+
+    def double_click(
+        self, point: Optional[PointLike] = None, mouse_button: ButtonLike = "Left", post_wait: Optional[float] = None
+    ) -> InputSequence:
+        """Double-clicks the mouse button, at the given position if any.
+
+        :param point: Optional position to move to before clicking
+        :param mouse_button: The mouse button to click, defaults to Left
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        coordinates = _coordinates(point) if point is not None else None
+        return self._add("double_click", _name(mouse_button), coordinates, post_wait=post_wait)
+
+    def down(self, mouse_button: ButtonLike = "Left", post_wait: Optional[float] = None) -> InputSequence:
+        """Sends a mouse down for the given button.
+
+        :param mouse_button: The mouse button to press, defaults to Left
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("down", _name(mouse_button), post_wait=post_wait)
+
+    def up(self, mouse_button: ButtonLike = "Left", post_wait: Optional[float] = None) -> InputSequence:
+        """Sends a mouse up for the given button.
+
+        :param mouse_button: The mouse button to release, defaults to Left
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("up", _name(mouse_button), post_wait=post_wait)
+
+    def scroll(self, lines: int, horizontal: bool = False, post_wait: Optional[float] = None) -> InputSequence:
+        """Scrolls the mouse wheel.
+
+        :param lines: Lines to scroll
+        :param horizontal: Scroll horizontally instead of vertically, defaults to False
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add("horizontal_scroll" if horizontal else "scroll", int(lines), post_wait=post_wait)
+
+    def drag(
+        self,
+        starting_point: PointLike,
+        ending_point: PointLike,
+        mouse_button: ButtonLike = "Left",
+        post_wait: Optional[float] = None,
+    ) -> InputSequence:
+        """Drags the mouse from the starting point to the ending point.
+
+        :param starting_point: Starting point of the drag
+        :param ending_point: Ending point of the drag
+        :param mouse_button: The mouse button to use for dragging, defaults to Left
+        :param post_wait: Optional wait after the step in seconds
+        :return: The sequence
+        """
+        return self._add(
+            "drag", _coordinates(starting_point), _coordinates(ending_point), _name(mouse_button), post_wait=post_wait
+        )
+
+    def compile(self) -> List[InputEvent]:
+        """Compiles the recorded steps into a compact event list.
+
+        Adjacent waits are merged into one sleep and zero waits dropped, adjacent text typing is joined into one call.
+
+        :return: Compiled events
+        """
+        compiled: List[InputEvent] = []
+        for event in self._events:
+            previous = compiled[-1] if compiled else None
+            if event.kind == "sleep":
+                if event.args[0] <= 0:
+                    continue
+                if previous is not None and previous.kind == "sleep":
+                    compiled[-1] = InputEvent(kind="sleep", args=(previous.args[0] + event.args[0],))
+                    continue
+            elif event.kind == "type" and previous is not None and previous.kind == "type":
+                compiled[-1] = InputEvent(kind="type", args=(previous.args[0] + event.args[0],))
+                continue
+            compiled.append(event)
+        return compiled
+
+    def execute(self, dry_run: bool = False) -> List[InputEvent]:
+        """Compiles the sequence and executes all events in a single dispatch on the STA thread.
+
+        The input bypasses the `Keyboard` and `Mouse` wrappers, so the active property and capture caches are
+        invalidated here once the dispatch ran (or failed).
+
+        :param dry_run: Only compile and return the events without sending any input, defaults to False
+        :return: The compiled (and executed unless dry_run) events
+        """
+        events = self.compile()
+        if not dry_run:
+            from flaui.lib import capture_cache, property_cache
+            from flaui.lib.threading_utils import get_sta_executor
+
+            try:
+                get_sta_executor().run(dispatch, events)
+            finally:
+                property_cache.invalidate()
+                capture_cache.invalidate()
+        return events
+
+
+def _handlers() -> Dict[str, Callable[..., Any]]:
+    """Maps every event kind to the FlaUI call executing it.
+
+    :return: Handler per event kind
+    """
+    from FlaUI.Core.Input import Keyboard as CSKeyboard, Mouse as CSMouse  # pyright: ignore
+    from System.Drawing import Point as CSPoint  # pyright: ignore
+
+    from flaui.core.input import MouseButton
+    from flaui.core.windows_api import VirtualKeyShort
+
+    def key(name: str) -> Any:
+        """Resolves a virtual key name."""
+        return VirtualKeyShort[name].value
+
+    def button(name: str) -> Any:
+        """Resolves a mouse button name."""
+        return MouseButton[name].value
+
+    def click(method: Callable[..., Any], name: str, coordinates: Optional[Coordinates]) -> None:
+        """Clicks at the current position or at the given coordinates."""
+        method(button(name)) if coordinates is None else method(CSPoint(*coordinates), button(name))
+
+    return {
+        "type": CSKeyboard.Type,
+        "type_key": lambda name: CSKeyboard.Type(key(name)),
+        "type_simultaneously": lambda *names: CSKeyboard.TypeSimultaneously([key(_) for _ in names]),
+        "press": lambda name: CSKeyboard.Press(key(name)),
+        "release": lambda name: CSKeyboard.Release(key(name)),
+        "move_to": lambda x, y: CSMouse.MoveTo(x, y),
+        "move_by": lambda x, y: CSMouse.MoveBy(x, y),
+        "click": lambda name, coordinates: click(CSMouse.Click, name, coordinates),
+        "double_click": lambda name, coordinates: click(CSMouse.DoubleClick, name, coordinates),
+        "down": lambda name: CSMouse.Down(button(name)),
+        "up": lambda name: CSMouse.Up(button(name)),
+        "scroll": CSMouse.Scroll,
+        "horizontal_scroll": CSMouse.HorizontalScroll,
+        "drag": lambda start, end, name: CSMouse.Drag(CSPoint(*start), CSPoint(*end), button(name)),
+        "sleep": time.sleep,
+    }
+
+
+def dispatch(events: List[InputEvent]) -> None:
+    """Executes compiled events on the calling thread, use `InputSequence.execute` to run them on the STA thread.
+
+    :param events: Compiled events
+    """
+    handlers = _handlers()
+    for event in events:
+        handlers[event.kind](*event.args)
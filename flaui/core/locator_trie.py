@@ -0,0 +1,157 @@
+"""This module resolves locator paths (window > tab > tab item > group > button) while reusing resolved ancestors.
+
+A `LocatorTrie` stores the element resolved for every path prefix it was asked for. Paths sharing a prefix share its
+nodes, so the buttons of a group all hang off the same resolved group. Resolving a path:
+1. returns the cached leaf if it is still available (one `is_available` read),
+2. else walks up to the deepest cached ancestor still available and finds only the steps below it, eg. the leaf alone
+   with a single `find_first_child` when its parent is valid,
+3. else resolves the path from the root.
+
+An ancestor found again drops the nodes below it, their elements are looked up anew under the new ancestor.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Sequence, Union
+
+from flaui.core.page_object import is_live
+
+# How a step searches below its parent element
+StepScope = Literal["child", "descendant"]
+
+
+class Step(NamedTuple):
+    """One level of a locator path."""
+
+    by: str  # ConditionFactory method suffix: "automation_id", "name", "control_type", "class_name", "text", ...
+    value: Any
+    scope: StepScope = "child"
+
+    def find(self, parent: Any) -> Any:
+        """Finds the element of the step below the parent.
+
+        :param parent: Parent element wrapper
+        :return: Found element
+        """
+        condition = getattr(parent.condition_factory, f"by_{self.by}")(self.value)
+        if self.scope == "child":
+            return parent.find_first_child(condition=condition)
+        return parent.find_first_descendant(condition=condition)
+
+
+def child(by: str, value: Any) -> Step:
+    """Step finding a child of the previous element, eg. child("automation_id", "OkButton").
+
+    :param by: ConditionFactory method suffix
+    :param value: Property value
+    :return: Step
+    """
+    return Step(by, value, "child")
+
+
+def descendant(by: str, value: Any) -> Step:
+    """Step finding a descendant of the previous element, eg. descendant("control_type", ControlType.Tab).
+
+    :param by: ConditionFactory method suffix
+    :param value: Property value
+    :return: Step
+    """
+    return Step(by, value, "descendant")
+
+
+class _Node:
+    """A resolved path prefix."""
+
+    __slots__ = ("element", "children")
+
+    def __init__(self, element: Any = None) -> None:
+        """Creates a node without children.
+
+        :param element: Element resolved for the prefix, defaults to None until it is resolved
+        """
+        self.element = element
+        self.children: Dict[Step, _Node] = {}
+
+
+class LocatorTrie:
+    """Resolves locator paths below a root element, reusing the elements resolved for shared prefixes."""
+
+    def __init__(self, root: Union[Any, Callable[[], Any]]) -> None:
+        """Creates an empty trie.
+
+        :param root: Root element wrapper (eg. the main window), or a function returning it, called again when the
+            root element is not available anymore
+        """
+        self._get_root = root if callable(root) else None
+        self._root = _Node(None if self._get_root is not None else root)
+        self._lock = threading.RLock()
+        self.hits = 0  # Paths served from a cached leaf
+        self.finds = 0  # Steps found with a UIA search
+
+    def resolve(self, path: Sequence[Step]) -> Any:
+        """Returns the element at the end of a path.
+
+        :param path: Steps from the root, the root element itself for an empty path
+        :return: Element wrapper
+        """
+        with self._lock:
+            nodes = self._nodes(path)
+            # Deepest node with a live element, the root counts as resolved if it is live
+            depth = len(nodes) - 1
+            while depth >= 0 and (nodes[depth].element is None or not is_live(nodes[depth].element)):
+                depth -= 1
+            if depth == len(nodes) - 1:
+                self.hits += 1
+                return nodes[depth].element
+            if depth < 0:
+                self._root.element = self._get_root() if self._get_root is not None else self._root.element
+                self._root.children = {path[0]: nodes[1]} if path else {}
+                depth = 0
+            # Nodes found again keep only the child on the path, the other elements were found under a stale ancestor
+            for index in range(depth, len(path)):
+                node = nodes[index + 1]
+                node.element = path[index].find(nodes[index].element)
+                node.children = {path[index + 1]: nodes[index + 2]} if index + 1 < len(path) else {}
+                self.finds += 1
+            return nodes[-1].element
+
+    def _nodes(self, path: Sequence[Step]) -> List[_Node]:
+        """Returns the nodes of the root and of every step of a path, creating the missing ones.
+
+        :param path: Steps from the root
+        :return: Nodes, the root first
+        """
+        nodes = [self._root]
+        for step in path:
+            node = nodes[-1].children.get(step)
+            if node is None:
+                node = nodes[-1].children[step] = _Node()
+            nodes.append(node)
+        return nodes
+
+    def invalidate(self, path: Optional[Sequence[Step]] = None) -> None:
+        """Drops the resolved elements at and below a path.
+
+        :param path: Steps from the root, defaults to the whole trie
+        """
+        with self._lock:
+            if not path:
+                self._root.children.clear()
+                return
+            parent = self._root
+            for step in path[:-1]:
+                parent = parent.children.get(step)  # type: ignore[assignment]
+                if parent is None:
+                    return
+            parent.children.pop(path[-1], None)
+
+    def __len__(self) -> int:
+        """Number of resolved path prefixes."""
+        count = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            count += node.element is not None and node is not self._root
+            stack.extend(node.children.values())
+        return count
@@ -0,0 +1,117 @@
+"""This module provides a base for page objects, element maps whose locators resolve once and are reused.
+
+A `locator` is a property of a `PageObject` whose value is memoised per page object: the element is found on first
+access and returned as is on the next ones, after a liveness check (one `is_available` read on the cached handle,
+which keeps its RuntimeId). Only a stale element (eg. unloaded from the UI) is resolved again, and as locators are
+usually resolved from other locators (window, tab, group, ...), re-resolution only re-finds the stale part of the
+chain. Locators returning page objects (sub-pages) are memoised without a liveness check.
+
+Locators are resolved within `cache_profile.scope("<PageObject>.<locator>")`, so recorded cache profiles prefetch the
+properties each locator reads.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar, overload
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from flaui.lib import cache_profile
+
+T = TypeVar("T")
+
+
+def is_live(value: Any) -> bool:
+    """Tells if a memoised locator value can be reused.
+
+    :param value: Element wrapper, page object or any other value
+    :return: False for elements which are not available anymore, True otherwise
+    """
+    if getattr(type(value), "is_available", None) is None:
+        return True
+    try:
+        return bool(value.is_available)
+    except Exception:
+        return False
+
+
+class Locator(Generic[T]):
+    """Property memoising the element found by a page object method, see `locator`."""
+
+    def __init__(self, resolve: Callable[[Any], T]) -> None:
+        """Creates a locator.
+
+        :param resolve: Finds the element, called with the page object
+        """
+        self.resolve = resolve
+        self.name = resolve.__name__
+        functools.update_wrapper(self, resolve)  # type: ignore[arg-type]
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        """Keys the memoised element on the attribute name of the locator."""
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[Type[Any]] = None) -> Locator[T]:
+        """The locator itself, read from the page object class."""
+
+    @overload
+    def __get__(self, instance: Any, owner: Optional[Type[Any]] = None) -> T:
+        """The element of the page object."""
+
+    def __get__(self, instance: Any, owner: Optional[Type[Any]] = None) -> Any:
+        """Returns the memoised element if it is still live, finds it again otherwise.
+
+        :param instance: Page object, None when read from the class
+        :param owner: Page object class
+        :return: Element, the locator itself when read from the class
+        """
+        if instance is None:
+            return self
+        values: Dict[str, Any] = instance._locators
+        if self.name in values:
+            value = values[self.name]
+            if is_live(value):
+                return value
+            del values[self.name]
+        with cache_profile.scope(f"{type(instance).__name__}.{self.name}"):
+            value = self.resolve(instance)
+        values[self.name] = value
+        return value
+
+
+def locator(resolve: Callable[[Any], T]) -> Locator[T]:
+    """Decorator for page object methods finding an element, turns them into memoised properties.
+
+    Example:
+
+    class LoginPage(PageObject):
+        window: Window
+
+        @locator
+        def user_name(self) -> TextBox:
+            return self.window.find_first_descendant(condition=self.window.condition_factory.by_automation_id("User"))
+
+    :param resolve: Method finding the element
+    :return: Locator property
+    """
+    return Locator(resolve)
+
+
+class PageObject(BaseModel):
+    """Base of page objects, memoises the values of their `locator` properties."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, ignored_types=(Locator,))
+
+    _locators: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def invalidate_locators(self, *names: str) -> None:
+        """Drops memoised locator values, they are resolved again on next access.
+
+        :param names: Locator names, defaults to all
+        """
+        if not names:
+            self._locators.clear()
+        for name in names:
+            self._locators.pop(name, None)
@@ -0,0 +1,161 @@
+"""This module compares two snapshots of a UI tree, eg. before and after an action.
+
+Nodes are matched by RuntimeId, and nodes left unmatched (eg. recreated elements) by their AutomationId/ControlType
+path from the root, the level of a path telling apart siblings with the same AutomationId and ControlType by their
+order. Matched nodes are reported as changed when their properties differ and as moved when their parent changed,
+unmatched ones as removed or added.
+
+Every subtree is hashed into a signature (RuntimeIds, properties and children) first, and regions with the same
+signature in both snapshots are skipped without being compared, so the diff runs in linear time and is fast when
+only a small part of a large tree changed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from flaui.core.tree_snapshot import SnapshotNode, TreeSnapshot
+from flaui.lib.identity_map import RuntimeId
+
+
+class PropertyChange(NamedTuple):
+    """A matched node whose properties differ."""
+
+    before: SnapshotNode
+    after: SnapshotNode
+    changes: Dict[str, Tuple[Any, Any]]  # (before, after) value by column name
+
+
+class Move(NamedTuple):
+    """A matched node whose parent changed."""
+
+    before: SnapshotNode
+    after: SnapshotNode
+
+
+class TreeDiff:
+    """Differences between two snapshots."""
+
+    def __init__(self) -> None:
+        """Creates an empty diff, filled by `diff_snapshots`."""
+        self.added: List[SnapshotNode] = []  # Nodes of the second snapshot, in tree order
+        self.removed: List[SnapshotNode] = []  # Nodes of the first snapshot, in tree order
+        self.moved: List[Move] = []
+        self.changed: List[PropertyChange] = []
+        self.unchanged = 0  # Nodes skipped as part of identical regions
+
+    def __bool__(self) -> bool:
+        """Tells if the snapshots differ."""
+        return bool(self.added or self.removed or self.moved or self.changed)
+
+    def summary(self) -> str:
+        """Counts of the differences, eg. "2 added, 0 removed, 1 moved, 3 changed, 49994 unchanged".
+
+        :return: Summary
+        """
+        return (
+            f"{len(self.added)} added, {len(self.removed)} removed, {len(self.moved)} moved, "
+            f"{len(self.changed)} changed, {self.unchanged} unchanged"
+        )
+
+
+def _signatures(snapshot: TreeSnapshot) -> Tuple[Dict[RuntimeId, int], Dict[RuntimeId, int]]:
+    """Hashes every subtree of a snapshot, children before their parents.
+
+    :param snapshot: Snapshot
+    :return: Signature and size (number of nodes) of the subtree of each node
+    """
+    signatures: Dict[RuntimeId, int] = {}
+    sizes: Dict[RuntimeId, int] = {}
+    for node in reversed(list(snapshot.walk())):
+        children = node.children
+        signatures[node.runtime_id] = hash(
+            (node.runtime_id, tuple(node.properties.items()), tuple([signatures[_] for _ in children]))
+        )
+        sizes[node.runtime_id] = 1 + sum([sizes[_] for _ in children])
+    return signatures, sizes
+
+
+def _scan(
+    snapshot: TreeSnapshot, signatures: Dict[RuntimeId, int], other_signatures: Dict[RuntimeId, int]
+) -> Tuple[Dict[RuntimeId, Hashable], List[RuntimeId]]:
+    """Walks a snapshot top-down, stopping at the subtrees identical in the other snapshot.
+
+    :param snapshot: Snapshot
+    :param signatures: Subtree signatures of the snapshot
+    :param other_signatures: Subtree signatures of the other snapshot
+    :return: Fallback key (AutomationId/ControlType path) of each node left to compare in tree order, and the roots of
+        the identical subtrees
+    """
+    pending: Dict[RuntimeId, Hashable] = {}
+    identical: List[RuntimeId] = []
+    stack: List[Tuple[RuntimeId, Hashable]] = [(snapshot.root, ())]
+    while stack:
+        runtime_id, key = stack.pop()
+        if other_signatures.get(runtime_id) == signatures[runtime_id]:
+            identical.append(runtime_id)
+            continue
+        pending[runtime_id] = key
+        occurrences: Dict[Tuple[Any, Any], int] = {}
+        levels = []
+        for child in snapshot.nodes[runtime_id].children:
+            properties = snapshot.nodes[child].properties
+            label = (properties.get("automation_id"), properties.get("control_type"))
+            occurrence = occurrences.get(label, 0)
+            occurrences[label] = occurrence + 1
+            levels.append((child, (key, label, occurrence)))
+        stack.extend(reversed(levels))
+    return pending, identical
+
+
+def diff_snapshots(before: TreeSnapshot, after: TreeSnapshot, match_by_path: bool = True) -> TreeDiff:
+    """Compares two snapshots of a UI tree.
+
+    :param before: First snapshot
+    :param after: Second snapshot
+    :param match_by_path: Match the nodes without a RuntimeId match by AutomationId/ControlType path, defaults to True
+    :return: Differences
+    """
+    before_signatures, _ = _signatures(before)
+    after_signatures, after_sizes = _signatures(after)
+    before_pending, _ = _scan(before, before_signatures, after_signatures)
+    after_pending, after_identical = _scan(after, after_signatures, before_signatures)
+
+    # Pairs of matched nodes to compare, RuntimeId of the first snapshot to RuntimeId of the second
+    pairs: Dict[RuntimeId, RuntimeId] = {_: _ for _ in before_pending if _ in after_pending}
+    if match_by_path:
+        candidates: Dict[Hashable, List[RuntimeId]] = {}
+        for runtime_id, key in reversed(after_pending.items()):
+            if runtime_id not in pairs:
+                candidates.setdefault(key, []).append(runtime_id)
+        for runtime_id, key in before_pending.items():
+            if runtime_id not in pairs and candidates.get(key):
+                pairs[runtime_id] = candidates[key].pop()
+
+    diff = TreeDiff()
+    matched = set(pairs.values())
+    diff.removed = [before.nodes[_] for _ in before_pending if _ not in pairs]
+    diff.added = [after.nodes[_] for _ in after_pending if _ not in matched]
+    diff.unchanged = sum(after_sizes[_] for _ in after_identical)
+
+    def moved(old: SnapshotNode, new: SnapshotNode) -> bool:
+        """Tells if the parent of the matched node is not the match of its former parent."""
+        parent: Optional[RuntimeId] = old.parent
+        return (pairs.get(parent, parent) if parent is not None else None) != new.parent
+
+    for before_id, after_id in pairs.items():
+        old, new = before.nodes[before_id], after.nodes[after_id]
+        changes = {
+            name: (old.properties.get(name), value)
+            for name, value in new.properties.items()
+            if old.properties.get(name) != value
+        }
+        if changes:
+            diff.changed.append(PropertyChange(old, new, changes))
+        if moved(old, new):
+            diff.moved.append(Move(old, new))
+    for runtime_id in after_identical:
+        old, new = before.nodes[runtime_id], after.nodes[runtime_id]
+        if moved(old, new):
+            diff.moved.append(Move(old, new))
+    return diff
@@ -0,0 +1,200 @@
+"""This module keeps an in-memory mirror of a UI tree up to date from UIA events.
+
+`LiveTreeMirror` captures one `TreeSnapshot` of a root element, then subscribes to the structure-changed and
+property-changed events of its subtree through an `EventQueue`. Before a query is answered, the queued events are
+applied: a structure change re-captures only the subtree of the changed node, a property change updates the property
+of its node. Queries on a quiet window therefore cost a check of the queue length and no UIA round trip.
+
+Freshness: every event delivered before a query is applied before it is answered. The mirror falls back to a full
+resync when events were dropped by the queue, when an event cannot be applied (eg. its node is unknown) and once the
+last full capture is older than `resync_interval`, bounding the impact of events UIA never delivered.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from flaui.core.tree_snapshot import DEFAULT_COLUMNS, SnapshotNode, TreeSnapshot, plain_value
+from flaui.lib.events import EventQueue, EventRecord
+from flaui.lib.identity_map import RuntimeId, runtime_id
+
+logger = logging.getLogger(__name__)
+
+# Structure change for which UIA raises the event on the added child instead of the changed parent
+_CHILD_ADDED = "ChildAdded"
+
+
+class LiveTreeMirror:
+    """In-memory mirror of the subtree of an element, patched from structure-changed and property-changed events."""
+
+    def __init__(
+        self,
+        root: Any,
+        columns: Mapping[str, str] = DEFAULT_COLUMNS,
+        resync_interval: Optional[float] = 300.0,
+        queue_capacity: int = 100_000,
+        capture: Callable[[Any, Mapping[str, str]], TreeSnapshot] = TreeSnapshot.capture,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Creates a mirror, call `start()` to capture the tree and subscribe to its events.
+
+        :param root: Root element wrapper
+        :param columns: Properties mirrored per node, column name to PropertyLibrary.Element name, defaults to
+            DEFAULT_COLUMNS
+        :param resync_interval: Seconds after which the whole tree is captured again, None never resyncs on time,
+            defaults to 300.0
+        :param queue_capacity: Events buffered between two queries, more trigger a full resync, defaults to 100_000
+        :param capture: Captures the subtree of a (raw) element, defaults to TreeSnapshot.capture
+        :param clock: Clock in seconds, defaults to time.monotonic
+        """
+        self.root = root
+        self.columns = dict(columns)
+        self.resync_interval = resync_interval
+        self.queue = EventQueue(capacity=queue_capacity, policy="drop_newest")
+        self.resyncs = 0
+        self.patches = 0
+        self._capture = capture
+        self._clock = clock
+        self._snapshot: Optional[TreeSnapshot] = None
+        self._synced_at = 0.0
+        self._dropped = 0
+        self._handlers: List[Any] = []
+        # Column name by PropertyId name, to route property-changed events
+        self._columns_by_property = {property_id: name for name, property_id in self.columns.items()}
+
+    def start(self) -> LiveTreeMirror:
+        """Subscribes to the events of the subtree, then captures it.
+
+        :return: The mirror
+        """
+        from flaui.core.definitions import TreeScope
+
+        library = self.root.raw_element.Automation.PropertyLibrary.Element
+        self._handlers = [
+            self.root.register_structure_changed_event(TreeScope.Subtree, self.queue),
+            self.root.register_property_changed_event(
+                TreeScope.Subtree, self.queue, [getattr(library, _) for _ in self.columns.values()]
+            ),
+        ]
+        self.resync()
+        return self
+
+    def stop(self) -> None:
+        """Unsubscribes from the events, the mirror keeps its last state."""
+        for handler in self._handlers:
+            handler.Dispose()
+        self._handlers = []
+        self.queue.close()
+
+    def __enter__(self) -> LiveTreeMirror:
+        """Starts mirroring the tree."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops mirroring the tree."""
+        self.stop()
+
+    def resync(self) -> None:
+        """Captures the whole tree again, the events queued so far are discarded."""
+        self.queue.drain()
+        self._dropped = self.queue.dropped
+        self._snapshot = self._capture(self.root, self.columns)
+        self._synced_at = self._clock()
+        self.resyncs += 1
+
+    @property
+    def snapshot(self) -> TreeSnapshot:
+        """The mirrored tree, with all events delivered so far applied
+
+        :return: Snapshot
+        """
+        self.refresh()
+        assert self._snapshot is not None, "The mirror is not started"
+        return self._snapshot
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last full capture
+
+        :return: Seconds
+        """
+        return self._clock() - self._synced_at
+
+    def refresh(self) -> None:
+        """Applies the queued events, resyncs if events were lost, could not be applied or the capture is too old."""
+        if self._snapshot is None:
+            return
+        if self.queue.dropped != self._dropped or (
+            self.resync_interval is not None and self.age >= self.resync_interval
+        ):
+            self.resync()
+            return
+        if not len(self.queue):
+            return
+        try:
+            self._apply(self.queue.drain())
+        except Exception as e:
+            logger.debug(f"Resyncing the tree mirror, an event could not be applied: {e}")
+            self.resync()
+
+    def _apply(self, records: List[EventRecord]) -> None:
+        """Patches the mirror with events, each changed subtree is captured once.
+
+        :param records: Event records, oldest first
+        """
+        snapshot = self._snapshot
+        assert snapshot is not None
+        changed: Dict[RuntimeId, Any] = {}
+        for record in records:
+            if record.kind == "structure_changed":
+                target = record.sender
+                if str(record.detail) == _CHILD_ADDED:
+                    target = target.Parent
+                key = runtime_id(target)
+                if key not in snapshot:
+                    raise KeyError(f"Structure change under unknown element {key}")
+                changed[key] = target
+            elif record.kind == "property_changed":
+                node = snapshot.nodes.get(runtime_id(record.sender))  # type: ignore[arg-type]
+                column = self._columns_by_property.get(record.detail_name or "")
+                if node is not None and column is not None:
+                    node.properties[column] = plain_value(record.value)
+                    self.patches += 1
+        for key in _outermost(snapshot, changed):
+            snapshot.replace_subtree(self._capture(changed[key], self.columns))
+            self.patches += 1
+
+    def get(self, runtime_id: RuntimeId) -> Optional[SnapshotNode]:
+        """Node of the element with the given RuntimeId.
+
+        :param runtime_id: RuntimeId
+        :return: Node, None if the element is not in the tree
+        """
+        return self.snapshot.nodes.get(runtime_id)
+
+    def find(self, **properties: Any) -> List[SnapshotNode]:
+        """Finds the nodes with the given property values, eg. find(control_type="Button", is_enabled=True).
+
+        :param properties: Property values by column name
+        :return: Matching nodes in tree order
+        """
+        return self.snapshot.find(**properties)
+
+
+def _outermost(snapshot: TreeSnapshot, keys: Dict[RuntimeId, Any]) -> List[RuntimeId]:
+    """Drops the nodes lying in the subtree of another node, their subtree is captured with it.
+
+    :param snapshot: Snapshot
+    :param keys: RuntimeIds of the changed nodes
+    :return: RuntimeIds of the outermost changed nodes
+    """
+    outermost = []
+    for key in keys:
+        parent = snapshot.nodes[key].parent
+        while parent is not None and parent not in keys:
+            parent = snapshot.nodes[parent].parent
+        if parent is None:
+            outermost.append(key)
+    return outermost
@@ -0,0 +1,219 @@
+"""This module captures the UI tree under an element as a plain Python snapshot, in a single UIA round trip.
+
+`TreeSnapshot.capture` activates a CacheRequest over the whole subtree (RuntimeId plus the snapshot columns, without
+live element references) and fetches the root once. The cached tree is then walked in-process and copied into
+`SnapshotNode` objects keyed by RuntimeId, so the snapshot can be queried, kept and compared without touching UIA.
+
+Like `flaui.core.input_sequence`, FlaUI is only imported when a snapshot is captured.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from flaui.lib.identity_map import RuntimeId, runtime_id
+from flaui.lib.property_cache import PROPERTY_IDS
+
+# Properties captured per node: column name (the wrapper property name) to FlaUI PropertyLibrary.Element name
+DEFAULT_COLUMNS: Dict[str, str] = {
+    name: PROPERTY_IDS[name]
+    for name in (
+        "automation_id",
+        "control_type",
+        "class_name",
+        "name",
+        "is_enabled",
+        "is_offscreen",
+        "bounding_rectangle",
+    )
+}
+
+# Source of the placeholder ids of elements without a RuntimeId
+_MISSING_IDS = itertools.count(1)
+
+
+def plain_value(value: Any) -> Any:
+    """Converts a property value read from UIA into a plain, comparable Python value.
+
+    :param value: C# property value
+    :return: The value for bools, numbers and strings, (x, y, width, height) for rectangles, the string form otherwise
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if all(hasattr(value, _) for _ in ("X", "Y", "Width", "Height")):
+        return (value.X, value.Y, value.Width, value.Height)
+    return str(value)
+
+
+class SnapshotNode:
+    """An element of a snapshot: its properties and its position in the tree."""
+
+    __slots__ = ("runtime_id", "properties", "children", "parent")
+
+    def __init__(
+        self,
+        runtime_id: RuntimeId,
+        properties: Dict[str, Any],
+        children: Optional[List[RuntimeId]] = None,
+        parent: Optional[RuntimeId] = None,
+    ) -> None:
+        """Creates a node.
+
+        :param runtime_id: RuntimeId of the element
+        :param properties: Property values by column name
+        :param children: RuntimeIds of the children in tree order, defaults to None
+        :param parent: RuntimeId of the parent, None for the root, defaults to None
+        """
+        self.runtime_id = runtime_id
+        self.properties = properties
+        self.children = children if children is not None else []
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        """RuntimeId, properties and number of children of the node."""
+        return f"SnapshotNode({self.runtime_id}, {self.properties}, children={len(self.children)})"
+
+
+class TreeSnapshot:
+    """Nodes of a UI tree by RuntimeId."""
+
+    def __init__(self, root: RuntimeId, nodes: Dict[RuntimeId, SnapshotNode]) -> None:
+        """Creates a snapshot.
+
+        :param root: RuntimeId of the root node
+        :param nodes: All nodes by RuntimeId
+        """
+        self.root = root
+        self.nodes = nodes
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self.nodes)
+
+    def __getitem__(self, runtime_id: RuntimeId) -> SnapshotNode:
+        """Node of the element with the given RuntimeId."""
+        return self.nodes[runtime_id]
+
+    def __contains__(self, runtime_id: object) -> bool:
+        """Tells if the snapshot has a node for the RuntimeId."""
+        return runtime_id in self.nodes
+
+    @classmethod
+    def capture(cls, element: Any, columns: Mapping[str, str] = DEFAULT_COLUMNS) -> TreeSnapshot:
+        """Captures the subtree of an element with one cached UIA fetch.
+
+        :param element: Element wrapper or raw C# element
+        :param columns: Properties captured per node, column name to PropertyLibrary.Element name, defaults to
+            DEFAULT_COLUMNS
+        :return: Snapshot of the subtree
+        """
+        from FlaUI.Core.Conditions import TrueCondition  # pyright: ignore
+
+        from flaui.core.cache_request import CacheRequest
+        from flaui.core.definitions import AutomationElementMode, TreeScope
+
+        raw = getattr(element, "raw_element", element)
+        library = raw.Automation.PropertyLibrary.Element
+        request = CacheRequest()
+        request.tree_scope = TreeScope.Subtree
+        request.automation_element_mode = AutomationElementMode.None_
+        request.add_property(library.RuntimeId)
+        for property_id in columns.values():
+            request.add_property(getattr(library, property_id))
+        with request.activate():
+            cached = raw.FindFirst(TreeScope.Element.value, TrueCondition.Default)
+            return cls.from_cached(cached, columns)
+
+    @classmethod
+    def from_cached(cls, cached: Any, columns: Mapping[str, str] = DEFAULT_COLUMNS) -> TreeSnapshot:
+        """Copies a cached C# element tree, must run while the CacheRequest it was fetched with is active.
+
+        :param cached: Cached root element, with its subtree in CachedChildren
+        :param columns: Properties read per node, defaults to DEFAULT_COLUMNS
+        :return: Snapshot of the tree
+        """
+        nodes: Dict[RuntimeId, SnapshotNode] = {}
+        root: Optional[RuntimeId] = None
+        stack: List[Tuple[Any, Optional[RuntimeId]]] = [(cached, None)]
+        while stack:
+            raw, parent = stack.pop()
+            properties = raw.Properties
+            node = SnapshotNode(
+                runtime_id(raw) or (-1, next(_MISSING_IDS)),
+                {name: plain_value(getattr(properties, _).ValueOrDefault) for name, _ in columns.items()},
+                parent=parent,
+            )
+            nodes[node.runtime_id] = node
+            if parent is None:
+                root = node.runtime_id
+            else:
+                nodes[parent].children.append(node.runtime_id)
+            stack.extend((child, node.runtime_id) for child in reversed(list(raw.CachedChildren)))
+        assert root is not None
+        return cls(root, nodes)
+
+    def walk(self, start: Optional[RuntimeId] = None) -> Iterator[SnapshotNode]:
+        """Iterates over a subtree in tree order (depth first, parents before children).
+
+        :param start: RuntimeId of the subtree root, defaults to the snapshot root
+        :return: Nodes
+        """
+        stack = [self.root if start is None else start]
+        while stack:
+            node = self.nodes[stack.pop()]
+            yield node
+            stack.extend(reversed(node.children))
+
+    def find(self, **properties: Any) -> List[SnapshotNode]:
+        """Finds the nodes with the given property values, eg. find(control_type="Button", is_enabled=True).
+
+        :param properties: Property values by column name
+        :return: Matching nodes in tree order
+        """
+        items = properties.items()
+        return [node for node in self.walk() if all(node.properties.get(key) == value for key, value in items)]
+
+    def path(self, runtime_id: RuntimeId) -> Tuple[Tuple[Any, Any, int], ...]:
+        """Path of a node from the root: (automation id, control type, index among the siblings) per level.
+
+        :param runtime_id: RuntimeId of the node
+        :return: Path, the root first
+        """
+        path = []
+        node = self.nodes[runtime_id]
+        while node.parent is not None:
+            parent = self.nodes[node.parent]
+            path.append(
+                (
+                    node.properties.get("automation_id"),
+                    node.properties.get("control_type"),
+                    parent.children.index(node.runtime_id),
+                )
+            )
+            node = parent
+        return tuple(reversed(path))
+
+    def remove_subtree(self, runtime_id: RuntimeId) -> None:
+        """Removes a node and all its descendants, and unlinks it from its parent.
+
+        :param runtime_id: RuntimeId of the subtree root
+        """
+        node = self.nodes.get(runtime_id)
+        if node is None:
+            return
+        for descendant in list(self.walk(runtime_id)):
+            del self.nodes[descendant.runtime_id]
+        if node.parent is not None and node.parent in self.nodes:
+            self.nodes[node.parent].children.remove(runtime_id)
+
+    def replace_subtree(self, subtree: TreeSnapshot) -> None:
+        """Replaces the subtree of a node with a fresh capture of it, the node keeps its place in its parent.
+
+        :param subtree: Snapshot whose root is a node of this snapshot
+        """
+        old = self.nodes[subtree.root]
+        for descendant in list(self.walk(subtree.root))[1:]:
+            del self.nodes[descendant.runtime_id]
+        self.nodes.update(subtree.nodes)
+        self.nodes[subtree.root].parent = old.parent
@@ -0,0 +1,273 @@
+"""This module derives FlaUI CacheRequests from the properties a run actually reads, and applies them on later runs.
+
+Wrap the code resolving and using an element (a page object or locator) in `cache_profile.scope(key)`:
+- in recording mode (`enable(path, record=True)`) the wrapper properties and pattern properties read within the scope
+  are collected per key, and persisted as JSON on `disable()`,
+- in apply mode (`enable(path)`) every find_* call within the scope runs under a CacheRequest built from the profile
+  of the key, so the found elements come back with the recorded properties prefetched in the same round trip. Reads
+  of recorded properties on these elements are then served from the UIA cache, all other reads stay live.
+
+Only elements returned by a profiled find are read from the cache, so a profile missing a property never causes a
+PropertyNotCachedException. Handles reused by an identity map hold the raw element of their latest find, and keep a
+profile only while that find was profiled. FlaUI is only imported when a CacheRequest is built.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import functools
+import json
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from flaui.lib.property_cache import PROPERTY_IDS
+
+PROFILES_FORMAT = "flaui-cache-profiles"
+PROFILES_VERSION = 1
+
+# UIA property (FlaUI PropertyLibrary group, property) behind each profiled wrapper property. Properties of a group
+# other than "Element" also need the pattern (PatternLibrary "<group>Pattern") in the CacheRequest
+UIA_PROPERTIES: Dict[str, Tuple[str, str]] = {
+    **{name: ("Element", property_id) for name, property_id in PROPERTY_IDS.items()},
+    "expand_collapse_state": ("ExpandCollapse", "ExpandCollapseState"),
+    "is_selected": ("SelectionItem", "IsSelected"),
+    "toggle_state": ("Toggle", "ToggleState"),
+}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CacheProfile(BaseModel):
+    """The wrapper properties read within a scope, and the CacheRequest prefetching them."""
+
+    properties: List[str] = Field(default_factory=list)  # Wrapper property names, see UIA_PROPERTIES
+    _requests: Dict[str, Any] = PrivateAttr(default_factory=dict)  # Built CacheRequests by automation type
+
+    @property
+    def patterns(self) -> List[str]:
+        """Patterns (PatternLibrary names) needed by the profiled properties
+
+        :return: Pattern names
+        """
+        groups = {UIA_PROPERTIES[_][0] for _ in self.properties}
+        return sorted(f"{_}Pattern" for _ in groups if _ != "Element")
+
+    def covers(self, name: str) -> bool:
+        """Tells if the property is prefetched by the profile.
+
+        :param name: Wrapper property name
+        :return: True if it is prefetched
+        """
+        return name in self.properties
+
+    def request(self, raw_element: Any) -> Any:
+        """Returns the CacheRequest of the profile for the automation of the element, built once per automation type.
+
+        :param raw_element: Raw C# element whose automation provides the property and pattern ids
+        :return: CacheRequest wrapper
+        """
+        automation = raw_element.Automation
+        automation_type = automation.GetType().Name
+        if automation_type not in self._requests:
+            from flaui.core.cache_request import CacheRequest
+
+            request = CacheRequest()
+            # Keeps the RuntimeId readable while the request is active, see identity_map
+            request.add_property(automation.PropertyLibrary.Element.RuntimeId)
+            for name in self.properties:
+                group, property_id = UIA_PROPERTIES[name]
+                request.add_property(getattr(getattr(automation.PropertyLibrary, group), property_id))
+            for pattern in self.patterns:
+                request.add_pattern(getattr(automation.PatternLibrary, pattern))
+            self._requests[automation_type] = request
+        return self._requests[automation_type]
+
+
+class CacheProfiles:
+    """CacheProfiles by scope key, recorded during a run or loaded to be applied."""
+
+    def __init__(self, profiles: Optional[Dict[str, CacheProfile]] = None, record: bool = False) -> None:
+        """Creates a set of profiles.
+
+        :param profiles: Profiles by scope key, defaults to None
+        :param record: Record the properties read instead of applying the profiles, defaults to False
+        """
+        self.profiles: Dict[str, CacheProfile] = dict(profiles or {})
+        self.record = record
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> Optional[str]:
+        """Key of the innermost scope of the calling thread
+
+        :return: Scope key, None outside of scopes
+        """
+        keys = getattr(self._local, "keys", None)
+        return keys[-1] if keys else None
+
+    @contextmanager
+    def scope(self, key: str) -> Iterator[None]:
+        """Attributes the reads and finds of the calling thread within the context to the key.
+
+        :param key: Page object or locator name
+        """
+        keys = getattr(self._local, "keys", None)
+        if keys is None:
+            keys = self._local.keys = []
+        keys.append(key)
+        try:
+            yield
+        finally:
+            keys.pop()
+
+    def fetch(self, element: Any, name: str, fetch: Callable[[], Any]) -> Callable[[], Any]:
+        """Hook of the wrapper property reads: records the read, or routes it to the UIA cache if it was prefetched.
+
+        :param element: Element wrapper
+        :param name: Wrapper property name
+        :param fetch: Reads the property from the element
+        :return: Function reading the property
+        """
+        if self.record:
+            key = self.current
+            if key is not None and name in UIA_PROPERTIES:
+                with self._lock:
+                    profile = self.profiles.setdefault(key, CacheProfile())
+                    if name not in profile.properties:
+                        profile.properties.append(name)
+            return fetch
+        profile = element._cache_profile
+        if profile is None or not profile.covers(name):
+            return fetch
+
+        def cached() -> Any:
+            """Reads the property with the CacheRequest of the profile active."""
+            with profile.request(element.raw_element).activate():
+                return fetch()
+
+        return cached
+
+    def resolve(self, element: Any, find: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        """Hook of the find_* methods: runs the find under the CacheRequest of the current scope.
+
+        :param element: Element wrapper the find is called on
+        :param find: Find method
+        :param args: Positional arguments
+        :param kwargs: Keyword arguments
+        :return: Found element(s), tagged with the profile they were prefetched with
+        """
+        key = self.current
+        profile = None if self.record or key is None else self.profiles.get(key)
+        if profile is None or not profile.properties:
+            return find(element, *args, **kwargs)
+        with profile.request(element.raw_element).activate():
+            found = find(element, *args, **kwargs)
+        for _ in found if isinstance(found, list) else [found]:
+            _._cache_profile = profile
+        return found
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Writes the profiles as JSON.
+
+        :param path: Output file path
+        :return: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {key: sorted(profile.properties) for key, profile in sorted(self.profiles.items())}
+        path.write_text(
+            json.dumps({"format": PROFILES_FORMAT, "version": PROFILES_VERSION, "profiles": data}, indent=2),
+            encoding="utf-8",
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path], record: bool = False) -> CacheProfiles:
+        """Reads profiles written by `save`.
+
+        :param path: Profiles file path
+        :param record: Record further reads into the loaded profiles instead of applying them, defaults to False
+        :raises ValueError: If the file is not a profiles file or has an unsupported version
+        :return: The profiles
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("format") != PROFILES_FORMAT or data.get("version") != PROFILES_VERSION:
+            raise ValueError(f"{path} is not a version {PROFILES_VERSION} {PROFILES_FORMAT} file")
+        profiles = {
+            key: CacheProfile(properties=[_ for _ in names if _ in UIA_PROPERTIES])
+            for key, names in data["profiles"].items()
+        }
+        return cls(profiles=profiles, record=record)
+
+
+# The active profiles, checked on every profiled read and find, None while profiling is off
+active: Optional[CacheProfiles] = None
+# Where the active profiles are saved on `disable()` while recording
+_path: Optional[Path] = None
+
+
+def enable(path: Optional[Union[str, Path]] = None, record: bool = False) -> CacheProfiles:
+    """Starts recording or applying profiles.
+
+    :param path: Profiles file, loaded if it exists (recording extends the loaded profiles) and written on `disable()`
+        while recording, defaults to None
+    :param record: Record the properties read instead of applying the profiles, defaults to False
+    :return: The active profiles
+    """
+    global active, _path
+    _path = Path(path) if path is not None else None
+    active = (
+        CacheProfiles.load(_path, record=record)
+        if _path is not None and _path.exists()
+        else CacheProfiles(record=record)
+    )
+    return active
+
+
+def disable() -> Optional[CacheProfiles]:
+    """Stops recording or applying profiles, recorded profiles are saved to the path given to `enable`.
+
+    :return: The profiles which were active, if any
+    """
+    global active, _path
+    profiles, active = active, None
+    if profiles is not None and profiles.record and _path is not None:
+        profiles.save(_path)
+    _path = None
+    return profiles
+
+
+@contextmanager
+def scope(key: str) -> Iterator[None]:
+    """Attributes the reads and finds within the context to the key, does nothing while profiling is off.
+
+    :param key: Page object or locator name
+    """
+    profiles = active
+    if profiles is None:
+        yield
+        return
+    with profiles.scope(key):
+        yield
+
+
+def prefetches(func: F) -> F:
+    """Decorator for find methods, runs them under the CacheRequest of the current scope while profiles are applied.
+
+    :param func: Find method
+    :return: Decorated method
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        """Runs the find, through the active profiles if any."""
+        profiles = active
+        if profiles is None:
+            return func(self, *args, **kwargs)
+        return profiles.resolve(self, func, args, kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,535 @@
+"""This module records the .NET call traffic of a real session and replays it without Windows.
+
+`CallRecorder.wrap` returns a proxy around a C# object (`raw_element`, `cs_automation`, conditions, ...). Every property
+read, method call and property write made through the proxy is recorded with its arguments, return value, exception
+and duration, and every C# object returned is wrapped as well, so the whole object graph reached from the roots is
+recorded. Elements are recorded with their identity (AutomationId/ControlType).
+
+`CallReplay` serves the recorded responses deterministically: calls are matched on the object, the member and the
+arguments, repeated calls get the recorded responses in order and the last one once they are used up. Replayed
+objects pass the isinstance checks of the wrappers, so the wrappers run unchanged on top of them. On platforms
+without .NET, the `clr`, `System` and `FlaUI` modules imported by the wrappers have to be stood in for before importing
+them, as the simulated backend of the repository benchmarks does (it is not part of the installed package).
+
+Traces are stored as gzip compressed JSON lines: a header, then one line per object and per call.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+import gzip
+import importlib
+import inspect
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, Tuple, Union
+
+TRACE_FORMAT = "flaui-call-trace"
+TRACE_VERSION = 1
+
+ReplayTiming = Literal["none", "recorded"]
+
+_PRIMITIVES = (type(None), bool, int, float, str)
+
+
+def _type_name(value: Any) -> str:
+    """Full name of the type of a value, eg. FlaUI.Core.AutomationElements.AutomationElement.
+
+    :param value: Value
+    :return: Module and qualified name of the type
+    """
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def _resolve(path: str) -> Any:
+    """Resolves a dotted path to an object, the longest importable prefix being the module.
+
+    :param path: Dotted path, eg. FlaUI.Core.Definitions.ControlType.Button
+    :raises ImportError: If no prefix of the path can be imported
+    :return: Resolved object
+    """
+    parts = path.split(".")
+    for split in range(len(parts) - 1, 0, -1):
+        try:
+            value = importlib.import_module(".".join(parts[:split]))
+        except ImportError:
+            continue
+        for part in parts[split:]:
+            value = getattr(value, part)
+        return value
+    raise ImportError(f"Cannot resolve {path}")
+
+
+@lru_cache(maxsize=None)
+def _cs_type(path: str) -> Optional[type]:
+    """Resolves a C# type, None if Python.NET is not available.
+
+    :param path: Full type name, eg. System.Enum
+    :return: C# type
+    """
+    try:
+        cs_type = _resolve(path)
+    except (ImportError, AttributeError):
+        return None
+    return cs_type if isinstance(cs_type, type) else None
+
+
+def _is_cs_instance(value: Any, path: str) -> bool:
+    """Checks whether a value is an instance of a C# type.
+
+    :param value: Value
+    :param path: Full type name, eg. System.Enum
+    :return: True for instances of the type, False if Python.NET is not available
+    """
+    cs_type = _cs_type(path)
+    return cs_type is not None and isinstance(value, cs_type)
+
+
+def _enum_path(value: Any) -> Optional[str]:
+    """Dotted path of an enum value: C# enum values and the enum member types of the simulated backend.
+
+    :param value: Value
+    :return: Dotted path, None if the value is not an enum value
+    """
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if _is_cs_instance(value, "System.Enum"):
+        return f"{type(value).__module__}.{type(value).__name__}.{value.ToString()}"
+    return None
+
+
+def _is_method(value: Any) -> bool:
+    """Checks whether a member value is a method (Python.NET method bindings included), which is recorded per call.
+
+    :param value: Member value
+    :return: True for methods
+    """
+    return inspect.isroutine(value) or type(value).__name__ in ("MethodBinding", "MethodObject")
+
+
+def _is_collection(value: Any) -> bool:
+    """Checks whether a value is a collection which is recorded item by item (Python sequences, C# enumerables).
+
+    :param value: Value
+    :return: True for collections
+    """
+    return isinstance(value, (list, tuple)) or (
+        not isinstance(value, str) and _is_cs_instance(value, "System.Collections.IEnumerable")
+    )
+
+
+def _identity(target: Any) -> Optional[str]:
+    """Identity of an element as AutomationId/ControlType, read from the unwrapped object without being recorded.
+
+    :param target: Unwrapped C# object
+    :return: Element identity, None for other objects
+    """
+    try:
+        properties = target.Properties
+        return f"{properties.AutomationId.ValueOrDefault}/{properties.ControlType.ValueOrDefault}"
+    except Exception:
+        return None
+
+
+class RecordingProxy:
+    """Proxy recording every member access of the wrapped object, reports the wrapped type as its class."""
+
+    __slots__ = ("_target", "_recorder", "_ref")
+
+    def __init__(self, target: Any, recorder: CallRecorder, ref: int) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_ref", ref)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        """The class of the wrapped object, so the proxy passes isinstance checks."""
+        return type(self._target)
+
+    def __getattr__(self, name: str) -> Any:
+        """Reads an attribute of the wrapped object, methods are returned as recording callables."""
+        start = self._recorder.clock()
+        try:
+            value = getattr(self._target, name)
+        except Exception as exc:
+            self._recorder.record(self._ref, "g", name, [], None, exc, start)
+            raise
+        if _is_method(value):
+            return self._recorder.recording_method(self._ref, name, value)
+        return self._recorder.record(self._ref, "g", name, [], value, None, start)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Writes and records a property of the wrapped object."""
+        start = self._recorder.clock()
+        setattr(self._target, name, _unwrap(value))
+        self._recorder.record(self._ref, "s", name, [value], None, None, start)
+
+    def __repr__(self) -> str:
+        """Names the proxy and the wrapped object."""
+        return f"<recorded #{self._ref} {self._target!r}>"
+
+
+def _unwrap(value: Any) -> Any:
+    """Replaces recording proxies by the wrapped objects before they are handed to .NET.
+
+    :param value: Argument value
+    :return: Unwrapped value
+    """
+    if type(value) is RecordingProxy:
+        return object.__getattribute__(value, "_target")
+    if isinstance(value, list):
+        return [_unwrap(_) for _ in value]
+    return value
+
+
+class CallRecorder:
+    """Records the calls made on wrapped C# objects."""
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        """Creates a recorder.
+
+        :param clock: Monotonic clock in nanoseconds, defaults to time.perf_counter_ns
+        """
+        self.clock = clock
+        self.roots: Dict[str, int] = {}
+        self._objects: List[Dict[str, Any]] = []
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of recorded calls."""
+        return len(self._events)
+
+    def wrap(self, target: Any, label: Optional[str] = None) -> Any:
+        """Wraps a C# object, calls made through the returned proxy are recorded.
+
+        :param target: C# object
+        :param label: Root label to find the object again on replay, eg. "automation" or "main_window"
+        :return: Recording proxy
+        """
+        if type(target) is RecordingProxy:
+            proxy = target
+        else:
+            with self._lock:
+                ref = len(self._objects)
+                self._objects.append({"o": ref, "t": _type_name(target), "id": _identity(target)})
+            proxy = RecordingProxy(target, self, ref)
+        if label is not None:
+            self.roots[label] = object.__getattribute__(proxy, "_ref")
+        return proxy
+
+    def wrap_automation(self, automation: Any) -> Any:
+        """Records the calls of an `Automation` wrapper: its C# automation, condition factory and tree walker.
+
+        :param automation: flaui.modules.automation.Automation instance
+        :return: The automation
+        """
+        from flaui.core.condition_factory import ConditionFactory
+
+        automation.cs_automation = self.wrap(automation.cs_automation, "automation")
+        automation.cf = ConditionFactory(raw_cf=automation.cs_automation.ConditionFactory)
+        automation.tree_walker = automation.cs_automation.TreeWalkerFactory.GetRawViewWalker()
+        return automation
+
+    def wrap_element(self, element: Any, label: str) -> Any:
+        """Returns a copy of an element wrapper whose raw element is recorded.
+
+        :param element: Element wrapper (eg. Window)
+        :param label: Root label to find the element again on replay
+        :return: Element wrapper of the same class
+        """
+        return type(element)(raw_element=self.wrap(element.raw_element, label))
+
+    def recording_method(self, ref: int, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wraps a method of a recorded object so its calls are recorded.
+
+        :param ref: Reference of the object
+        :param name: Method name
+        :param method: Bound C# method
+        :return: Recording method
+        """
+
+        def call(*args: Any) -> Any:
+            """Calls the method with unwrapped arguments and records the call."""
+            start = self.clock()
+            try:
+                value = method(*[_unwrap(_) for _ in args])
+            except Exception as exc:
+                self.record(ref, "c", name, list(args), None, exc, start)
+                raise
+            return self.record(ref, "c", name, list(args), value, None, start)
+
+        return call
+
+    def record(
+        self, ref: int, kind: str, name: str, args: List[Any], value: Any, exc: Optional[Exception], start: int
+    ) -> Any:
+        """Records a member access and wraps the returned value.
+
+        :param ref: Reference of the object
+        :param kind: "g" (property read), "c" (method call) or "s" (property write)
+        :param name: Member name
+        :param args: Arguments as passed by the caller
+        :param value: Returned value
+        :param exc: Raised exception, if any
+        :param start: Clock reading at the start of the access
+        :return: The returned value, C# objects wrapped in recording proxies
+        """
+        duration = self.clock() - start
+        event: Dict[str, Any] = {"r": ref, "k": kind, "m": name, "d": duration}
+        if args:
+            event["a"] = [self._encode_argument(_) for _ in args]
+        if exc is not None:
+            event["x"] = [_type_name(exc), str(exc)]
+            returned = None
+        else:
+            event["v"], returned = self._encode(value)
+        with self._lock:
+            self._events.append(event)
+        return returned
+
+    def _encode(self, value: Any) -> Tuple[Any, Any]:
+        """Encodes a returned value, C# objects are registered and wrapped.
+
+        :param value: Returned value
+        :return: Tuple[encoded value, value handed to the caller]
+        """
+        if isinstance(value, _PRIMITIVES):
+            return value, value
+        if type(value) is RecordingProxy:
+            return {"ref": object.__getattribute__(value, "_ref")}, value
+        path = _enum_path(value)
+        if path is not None:
+            return {"enum": path}, value
+        if _is_collection(value):
+            encoded = [self._encode(_) for _ in value]
+            return {"list": [_[0] for _ in encoded]}, [_[1] for _ in encoded]
+        proxy = self.wrap(value)
+        return {"ref": object.__getattribute__(proxy, "_ref")}, proxy
+
+    def _encode_argument(self, value: Any) -> Any:
+        """Encodes an argument, objects which were not recorded are only kept by type name.
+
+        :param value: Argument value
+        :return: Encoded value
+        """
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if type(value) is RecordingProxy:
+            return {"ref": object.__getattribute__(value, "_ref")}
+        path = _enum_path(value)
+        if path is not None:
+            return {"enum": path}
+        if isinstance(value, (list, tuple)):
+            return {"list": [self._encode_argument(_) for _ in value]}
+        return {"py": _type_name(value)}
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Writes the trace as gzip compressed JSON lines.
+
+        :param path: Output file path, eg. session.trace.jsonl.gz
+        :return: Output file path
+        """
+        path = Path(path)
+        with self._lock, gzip.open(path, "wt", encoding="utf-8") as stream:
+            header = {"format": TRACE_FORMAT, "version": TRACE_VERSION, "roots": self.roots}
+            for line in [header, *self._objects, *self._events]:
+                stream.write(json.dumps(line, separators=(",", ":")) + "\n")
+        return path
+
+
+class ReplayObject:
+    """Replayed C# object, reports the recorded type as its class when it can be resolved."""
+
+    __slots__ = ("_replay", "_ref")
+
+    def __init__(self, replay: CallReplay, ref: int) -> None:
+        object.__setattr__(self, "_replay", replay)
+        object.__setattr__(self, "_ref", ref)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        """The recorded class, so the object passes the isinstance checks of the wrappers."""
+        return self._replay.type_of(self._ref)
+
+    def __getattr__(self, name: str) -> Any:
+        """Serves the recorded response of an attribute read or method call."""
+        return self._replay.access(self._ref, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Ignores property writes, they have no response to serve."""
+
+    def __repr__(self) -> str:
+        """Names the replayed object and its recorded type."""
+        return f"<replayed #{self._ref} {self._replay.objects[self._ref]['t']}>"
+
+
+class CallReplay:
+    """Serves recorded responses deterministically."""
+
+    def __init__(
+        self,
+        header: Dict[str, Any],
+        objects: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        timing: ReplayTiming = "none",
+        speed: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Creates a replay from the lines of a trace, see `load`.
+
+        :param header: Trace header
+        :param objects: Recorded objects
+        :param events: Recorded calls
+        :param timing: "recorded" waits the recorded duration of every call, "none" answers at once, defaults to "none"
+        :param speed: Speed-up factor of the recorded timing, defaults to 1.0
+        :param sleep: Sleep function in seconds, defaults to time.sleep
+        """
+        self.roots: Dict[str, int] = header.get("roots", {})
+        self.objects = {_["o"]: _ for _ in objects}
+        self.timing = timing
+        self.speed = speed
+        self._sleep = sleep
+        self._types: Dict[int, type] = {}
+        self._methods: Dict[Tuple[int, str], bool] = {}
+        self._responses: Dict[Tuple[int, str, str], Deque[Dict[str, Any]]] = {}
+        for event in events:
+            if event["k"] == "s":
+                continue
+            self._methods.setdefault((event["r"], event["m"]), event["k"] == "c")
+            for key in ((event["r"], event["m"], self._key(event.get("a", []))), (event["r"], event["m"], "*")):
+                self._responses.setdefault(key, deque()).append(event)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], timing: ReplayTiming = "none", speed: float = 1.0) -> CallReplay:
+        """Reads a trace written by `CallRecorder.save`.
+
+        :param path: Trace file path
+        :param timing: "recorded" waits the recorded duration of every call, "none" answers at once, defaults to "none"
+        :param speed: Speed-up factor of the recorded timing, defaults to 1.0
+        :raises ValueError: If the file is not a trace or has an unsupported version
+        :return: The replay
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as stream:
+            lines = [json.loads(_) for _ in stream if _.strip()]
+        header = lines[0] if lines else {}
+        if header.get("format") != TRACE_FORMAT or header.get("version") != TRACE_VERSION:
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} {TRACE_FORMAT} file")
+        objects = [_ for _ in lines[1:] if "o" in _]
+        events = [_ for _ in lines[1:] if "r" in _]
+        return cls(header, objects, events, timing=timing, speed=speed)
+
+    @staticmethod
+    def _key(arguments: List[Any]) -> str:
+        """Matching key of encoded arguments.
+
+        :param arguments: Encoded arguments
+        :return: Key
+        """
+        return json.dumps(arguments, separators=(",", ":"))
+
+    def root(self, label: str) -> ReplayObject:
+        """Returns a recorded root object.
+
+        :param label: Root label given on recording
+        :return: Replayed object
+        """
+        return ReplayObject(self, self.roots[label])
+
+    def type_of(self, ref: int) -> type:
+        """Resolves the recorded type of an object, ReplayObject if the type is not available.
+
+        :param ref: Reference of the object
+        :return: Type
+        """
+        if ref not in self._types:
+            try:
+                resolved = _resolve(self.objects[ref]["t"])
+            except (ImportError, AttributeError):
+                resolved = ReplayObject
+            self._types[ref] = resolved if isinstance(resolved, type) else ReplayObject
+        return self._types[ref]
+
+    def access(self, ref: int, name: str) -> Any:
+        """Serves a property read or returns the replayed method.
+
+        :param ref: Reference of the object
+        :param name: Member name
+        :raises AttributeError: If the member was never accessed while recording
+        :return: Property value or method
+        """
+        is_method = self._methods.get((ref, name))
+        if is_method is None:
+            raise AttributeError(f"No recorded access to {self.objects[ref]['t']}.{name}")
+        if is_method:
+            return lambda *args: self._serve(ref, name, args)
+        return self._serve(ref, name, ())
+
+    def _serve(self, ref: int, name: str, args: Tuple[Any, ...]) -> Any:
+        """Serves the next recorded response of a member, matched on the arguments if they were recorded.
+
+        :param ref: Reference of the object
+        :param name: Member name
+        :param args: Arguments of the call
+        :raises LookupError: If the member was never called while recording
+        :return: Recorded return value, recorded exceptions are raised
+        """
+        with self._lock:
+            queue = self._responses.get((ref, name, self._key([self._encode_argument(_) for _ in args])))
+            if queue is None:
+                queue = self._responses[(ref, name, "*")]
+            event = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.timing == "recorded":
+            self._sleep(event["d"] / 1e9 / self.speed)
+        if "x" in event:
+            raise self._exception(*event["x"])
+        return self._decode(event["v"])
+
+    def _encode_argument(self, value: Any) -> Any:
+        """Encodes an argument the same way the recorder does.
+
+        :param value: Argument value
+        :return: Encoded value
+        """
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if type(value) is ReplayObject:
+            return {"ref": object.__getattribute__(value, "_ref")}
+        path = _enum_path(value)
+        if path is not None:
+            return {"enum": path}
+        if isinstance(value, (list, tuple)):
+            return {"list": [self._encode_argument(_) for _ in value]}
+        return {"py": _type_name(value)}
+
+    def _decode(self, value: Any) -> Any:
+        """Decodes a recorded value.
+
+        :param value: Encoded value
+        :return: Replayed value
+        """
+        if not isinstance(value, dict):
+            return value
+        if "ref" in value:
+            return ReplayObject(self, value["ref"])
+        if "list" in value:
+            return [self._decode(_) for _ in value["list"]]
+        return _resolve(value["enum"])
+
+    @staticmethod
+    def _exception(type_name: str, message: str) -> BaseException:
+        """Recreates a recorded exception, as a RuntimeError if its type is not available.
+
+        :param type_name: Full type name of the exception
+        :param message: Exception message
+        :return: Exception
+        """
+        try:
+            exc_type = _resolve(type_name)
+            return exc_type(message)
+        except Exception:
+            return RuntimeError(f"{type_name}: {message}")
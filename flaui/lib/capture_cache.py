@@ -0,0 +1,184 @@
+"""This module provides an opt-in cache for element captures (see `AutomationElement.capture_array`).
+
+While a capture cache is active, capturing the same element again returns the array captured before instead of going
+through GDI, as long as nothing happened which may have changed the screen. Entries are keyed by the element
+RuntimeId, its bounding rectangle (a moved or resized element is captured again) and the channel order, and are valid
+for one generation. The generation is bumped:
+- by the action methods of the wrappers (click, toggle, select, ...) and by `Mouse`, `Keyboard` and `Touch` input,
+- by structure-changed events of the subscribed elements, see `CaptureCache.subscribe`,
+- by `capture_cache.invalidate()`.
+
+Cached arrays are shared between callers and therefore read-only, copy them before modifying them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import functools
+import threading
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from flaui.lib.image_compare import to_rect
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_ENTRIES = 32
+
+
+class CaptureCache:
+    """Serves captures taken in the current generation, least recently used ones are evicted first."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Creates a capture cache.
+
+        :param max_entries: Maximum number of cached captures, defaults to DEFAULT_MAX_ENTRIES
+        """
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._subscriptions: List[Any] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached captures."""
+        return len(self._entries)
+
+    def key(self, element: Any, order: str) -> Optional[Tuple[Any, ...]]:
+        """Cache key of a capture of the element in the current generation.
+
+        :param element: Element wrapper
+        :param order: Channel order of the capture
+        :return: Key, None if the element has no RuntimeId
+        """
+        runtime_id = element.runtime_key
+        if runtime_id is None:
+            return None
+        return runtime_id, to_rect(element.bounding_rectangle), order, self.generation
+
+    def get(self, element: Any, order: str, capture: Callable[[], np.ndarray]) -> np.ndarray:
+        """Returns the cached capture of the element, captures and caches it if there is none.
+
+        :param element: Element wrapper
+        :param order: Channel order of the capture
+        :param capture: Captures the element
+        :return: Read-only (H, W, 4) uint8 array
+        """
+        key = self.key(element, order)
+        if key is None:
+            return capture()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        self.misses += 1
+        array = capture()
+        array.flags.writeable = False
+        with self._lock:
+            if key[-1] == self.generation:
+                self._entries[key] = array
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return array
+
+    def invalidate(self) -> None:
+        """Starts a new generation, the captures taken so far are not served anymore."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def subscribe(self, element: Any) -> Any:
+        """Starts a new generation whenever the structure of the subtree of the element changes.
+
+        :param element: Element wrapper, eg. the main window
+        :return: Registered FlaUI event handler, disposed by `unsubscribe_all`
+        """
+        from flaui.core.definitions import TreeScope
+
+        handler = element.register_structure_changed_event(TreeScope.Subtree, lambda *args: self.invalidate())
+        with self._lock:
+            self._subscriptions.append(handler)
+        return handler
+
+    def unsubscribe_all(self) -> None:
+        """Disposes all structure-changed event handlers registered by `subscribe`."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for handler in subscriptions:
+            handler.Dispose()
+
+
+# The active capture cache, checked on every capture, None while captures are not cached
+active: Optional[CaptureCache] = None
+
+
+def enable(max_entries: int = DEFAULT_MAX_ENTRIES) -> CaptureCache:
+    """Starts caching captures with a new capture cache.
+
+    :param max_entries: Maximum number of cached captures, defaults to DEFAULT_MAX_ENTRIES
+    :return: The active capture cache
+    """
+    global active
+    active = CaptureCache(max_entries=max_entries)
+    return active
+
+
+def disable() -> Optional[CaptureCache]:
+    """Stops caching captures, the event handlers of the cache are disposed.
+
+    :return: The capture cache which was active, if any
+    """
+    global active
+    cache, active = active, None
+    if cache is not None:
+        cache.unsubscribe_all()
+    return cache
+
+
+@contextmanager
+def cache_captures(max_entries: int = DEFAULT_MAX_ENTRIES) -> Iterator[CaptureCache]:
+    """Caches captures within the context, the previously active capture cache (if any) is restored on exit.
+
+    :param max_entries: Maximum number of cached captures, defaults to DEFAULT_MAX_ENTRIES
+    :return: The active capture cache
+    """
+    global active
+    previous = active
+    cache = enable(max_entries=max_entries)
+    try:
+        yield cache
+    finally:
+        cache.unsubscribe_all()
+        active = previous
+
+
+def invalidate() -> None:
+    """Starts a new generation of the active capture cache, if any."""
+    cache = active
+    if cache is not None:
+        cache.invalidate()
+
+
+def invalidates_captures(func: F) -> F:
+    """Decorator for input methods, starts a new capture generation once the input was sent (or failed).
+
+    :param func: Input method
+    :return: Decorated method
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """Runs the input method, then invalidates the active capture cache."""
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if active is not None:
+                active.invalidate()
+
+    return wrapper  # type: ignore[return-value]
@@ -1,49 +1,241 @@
 """This module contains collections which can effective handle data transition between C# and Python."""
 
-from datetime import date
-from typing import Any, Dict, List
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-import arrow
-from System import DateTime as CSDateTime, TimeSpan  # pyright: ignore[reportMissingImports]
+from System import (  # pyright: ignore[reportMissingImports]
+    Array,
+    DateTime as CSDateTime,
+    DateTimeKind,
+    Object,
+    String,
+    TimeSpan,
+    Type,
+    TypeCode,
+)
+from System.Collections import ICollection  # pyright: ignore[reportMissingImports]
+
+# Type codes of .NET primitives which Python.NET exposes through the buffer protocol
+_BUFFER_TYPE_CODES = frozenset(
+    {
+        TypeCode.Boolean,
+        TypeCode.SByte,
+        TypeCode.Byte,
+        TypeCode.Int16,
+        TypeCode.UInt16,
+        TypeCode.Int32,
+        TypeCode.UInt32,
+        TypeCode.Int64,
+        TypeCode.UInt64,
+        TypeCode.Single,
+        TypeCode.Double,
+    }
+)
+
+# Below this many items the fixed cost of the bulk conversion (reflection, CopyTo) outweighs the per-item cost
+_BULK_THRESHOLD = 64
+
+# Separator used to marshal a string array as a single joined string (ASCII unit separator)
+_STRING_SEPARATOR = "\x1f"
+
+# .NET ticks are 100 ns intervals since 0001-01-01 00:00:00, the same epoch as Python's proleptic Gregorian ordinals
+_TICKS_PER_MICROSECOND = 10
+_TICKS_PER_DAY = 864_000_000_000
+_DATETIME_MIN = datetime(1, 1, 1)
+
+# DateTime.ToBinary/FromBinary store the ticks in the low 62 bits and the DateTimeKind in the top 2
+_KIND_UTC_FLAG = 0x4000_0000_0000_0000
 
 
 class TypeCast:
     """A class that provides methods to convert C# objects to Python objects"""
 
+    @staticmethod
+    def _py_list_from_array(raw: Any) -> List[Any]:
+        """Converts a C# array to a Python list, marshalling primitive and string arrays in a single step.
+
+        :param raw: Raw C# array object
+        :return: Converted Python List object
+        """
+        if raw.Rank == 1:
+            type_code = Type.GetTypeCode(raw.GetType().GetElementType())
+            if type_code in _BUFFER_TYPE_CODES:
+                try:
+                    return memoryview(raw).tolist()
+                except (TypeError, BufferError, NotImplementedError):
+                    pass
+            elif type_code == TypeCode.String and raw.Length > 0 and Array.IndexOf(raw, None) < 0:
+                values = str(String.Join(_STRING_SEPARATOR, raw)).split(_STRING_SEPARATOR)
+                if len(values) == raw.Length:
+                    return values
+        return list(raw)
+
+    @staticmethod
+    def _copy_to_array(raw: Any) -> Any:
+        """Copies a C# collection into a pre-sized C# array of its element type using CopyTo.
+
+        :param raw: Raw C# ICollection/ICollection<T> object
+        :return: C# array holding the collection items
+        """
+        # Interface typed objects only expose the interface members, CopyTo/GetType live on the implementation
+        raw = getattr(raw, "__implementation__", raw)
+        generic_collection = raw.GetType().GetInterface("ICollection`1")
+        if generic_collection is not None:
+            buffer = Array.CreateInstance(generic_collection.GetGenericArguments()[0], raw.Count)
+            raw.CopyTo(buffer, 0)
+        else:
+            buffer = Array.CreateInstance(Object, raw.Count)
+            ICollection(raw).CopyTo(buffer, 0)
+        return buffer
+
     @staticmethod
     def py_list(raw: Any) -> List[Any]:
         """Converts C# Lists to Python lists
 
+        Arrays are converted directly, other collections (List<T>, IList, key/value collections) are first copied into a
+        pre-sized array via CopyTo. Arrays of primitives (int, double, ...) and strings are marshalled in one step.
+        Small collections and anything else fall back to enumerating the items one by one.
+
         :param raw: Raw C# list object
         :return: Converted Python List object
         """
-        return raw if isinstance(raw, list) else list(map(lambda x: x, raw))
+        if isinstance(raw, list):
+            return raw
+        try:
+            if isinstance(raw, Array):
+                if raw.Length >= _BULK_THRESHOLD:
+                    return TypeCast._py_list_from_array(raw)
+            elif hasattr(raw, "Count") and hasattr(raw, "CopyTo") and raw.Count >= _BULK_THRESHOLD:
+                return TypeCast._py_list_from_array(TypeCast._copy_to_array(raw))
+        except Exception:
+            # Some collections (eg. interface proxies) do not expose their runtime type, enumerate those instead
+            pass
+        return list(raw)
 
     @staticmethod
     def py_dict(raw: Any) -> Dict[Any, Any]:
         """Converts C# Dict to Python Dict
 
+        Keys and values are converted as two bulk collections instead of enumerating one KeyValuePair at a time.
+
         :param raw: Raw C# Dict object
         :return: Converted Python Dict object
         """
-        return raw if isinstance(raw, dict) else {_.Key: _.Value for _ in raw.GetEnumerator()}
+        if isinstance(raw, dict):
+            return raw
+        if raw.Count < _BULK_THRESHOLD:
+            return {_.Key: _.Value for _ in raw.GetEnumerator()}
+        keys, values = TypeCast.py_list(raw.Keys), TypeCast.py_list(raw.Values)
+        if len(keys) != len(values):
+            return {_.Key: _.Value for _ in raw.GetEnumerator()}
+        return dict(zip(keys, values))  # noqa: B905, lengths are checked above
 
     @staticmethod
-    def cs_timespan(value: int) -> Any:
-        """Converts a Python time milliseconds value to C# TimeSpan object
+    def _datetime_ticks(value: Union[date, datetime]) -> int:
+        """Converts a Python date/datetime to the 64 bit System.DateTime representation (ticks and kind flag).
+
+        Naive values map to DateTimeKind.Unspecified, timezone aware values are converted to UTC (DateTimeKind.Utc).
 
-        :param value: Time in milliseconds
+        :param value: Python date or datetime
+        :return: Ticks with the DateTimeKind flag set
+        """
+        if not isinstance(value, datetime):
+            return (value.toordinal() - 1) * _TICKS_PER_DAY
+        flag = 0
+        if value.tzinfo is not None and value.utcoffset() is not None:
+            value, flag = value.astimezone(timezone.utc).replace(tzinfo=None), _KIND_UTC_FLAG
+        return TypeCast.cs_ticks(value - _DATETIME_MIN) | flag
+
+    @staticmethod
+    def cs_ticks(value: timedelta) -> int:
+        """Converts a Python timedelta to .NET ticks (100 ns intervals)
+
+        :param value: Python timedelta
+        :return: Number of ticks
+        """
+        return (value.days * 86_400 + value.seconds) * 10_000_000 + value.microseconds * _TICKS_PER_MICROSECOND
+
+    @staticmethod
+    def cs_timespan(value: Union[int, float, timedelta, None]) -> Any:
+        """Converts a Python time milliseconds value or timedelta to C# TimeSpan object
+
+        :param value: Time in milliseconds or Python timedelta
         :return: TimeSpan object from C# System
         """
         if value is None:
             return None
+        if isinstance(value, timedelta):
+            return TimeSpan.FromTicks(TypeCast.cs_ticks(value))
 
         return TimeSpan.FromMilliseconds(value)
 
     @staticmethod
-    def cs_datetime(date: date):
-        """Parses Python date as C# Datetime object
+    def cs_datetime(date: Union[date, datetime]) -> Any:
+        """Converts a Python date/datetime to C# DateTime object using ticks, no string formatting or parsing involved.
+
+        Naive values are created as DateTimeKind.Unspecified, timezone aware values are converted to UTC.
+
+        :param date: Python date or datetime
+        :return: DateTime object from C# System
+        """
+        return CSDateTime.FromBinary(TypeCast._datetime_ticks(date))
+
+    @staticmethod
+    def cs_datetimes(dates: Iterable[Union[date, datetime]]) -> Any:
+        """Converts Python dates/datetimes to a C# DateTime array.
+
+        Every item is built from its ticks, no string formatting or parsing involved. The array is never pinned and
+        copied in bulk: System.DateTime has an automatic layout, which .NET Framework refuses to pin.
+
+        :param dates: Python dates or datetimes
+        :return: DateTime[] array from C# System
+        """
+        return Array[CSDateTime]([CSDateTime.FromBinary(TypeCast._datetime_ticks(_)) for _ in dates])
+
+    @staticmethod
+    def py_timedelta(raw: Any) -> Optional[timedelta]:
+        """Converts C# TimeSpan to Python timedelta, truncated to microseconds
+
+        :param raw: Raw C# TimeSpan object
+        :return: Python timedelta, None if raw is None
+        """
+        if raw is None:
+            return None
+        return timedelta(microseconds=raw.Ticks // _TICKS_PER_MICROSECOND)
+
+    @staticmethod
+    def py_datetime(raw: Any) -> Optional[datetime]:
+        """Converts C# DateTime to Python datetime, truncated to microseconds.
+
+        DateTimeKind.Utc values are returned timezone aware (UTC), Local and Unspecified values are returned naive.
+
+        :param raw: Raw C# DateTime object
+        :return: Python datetime, None if raw is None
+        """
+        if raw is None:
+            return None
+        value = _DATETIME_MIN + timedelta(microseconds=raw.Ticks // _TICKS_PER_MICROSECOND)
+        return value.replace(tzinfo=timezone.utc) if raw.Kind == DateTimeKind.Utc else value
+
+    @staticmethod
+    def py_date(raw: Any) -> Optional[date]:
+        """Converts C# DateTime to Python date, dropping the time of day
+
+        :param raw: Raw C# DateTime object
+        :return: Python date, None if raw is None
+        """
+        if raw is None:
+            return None
+        return date.fromordinal(raw.Ticks // _TICKS_PER_DAY + 1)
+
+    @staticmethod
+    def py_dates(raw: Any) -> List[date]:
+        """Converts a C# DateTime collection to Python dates, dropping the time of day.
+
+        Only the ticks of every item are read, no string formatting or parsing involved (see `cs_datetimes` on why
+        DateTime arrays are not copied in bulk).
 
-        :param date: Python date
+        :param raw: Raw C# DateTime array or collection
+        :return: Python dates
         """
-        return CSDateTime.Parse(arrow.get(date).strftime("%Y-%m-%d"))
+        return [date.fromordinal(_.Ticks // _TICKS_PER_DAY + 1) for _ in raw]
@@ -6,18 +6,24 @@ from pathlib import Path
 from pydantic_settings import BaseSettings
 
 
+class VideoRecordingMode(Enum):
+    """Defines how videos should be recorded for the tests."""
+
+    NONE = None
+    ONEPERTEST = "OnePerTest"
+    ONEPERFIXTURE = "OnePerFixture"
+
+
 class Settings(BaseSettings):
     """Holds all common settings for the tool"""
 
     BIN_HOME: Path = Path(__file__).parent.parent.parent.joinpath("flaui", "bin")
+    # On-disk index of assembly metadata, keyed by file mtime and size, used to skip metadata reads on warm starts
+    ASSEMBLY_INDEX_PATH: Path = Path.home().joinpath(".cache", "flaui", "assembly_index.json")
+    # Test videos recorded by the flaui.lib.pytest_video plugin
+    VIDEO_RECORDING_MODE: VideoRecordingMode = VideoRecordingMode.NONE
+    VIDEO_OUTPUT_DIR: Path = Path("videos")
+    VIDEO_FPS: float = 5.0
 
 
 settings = Settings()
-
-
-class VideoRecordingMode(Enum):
-    """Defines how videos should be recorded for the tests."""
-
-    NONE = None
-    ONEPERTEST = "OnePerTest"
-    ONEPERFIXTURE = "OnePerFixture"
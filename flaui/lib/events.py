@@ -0,0 +1,373 @@
+"""This module buffers UIA events between the UIA callback threads and Python consumers.
+
+UIA invokes event handlers on its own threads, and chatty applications fire thousands of property-changed events per
+second. The callbacks built by `EventQueue.callback` therefore only append a compact `EventRecord` (the raw sender and
+event arguments, nothing is read from the element) to a bounded deque. Consumers drain it in batches, iterate over it
+or read it as an asyncio stream.
+
+When the queue is full, the overflow policy decides: "drop_oldest" discards the oldest record, "drop_newest" the
+incoming one, "block" makes the callback wait for room up to `block_timeout` (then drops the incoming record).
+Dropped records are counted.
+
+`EventCoalescer` merges bursts of property-changed events (a scrolling grid, an animated progress bar) per element
+and property into one update carrying the latest value, as fixed windows, debounced or throttled.
+
+Register the callbacks with the `register_*_event` methods of `AutomationElement` (or `Automation` for focus events),
+which accept an `EventQueue` in place of a callable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+)
+
+from flaui.lib.identity_map import RuntimeId, runtime_id
+
+EventKind = Literal[
+    "automation",
+    "property_changed",
+    "structure_changed",
+    "focus_changed",
+    "notification",
+    "active_text_position_changed",
+    "text_edit_text_changed",
+]
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+# "window": one update per key per window, "debounce": one update once a key is quiet for a window,
+# "throttle": the first update of a key at once, then at most one per window
+CoalesceMode = Literal["window", "debounce", "throttle"]
+
+DEFAULT_CAPACITY = 10_000
+
+
+class EventRecord(NamedTuple):
+    """A received event, kept as a tuple of the raw callback arguments to keep enqueueing cheap."""
+
+    kind: EventKind
+    time_ns: int  # time.perf_counter_ns() when the callback ran
+    sender: Any  # Raw C# element which raised the event
+    detail: Any = None  # EventId, PropertyId, StructureChangeType, NotificationKind, ... depending on the kind
+    value: Any = None  # New property value, runtime id of the changed child, ... depending on the kind
+
+    @property
+    def runtime_id(self) -> Optional[RuntimeId]:
+        """RuntimeId of the sender, read from the element
+
+        :return: RuntimeId, None if it cannot be read
+        """
+        return runtime_id(self.sender)
+
+    @property
+    def detail_name(self) -> Optional[str]:
+        """Name of the event, property, change type, ... the event is about
+
+        :return: Name, None if the event carries no detail
+        """
+        if self.detail is None:
+            return None
+        name = getattr(self.detail, "Name", None)
+        return name if isinstance(name, str) else str(self.detail)
+
+
+class EventQueue:
+    """Bounded queue of event records, filled by UIA callbacks and drained by Python consumers."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        policy: OverflowPolicy = "drop_oldest",
+        block_timeout: float = 1.0,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        """Creates an empty queue.
+
+        :param capacity: Maximum number of pending records, defaults to DEFAULT_CAPACITY
+        :param policy: What happens to records arriving while the queue is full, defaults to "drop_oldest"
+        :param block_timeout: Seconds a callback waits for room with the "block" policy, defaults to 1.0
+        :param clock: Nanosecond clock timestamping the records, defaults to time.perf_counter_ns
+        """
+        self.capacity = capacity
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.received = 0
+        self.dropped = 0
+        self.closed = False
+        self._clock = clock
+        # Appends and pops on a deque are atomic, producers and consumers never share a lock
+        self._records: Deque[EventRecord] = deque(maxlen=capacity if policy == "drop_oldest" else None)
+        # Set when records are available (or the queue is closed), cleared by consumers finding it empty
+        self._available = threading.Event()
+        # Set while there is room, only used by the "block" policy
+        self._room = threading.Event()
+        self._room.set()
+
+    def __len__(self) -> int:
+        """Number of pending records."""
+        return len(self._records)
+
+    def put(self, kind: EventKind, sender: Any, detail: Any = None, value: Any = None) -> None:
+        """Enqueues an event, called from the UIA callback threads.
+
+        :param kind: Event kind
+        :param sender: Raw C# element which raised the event
+        :param detail: Event, property, change type, ... the event is about, defaults to None
+        :param value: Event value, defaults to None
+        """
+        self.received += 1
+        if self.closed:
+            self.dropped += 1
+            return
+        records = self._records
+        if len(records) >= self.capacity:
+            if self.policy == "drop_oldest":
+                self.dropped += 1  # The deque discards the oldest record on append
+            elif self.policy == "drop_newest":
+                self.dropped += 1
+                return
+            else:
+                self._room.clear()
+                if len(records) >= self.capacity and not self._room.wait(self.block_timeout):
+                    self.dropped += 1
+                    return
+        records.append(EventRecord(kind, self._clock(), sender, detail, value))
+        if not self._available.is_set():
+            self._available.set()
+
+    def callback(self, kind: EventKind) -> Callable[..., None]:
+        """Builds a UIA event handler enqueueing the events of the given kind.
+
+        The handler takes the sender and up to two event arguments as detail and value, further arguments (eg. the
+        display string of a notification) are packed into the value as a tuple.
+
+        :param kind: Event kind
+        :return: Event handler
+        """
+        put = self.put
+
+        def on_event(sender: Any = None, detail: Any = None, value: Any = None, *rest: Any) -> None:
+            """Enqueues the event."""
+            put(kind, sender, detail, (value, *rest) if rest else value)
+
+        return on_event
+
+    def drain(self, max_items: Optional[int] = None) -> List[EventRecord]:
+        """Takes the pending records without waiting.
+
+        :param max_items: Maximum number of records taken, defaults to all pending records
+        :return: Records, oldest first
+        """
+        records = self._records
+        count = len(records) if max_items is None else min(max_items, len(records))
+        batch = []
+        popleft = records.popleft
+        try:
+            for _ in range(count):
+                batch.append(popleft())
+        except IndexError:
+            pass
+        if not records:
+            self._available.clear()
+            if records:  # A record arrived between the check and the clear
+                self._available.set()
+        if batch and not self._room.is_set():
+            self._room.set()
+        return batch
+
+    def get_batch(self, timeout: Optional[float] = None, max_items: Optional[int] = None) -> List[EventRecord]:
+        """Waits for records and takes them.
+
+        :param timeout: Seconds to wait for the first record, defaults to waiting until a record arrives or the queue
+            is closed
+        :param max_items: Maximum number of records taken, defaults to all pending records
+        :return: Records, oldest first, empty if none arrived in time
+        """
+        if not self._records and not self.closed:
+            self._available.wait(timeout)
+        return self.drain(max_items)
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        """Iterates over the records as they arrive, until the queue is closed and drained."""
+        while True:
+            batch = self.get_batch()
+            if not batch and self.closed:
+                return
+            yield from batch
+
+    async def stream(
+        self, max_items: Optional[int] = None, poll_interval: float = 0.005
+    ) -> AsyncIterator[List[EventRecord]]:
+        """Yields batches of records as they arrive, until the queue is closed and drained.
+
+        The UIA callbacks never touch the event loop, the stream polls the queue while it is empty.
+
+        :param max_items: Maximum number of records per batch, defaults to all pending records
+        :param poll_interval: Seconds between polls of an empty queue, defaults to 0.005
+        :return: Batches of records, oldest first
+        """
+        while True:
+            batch = self.drain(max_items)
+            if batch:
+                yield batch
+            elif self.closed:
+                return
+            else:
+                await asyncio.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Stops accepting records and wakes up waiting consumers, pending records can still be drained."""
+        self.closed = True
+        self._available.set()
+        self._room.set()
+
+
+class CoalescedEvent(NamedTuple):
+    """The latest of a burst of merged events."""
+
+    record: EventRecord  # Latest record of the burst
+    count: int  # Number of records merged
+    first_ns: int  # time_ns of the first record of the burst
+
+
+def property_key(record: EventRecord) -> Optional[Hashable]:
+    """Default coalescing key: (RuntimeId, property name) for property-changed events.
+
+    The RuntimeId is read from the sender, on the consumer thread.
+
+    :param record: Event record
+    :return: Key, None for events which are passed through unmerged
+    """
+    if record.kind != "property_changed":
+        return None
+    return record.runtime_id, record.detail_name
+
+
+class EventCoalescer:
+    """Merges events with the same key, keeping only the latest value of each burst."""
+
+    def __init__(
+        self,
+        window: float = 0.05,
+        mode: CoalesceMode = "window",
+        key: Callable[[EventRecord], Optional[Hashable]] = property_key,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        """Creates a coalescer.
+
+        :param window: Seconds of the coalescing window, defaults to 0.05
+        :param mode: When merged updates are emitted, defaults to "window"
+        :param key: Key of the events to merge, None passes an event through unmerged, defaults to property_key
+        :param clock: Nanosecond clock, the one timestamping the records, defaults to time.perf_counter_ns
+        """
+        self.window_ns = int(window * 1e9)
+        self.mode = mode
+        self.merged = 0
+        self._key = key
+        self._clock = clock
+        # Pending bursts by key, and the time of the last update emitted per key (throttle)
+        self._pending: Dict[Hashable, CoalescedEvent] = {}
+        self._emitted_ns: Dict[Hashable, int] = {}
+        self._ready: List[CoalescedEvent] = []
+
+    def __len__(self) -> int:
+        """Number of pending bursts."""
+        return len(self._pending)
+
+    def push(self, records: Iterable[EventRecord]) -> None:
+        """Adds records to the pending bursts.
+
+        :param records: Event records, oldest first
+        """
+        for record in records:
+            key = self._key(record)
+            if key is None:
+                self._ready.append(CoalescedEvent(record, 1, record.time_ns))
+                continue
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._pending[key] = CoalescedEvent(record, pending.count + 1, pending.first_ns)
+                self.merged += 1
+            elif (
+                self.mode == "throttle"
+                and record.time_ns - self._emitted_ns.get(key, -self.window_ns) >= self.window_ns
+            ):
+                self._ready.append(CoalescedEvent(record, 1, record.time_ns))
+                self._emitted_ns[key] = record.time_ns
+            else:
+                self._pending[key] = CoalescedEvent(record, 1, record.time_ns)
+
+    def _due_ns(self, key: Hashable, pending: CoalescedEvent) -> int:
+        """Time at which a pending burst is emitted.
+
+        :param key: Key of the burst
+        :param pending: Pending burst
+        :return: Clock time in ns
+        """
+        if self.mode == "debounce":
+            return pending.record.time_ns + self.window_ns
+        if self.mode == "throttle":
+            return self._emitted_ns.get(key, pending.first_ns - self.window_ns) + self.window_ns
+        return pending.first_ns + self.window_ns
+
+    def pop_ready(self, flush: bool = False) -> List[CoalescedEvent]:
+        """Takes the updates which are due, oldest burst first.
+
+        :param flush: Take all pending bursts, due or not, defaults to False
+        :return: Merged updates
+        """
+        now = self._clock()
+        due = [_ for _ in self._pending.items() if flush or self._due_ns(*_) <= now]
+        for key, _ in due:
+            del self._pending[key]
+            if self.mode == "throttle":
+                self._emitted_ns[key] = now
+        if self.mode == "throttle":
+            # Keys quiet for a whole window get their next update at once again
+            self._emitted_ns = {
+                key: emitted
+                for key, emitted in self._emitted_ns.items()
+                if now - emitted < self.window_ns or key in self._pending
+            }
+        ready, self._ready = self._ready + [pending for _, pending in due], []
+        ready.sort(key=lambda _: _.first_ns)
+        return ready
+
+    def next_due(self) -> Optional[float]:
+        """Seconds until the next pending burst is due.
+
+        :return: Seconds, 0 if updates are ready, None if nothing is pending
+        """
+        if self._ready:
+            return 0.0
+        if not self._pending:
+            return None
+        return max(min(self._due_ns(*_) for _ in self._pending.items()) - self._clock(), 0) / 1e9
+
+    def coalesce(self, queue: EventQueue) -> Iterator[List[CoalescedEvent]]:
+        """Drains the queue and yields the merged updates as they fall due, until the queue is closed and drained.
+
+        :param queue: Event queue
+        :return: Batches of merged updates
+        """
+        while True:
+            self.push(queue.get_batch(timeout=self.next_due()))
+            ready = self.pop_ready(flush=queue.closed and not len(queue))
+            if ready:
+                yield ready
+            elif queue.closed and not len(queue) and not self._pending:
+                return
@@ -20,6 +20,8 @@ from FlaUI.Core.Exceptions import (  # type: ignore
 )
 import System  # type: ignore
 
+from flaui.lib import tracing
+
 
 def handle_csharp_exceptions(
     func,
@@ -41,9 +43,10 @@ def handle_csharp_exceptions(
     :return: The wrapped function.
     """
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        """Wrapper function to handle C# FlaUI exceptions."""
+    name = getattr(func, "__qualname__", func.__name__)
+
+    def translated(*args, **kwargs) -> Any:
+        """Calls the function and translates C# FlaUI exceptions."""
         try:
             return func(*args, **kwargs)
         except CSharpProxyAssemblyNotLoadedException as e:
@@ -85,6 +88,14 @@ def handle_csharp_exceptions(
         except System.Exception as e:
             raise SystemException(f"The property or method '{func.__name__}' caused an exception: {e}")
 
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        """Wrapper function to handle C# FlaUI exceptions, traced while a tracer is active."""
+        tracer = tracing.active
+        if tracer is None:
+            return translated(*args, **kwargs)
+        return tracer.call(name, "wrapper", translated, args, kwargs)
+
     return wrapper
 
 
@@ -0,0 +1,119 @@
+"""This module provides an opt-in identity map for element wrappers, keyed on the element RuntimeId.
+
+While an identity map is active, wrapping a raw element (eg. `AutomationElement(raw_element=...)` from any find_*
+method) returns the wrapper already alive for the same UI element and wrapper class instead of a new one. Repeated
+finds then hand out the same Python handle, data cached on a handle is shared by every lookup of the element, and
+fewer short-lived wrappers are created in long-running sessions. The reused wrapper takes over the raw element of the
+latest lookup, which drops the cache profile of its previous raw element (see cache_profile).
+
+Handles are held weakly: a handle is dropped from the map as soon as nothing else references it. UIA may reuse the
+RuntimeId of a destroyed element for a new one, so clear the map after the UI was rebuilt while handles are kept.
+
+Every new wrapper costs one RuntimeId read across the interop boundary while an identity map is active, when it is
+off the hook only checks `identity_map.active` for None.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+from typing import Any, Callable, Iterator, Optional, Tuple
+import weakref
+
+RuntimeId = Tuple[int, ...]
+
+
+def runtime_id(raw_element: Any) -> Optional[RuntimeId]:
+    """Reads the RuntimeId of a raw C# element.
+
+    :param raw_element: Raw C# element
+    :return: RuntimeId as a tuple, None if it is not supported or cannot be read
+    """
+    try:
+        value = raw_element.Properties.RuntimeId.ValueOrDefault
+    except Exception:
+        return None
+    return tuple(value) if value is not None and len(value) > 0 else None
+
+
+class IdentityMap:
+    """Maps (wrapper class, RuntimeId) to the live wrapper of an element."""
+
+    def __init__(self) -> None:
+        """Creates an empty identity map."""
+        self._handles: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of live handles."""
+        return len(self._handles)
+
+    def get_or_create(self, cls: type, raw_element: Any, create: Callable[[Optional[RuntimeId]], Any]) -> Any:
+        """Returns the live handle of the element, creates and registers it if there is none.
+
+        :param cls: Wrapper class
+        :param raw_element: Raw C# element
+        :param create: Creates the handle, called with the RuntimeId (None if it cannot be read)
+        :return: Element handle
+        """
+        key = runtime_id(raw_element)
+        if key is None:
+            # Elements without a RuntimeId cannot be told apart, they always get a new handle
+            return create(None)
+        with self._lock:
+            handle = self._handles.get((cls, key))
+            if handle is not None:
+                self.hits += 1
+                return handle
+            self.misses += 1
+            handle = create(key)
+            self._handles[(cls, key)] = handle
+            return handle
+
+    def clear(self) -> None:
+        """Drops all handles and resets the hit/miss counters."""
+        with self._lock:
+            self._handles.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# The active identity map, checked whenever an element wrapper is created, None while wrappers are not reused
+active: Optional[IdentityMap] = None
+
+
+def enable() -> IdentityMap:
+    """Starts reusing element wrappers with a new identity map.
+
+    :return: The active identity map
+    """
+    global active
+    active = IdentityMap()
+    return active
+
+
+def disable() -> Optional[IdentityMap]:
+    """Stops reusing element wrappers.
+
+    :return: The identity map which was active, if any
+    """
+    global active
+    handles, active = active, None
+    return handles
+
+
+@contextmanager
+def reuse_elements() -> Iterator[IdentityMap]:
+    """Reuses element wrappers within the context, the previously active identity map (if any) is restored on exit.
+
+    :return: The active identity map
+    """
+    global active
+    previous = active
+    handles = enable()
+    try:
+        yield handles
+    finally:
+        active = previous
@@ -0,0 +1,270 @@
+"""This module compares captures (see `flaui.lib.screenshots`) to detect visual changes.
+
+`compare` splits both images into tiles and hashes every tile with one vectorised pass per image. Only the tiles whose
+hashes differ are compared pixel by pixel, with a per-channel tolerance, so two mostly identical captures cost O(tiles)
+beyond hashing. Changed tiles touching each other are merged into changed regions, reported with a score: the share of
+the compared pixels which changed. Regions such as clocks or blinking cursors can be masked with the bounding
+rectangles of their elements.
+
+`perceptual_hash` (a difference hash) and `hamming_distance` tell apart similar and different images regardless of
+small shifts or scaling. `wait_until_stable` polls captures until a region stops changing.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from flaui.core.tools import Retry
+
+# (x, y, width, height) in pixels
+Rect = Tuple[int, int, int, int]
+
+DEFAULT_TILE = 32
+
+# Weights of the pixels of a tile in its hash, odd so that a change of any single pixel changes the hash
+_WEIGHTS: Dict[int, np.ndarray] = {}
+
+
+class ImageDiff(NamedTuple):
+    """Result of the comparison of two images."""
+
+    score: float  # Share of the compared (unmasked) pixels which changed, 0.0 for identical images
+    changed: List[Rect]  # Changed regions, tight around the changed pixels
+    changed_pixels: int
+
+    @property
+    def identical(self) -> bool:
+        """Tells if no pixel changed beyond the tolerance."""
+        return self.changed_pixels == 0
+
+
+def to_rect(rectangle: Any, origin: Tuple[int, int] = (0, 0)) -> Rect:
+    """Converts a rectangle into image coordinates.
+
+    :param rectangle: (x, y, width, height) tuple, Rectangle wrapper (eg. a `bounding_rectangle`) or C# Rectangle
+    :param origin: Screen coordinates of the top left corner of the image, defaults to (0, 0)
+    :return: (x, y, width, height) relative to the image
+    """
+    if isinstance(rectangle, (tuple, list)):
+        x, y, width, height = rectangle
+    elif hasattr(rectangle, "raw_value"):
+        x, y, width, height = rectangle.left, rectangle.top, rectangle.width, rectangle.height
+    else:
+        x, y, width, height = rectangle.X, rectangle.Y, rectangle.Width, rectangle.Height
+    return int(x) - origin[0], int(y) - origin[1], int(width), int(height)
+
+
+def build_mask(shape: Tuple[int, ...], masks: Sequence[Any], origin: Tuple[int, int] = (0, 0)) -> Optional[np.ndarray]:
+    """Builds the mask of the ignored pixels.
+
+    :param shape: Shape of the image
+    :param masks: Ignored rectangles, see `to_rect`
+    :param origin: Screen coordinates of the top left corner of the image, defaults to (0, 0)
+    :return: (H, W) bool array, True for ignored pixels, None without masks
+    """
+    if not masks:
+        return None
+    ignored = np.zeros(shape[:2], dtype=bool)
+    for rectangle in masks:
+        x, y, width, height = to_rect(rectangle, origin)
+        ignored[max(y, 0) : max(y + height, 0), max(x, 0) : max(x + width, 0)] = True
+    return ignored
+
+
+def pixel_diff(
+    before: np.ndarray, after: np.ndarray, tolerance: int = 0, mask: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Finds the changed pixels of two images, alpha is ignored.
+
+    :param before: (H, W, 4) uint8 image
+    :param after: (H, W, 4) uint8 image
+    :param tolerance: Largest difference of a channel value still considered unchanged, defaults to 0
+    :param mask: (H, W) bool array of ignored pixels, defaults to None
+    :return: (H, W) bool array, True for changed pixels
+    """
+    delta = np.abs(before[..., :3].astype(np.int16) - after[..., :3].astype(np.int16)).max(axis=-1)
+    changed = delta > tolerance
+    if mask is not None:
+        changed &= ~mask
+    return changed
+
+
+def tile_hashes(image: np.ndarray, tile: int = DEFAULT_TILE) -> np.ndarray:
+    """Hashes every tile of an image, partial tiles at the right and bottom edges included.
+
+    :param image: (H, W, 4) uint8 image
+    :param tile: Tile side in pixels, defaults to DEFAULT_TILE
+    :return: (rows, columns) uint64 array of hashes
+    """
+    if tile not in _WEIGHTS:
+        _WEIGHTS[tile] = np.random.default_rng(tile).integers(0, 2**63, (tile, tile), dtype=np.uint64) * 2 + 1
+    height, width = image.shape[:2]
+    rows, columns = -(-height // tile), -(-width // tile)
+    pixels = np.ascontiguousarray(image).view(np.uint32)[..., 0]
+    if (rows * tile, columns * tile) != (height, width):
+        pixels = np.pad(pixels, ((0, rows * tile - height), (0, columns * tile - width)))
+    blocks = pixels.reshape(rows, tile, columns, tile).astype(np.uint64)
+    # Sums wrap around modulo 2**64, as intended
+    with np.errstate(over="ignore"):
+        return (blocks * _WEIGHTS[tile][None, :, None, :]).sum(axis=(1, 3), dtype=np.uint64)
+
+
+def compare(
+    before: np.ndarray,
+    after: np.ndarray,
+    tolerance: int = 0,
+    tile: int = DEFAULT_TILE,
+    masks: Sequence[Any] = (),
+    origin: Tuple[int, int] = (0, 0),
+    hashes: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> ImageDiff:
+    """Compares two images of the same size, only the tiles whose hashes differ are compared pixel by pixel.
+
+    :param before: (H, W, 4) uint8 image
+    :param after: (H, W, 4) uint8 image
+    :param tolerance: Largest difference of a channel value still considered unchanged, defaults to 0
+    :param tile: Tile side in pixels, defaults to DEFAULT_TILE
+    :param masks: Ignored rectangles, eg. `bounding_rectangle`s of clocks, see `to_rect`, defaults to ()
+    :param origin: Screen coordinates of the top left corner of the images, defaults to (0, 0)
+    :param hashes: Tile hashes of both images if already computed, defaults to None
+    :raises ValueError: If the images differ in size
+    :return: Comparison result
+    """
+    if before.shape != after.shape:
+        raise ValueError(f"Cannot compare images of shapes {before.shape} and {after.shape}")
+    before_hashes, after_hashes = hashes or (tile_hashes(before, tile), tile_hashes(after, tile))
+    ignored = build_mask(before.shape, masks, origin)
+    compared = before.shape[0] * before.shape[1] - (int(ignored.sum()) if ignored is not None else 0)
+
+    # Tight bounds (top, left, bottom, right) of the changed pixels by changed tile
+    bounds: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+    changed_pixels = 0
+    for row, column in np.argwhere(before_hashes != after_hashes):
+        area = (slice(row * tile, (row + 1) * tile), slice(column * tile, (column + 1) * tile))
+        changed = pixel_diff(before[area], after[area], tolerance, ignored[area] if ignored is not None else None)
+        count = int(changed.sum())
+        if not count:
+            continue
+        changed_pixels += count
+        ys, xs = np.nonzero(changed.any(axis=1))[0], np.nonzero(changed.any(axis=0))[0]
+        top, left = int(row) * tile, int(column) * tile
+        bounds[(int(row), int(column))] = (top + ys[0], left + xs[0], top + ys[-1] + 1, left + xs[-1] + 1)
+
+    return ImageDiff(changed_pixels / compared if compared else 0.0, _regions(bounds), changed_pixels)
+
+
+def _regions(bounds: Dict[Tuple[int, int], Tuple[int, int, int, int]]) -> List[Rect]:
+    """Merges changed tiles touching each other (diagonals included) into regions.
+
+    :param bounds: Bounds (top, left, bottom, right) of the changed pixels by tile (row, column)
+    :return: Regions, (x, y, width, height), sorted top to bottom
+    """
+    regions = []
+    pending = set(bounds)
+    while pending:
+        stack = [pending.pop()]
+        top, left, bottom, right = bounds[stack[0]]
+        while stack:
+            row, column = stack.pop()
+            tile_top, tile_left, tile_bottom, tile_right = bounds[(row, column)]
+            top, left = min(top, tile_top), min(left, tile_left)
+            bottom, right = max(bottom, tile_bottom), max(right, tile_right)
+            for neighbour in [(row + dy, column + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]:
+                if neighbour in pending:
+                    pending.remove(neighbour)
+                    stack.append(neighbour)
+        regions.append((int(left), int(top), int(right - left), int(bottom - top)))
+    return sorted(regions, key=lambda _: (_[1], _[0]))
+
+
+def perceptual_hash(image: np.ndarray, size: int = 8) -> int:
+    """Difference hash of an image: brightness gradients of a size x (size + 1) grid of averaged areas.
+
+    :param image: (H, W, 3 or 4) uint8 image, at least size + 1 pixels wide and size pixels high
+    :param size: Grid rows, the hash has size * size bits, defaults to 8
+    :return: Hash
+    """
+    gray = image[..., :3].mean(axis=-1)
+    height, width = gray.shape
+    row_edges = np.linspace(0, height, size + 1).astype(int)[:-1]
+    column_edges = np.linspace(0, width, size + 2).astype(int)[:-1]
+    sums = np.add.reduceat(np.add.reduceat(gray, row_edges, axis=0), column_edges, axis=1)
+    areas = np.outer(np.diff(np.append(row_edges, height)), np.diff(np.append(column_edges, width)))
+    grid = sums / areas
+    bits = (grid[:, 1:] > grid[:, :-1]).flatten()
+    return int(sum(1 << index for index, bit in enumerate(bits) if bit))
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Number of differing bits of two hashes, small for similar images.
+
+    :param first: Hash
+    :param second: Hash
+    :return: Distance
+    """
+    return bin(first ^ second).count("1")
+
+
+def wait_until_stable(
+    capture: Union[Callable[[], np.ndarray], Any],
+    stable_for: int = 500,
+    timeout: int = 5000,
+    interval: int = 100,
+    tolerance: int = 0,
+    tile: int = DEFAULT_TILE,
+    masks: Sequence[Any] = (),
+    origin: Tuple[int, int] = (0, 0),
+    throw_on_timeout: bool = False,
+) -> bool:
+    """Captures repeatedly until the image stops changing, eg. once an animation or a repaint is over.
+
+    Each capture is hashed once and compared with the previous one.
+
+    Example:
+
+    wait_until_stable(window, stable_for=300, masks=[clock.bounding_rectangle],
+                      origin=(window.bounding_rectangle.left, window.bounding_rectangle.top))
+
+    :param capture: Element captured with `capture_array(cached=False)`, so that an active capture cache does not
+        serve the same array again, or a function capturing the region
+    :param stable_for: Milliseconds without change needed, defaults to 500
+    :param timeout: Timeout in milliseconds, defaults to 5000
+    :param interval: Milliseconds between captures, defaults to 100
+    :param tolerance: Largest difference of a channel value still considered unchanged, defaults to 0
+    :param tile: Tile side in pixels, defaults to DEFAULT_TILE
+    :param masks: Ignored rectangles, see `to_rect`, defaults to ()
+    :param origin: Screen coordinates of the top left corner of the captures, defaults to (0, 0)
+    :param throw_on_timeout: Raise a TimeoutError if the region keeps changing, defaults to False
+    :raises TimeoutError: If the region keeps changing and throw_on_timeout is set
+    :return: True if the region was stable in time, False otherwise
+    """
+    if hasattr(capture, "capture_array"):
+        capture = functools.partial(capture.capture_array, cached=False)
+    state: Dict[str, Any] = {"image": None, "hashes": None, "since": 0.0}
+
+    def is_stable() -> bool:
+        """Captures the region, tells if it stayed unchanged for the stable period."""
+        image = capture()
+        hashes = tile_hashes(image, tile)
+        now = time.monotonic() * 1000.0
+        previous = state["image"]
+        if (
+            previous is None
+            or previous.shape != image.shape
+            or not compare(previous, image, tolerance, tile, masks, origin, (state["hashes"], hashes)).identical
+        ):
+            state["since"] = now
+        state["image"], state["hashes"] = image, hashes
+        return now - state["since"] >= stable_for
+
+    return Retry.WhileFalse(
+        is_stable,
+        timeout=timeout,
+        interval=interval,
+        throw_on_timeout=throw_on_timeout,
+        timeout_message=f"The region kept changing for {timeout} ms.",
+    )
@@ -0,0 +1,143 @@
+"""This module implements the waits applied after input actions (`post_wait`) and keeps telemetry on them.
+
+A fixed post-wait sleeps for its whole budget. An idle post-wait polls instead and returns as soon as the target
+application is idle (an idle probe, eg. the foreground window answering a message) or the expected state is observed
+(a condition), bounded by the budget. Every post-wait is recorded so the time saved against fixed sleeps can be
+reported.
+"""
+
+from collections import deque
+import threading
+import time
+from typing import Callable, Deque, List, Literal, Optional
+
+from pydantic import BaseModel
+
+PostWaitMode = Literal["fixed", "idle"]
+PostWaitOutcome = Literal["fixed", "idle", "condition", "timeout"]
+
+# Idle probe: receives the remaining budget in seconds, returns True once the target application is idle
+IdleProbe = Callable[[float], bool]
+
+# Number of individual post-waits kept for inspection, totals cover every post-wait
+_HISTORY_SIZE = 1000
+
+
+class PostWaitRecord(BaseModel):
+    """Timing of a single post-wait."""
+
+    budget: float  # Seconds a fixed sleep would have taken
+    waited: float  # Seconds actually waited
+    outcome: PostWaitOutcome
+
+    @property
+    def saved(self) -> float:
+        """Seconds saved against a fixed sleep."""
+        return max(self.budget - self.waited, 0.0)
+
+
+class PostWaitSummary(BaseModel):
+    """Totals over all recorded post-waits."""
+
+    calls: int
+    budget: float  # Seconds
+    waited: float  # Seconds
+    saved: float  # Seconds
+    timeouts: int
+
+
+class PostWaitTelemetry:
+    """Thread safe store of post-wait timings: totals plus the most recent individual records."""
+
+    def __init__(self, history_size: int = _HISTORY_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._history: Deque[PostWaitRecord] = deque(maxlen=history_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all recorded post-waits."""
+        with self._lock:
+            self._history.clear()
+            self._calls = self._timeouts = 0
+            self._budget = self._waited = self._saved = 0.0
+
+    def record(self, record: PostWaitRecord) -> None:
+        """Records a post-wait.
+
+        :param record: Post-wait timing
+        """
+        with self._lock:
+            self._history.append(record)
+            self._calls += 1
+            self._timeouts += record.outcome == "timeout"
+            self._budget += record.budget
+            self._waited += record.waited
+            self._saved += record.saved
+
+    def history(self) -> List[PostWaitRecord]:
+        """Returns the most recent post-waits, oldest first."""
+        with self._lock:
+            return list(self._history)
+
+    def summary(self) -> PostWaitSummary:
+        """Returns the totals over all recorded post-waits."""
+        with self._lock:
+            return PostWaitSummary(
+                calls=self._calls,
+                budget=self._budget,
+                waited=self._waited,
+                saved=self._saved,
+                timeouts=self._timeouts,
+            )
+
+
+telemetry = PostWaitTelemetry()
+
+
+def wait_after_input(
+    budget: float,
+    probe: Optional[IdleProbe] = None,
+    condition: Optional[Callable[[], bool]] = None,
+    poll_interval: float = 0.005,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> PostWaitRecord:
+    """Waits after an input action and records the wait in the telemetry.
+
+    With a condition, returns as soon as the condition is met; otherwise with an idle probe, returns as soon as the
+    probe reports idle; with neither, sleeps for the whole budget. The wait never exceeds the budget.
+
+    :param budget: Longest wait in seconds
+    :param probe: Optional idle probe
+    :param condition: Optional expected state, takes precedence over the idle probe
+    :param poll_interval: Time between two checks in seconds, defaults to 0.005
+    :param clock: Monotonic clock in seconds, defaults to time.perf_counter
+    :param sleep: Sleep function in seconds, defaults to time.sleep
+    :return: Timing of the wait
+    """
+    start = clock()
+    if condition is None and probe is None:
+        if budget > 0:
+            sleep(budget)
+        record = PostWaitRecord(budget=budget, waited=clock() - start, outcome="fixed")
+        telemetry.record(record)
+        return record
+
+    deadline = start + budget
+    outcome: PostWaitOutcome = "timeout"
+    while True:
+        remaining = deadline - clock()
+        if condition is not None:
+            if condition():
+                outcome = "condition"
+                break
+        elif probe(max(remaining, 0.0)):  # type: ignore[misc]
+            outcome = "idle"
+            break
+        remaining = deadline - clock()
+        if remaining <= 0:
+            break
+        sleep(min(poll_interval, remaining))
+    record = PostWaitRecord(budget=budget, waited=clock() - start, outcome=outcome)
+    telemetry.record(record)
+    return record
@@ -0,0 +1,212 @@
+"""This module provides an opt-in cache for the properties read through element wrappers.
+
+While a property cache is active, reading a cached property (eg. `element.name`) on the same element handle returns
+the value read before until its time to live runs out, instead of fetching it across the COM boundary again. Static
+properties (AutomationId, ControlType, ClassName, ...) are cached until they are invalidated explicitly, volatile
+ones for a few milliseconds. Combine it with `identity_map.reuse_elements()` to share the values between repeated
+finds of the same element.
+
+Cached values are invalidated:
+- for all elements by the action methods of the wrappers (click, toggle, select, ...), which may change any element,
+  volatile values read before the action are not served anymore,
+- for one element by `invalidate_properties()` on its handle,
+- for the subscribed properties of an element by property-changed events, see `PropertyCache.subscribe`.
+
+Raw input (`Mouse`, `Keyboard`) is not tracked, call `property_cache.invalidate()` after it if needed.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import functools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from flaui.lib import capture_cache
+
+# Time to live in ms per wrapper property, properties not listed are never cached
+DEFAULT_TTLS: Dict[str, float] = {
+    # Static for the lifetime of an element
+    "automation_id": math.inf,
+    "automation_type": math.inf,
+    "class_name": math.inf,
+    "control_type": math.inf,
+    "framework_type": math.inf,
+    # Volatile
+    "bounding_rectangle": 50.0,
+    "help_text": 50.0,
+    "is_enabled": 50.0,
+    "is_offscreen": 50.0,
+    "item_status": 50.0,
+    "name": 50.0,
+}
+
+# UIA property (as named in FlaUI's PropertyLibrary.Element) behind each cached wrapper property
+PROPERTY_IDS: Dict[str, str] = {
+    "automation_id": "AutomationId",
+    "bounding_rectangle": "BoundingRectangle",
+    "class_name": "ClassName",
+    "control_type": "ControlType",
+    "framework_type": "FrameworkId",
+    "help_text": "HelpText",
+    "is_enabled": "IsEnabled",
+    "is_offscreen": "IsOffscreen",
+    "item_status": "ItemStatus",
+    "name": "Name",
+}
+
+# Cached value, expiry (clock seconds) and the invalidation generation it was read in
+CacheEntry = Tuple[Any, float, int]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class PropertyCache:
+    """Serves property values read before until their time to live runs out or they are invalidated."""
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """Creates a property cache.
+
+        :param ttls: Time to live in ms per property, merged into DEFAULT_TTLS. 0 disables caching a property and
+            math.inf caches it until it is invalidated explicitly, defaults to None
+        :param clock: Clock in seconds, defaults to time.monotonic
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._subscriptions: List[Any] = []
+        self._lock = threading.Lock()
+
+    def read(self, values: Dict[str, CacheEntry], name: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached value of a property, fetches and caches it if there is no valid one.
+
+        :param values: Cached values of the element
+        :param name: Property name
+        :param fetch: Reads the property from the element
+        :return: Property value
+        """
+        ttl = self.ttls.get(name, 0.0)
+        if ttl <= 0:
+            return fetch()
+        now = self._clock()
+        entry = values.get(name)
+        if entry is not None and now < entry[1] and (ttl == math.inf or entry[2] == self.generation):
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = fetch()
+        values[name] = (value, now + ttl / 1000.0, self.generation)
+        return value
+
+    def invalidate(self) -> None:
+        """Stops serving the volatile values of all elements read so far, static values are kept."""
+        self.generation += 1
+
+    def subscribe(self, element: Any, names: Optional[Iterable[str]] = None) -> Any:
+        """Drops the cached values of the element when UIA reports the properties changed.
+
+        :param element: Element wrapper
+        :param names: Properties to watch, defaults to all volatile properties with a UIA property id
+        :return: Registered FlaUI event handler, disposed by `unsubscribe_all`
+        """
+        from flaui.core.definitions import TreeScope
+
+        if names is None:
+            names = [_ for _ in PROPERTY_IDS if self.ttls.get(_, 0.0) not in (0.0, math.inf)]
+        by_property_id = {PROPERTY_IDS[_]: _ for _ in names}
+        library = element.raw_element.Automation.PropertyLibrary.Element
+        values = element._property_values_or_new()
+
+        def on_changed(sender: Any, property_id: Any, new_value: Any) -> None:
+            """Drops the cached value of the changed property."""
+            values.pop(by_property_id.get(property_id.Name, ""), None)
+
+        handler = element.raw_element.RegisterPropertyChangedEvent(
+            TreeScope.Element.value, on_changed, *[getattr(library, _) for _ in by_property_id]
+        )
+        with self._lock:
+            self._subscriptions.append(handler)
+        return handler
+
+    def unsubscribe_all(self) -> None:
+        """Disposes all property-changed event handlers registered by `subscribe`."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for handler in subscriptions:
+            handler.Dispose()
+
+
+# The active property cache, checked on every cached property read, None while properties are not cached
+active: Optional[PropertyCache] = None
+
+
+def enable(ttls: Optional[Mapping[str, float]] = None) -> PropertyCache:
+    """Starts caching properties with a new property cache.
+
+    :param ttls: Time to live in ms per property, merged into DEFAULT_TTLS, defaults to None
+    :return: The active property cache
+    """
+    global active
+    active = PropertyCache(ttls=ttls)
+    return active
+
+
+def disable() -> Optional[PropertyCache]:
+    """Stops caching properties, the event handlers of the cache are disposed.
+
+    :return: The property cache which was active, if any
+    """
+    global active
+    cache, active = active, None
+    if cache is not None:
+        cache.unsubscribe_all()
+    return cache
+
+
+@contextmanager
+def cache_properties(ttls: Optional[Mapping[str, float]] = None) -> Iterator[PropertyCache]:
+    """Caches properties within the context, the previously active property cache (if any) is restored on exit.
+
+    :param ttls: Time to live in ms per property, merged into DEFAULT_TTLS, defaults to None
+    :return: The active property cache
+    """
+    global active
+    previous = active
+    cache = enable(ttls=ttls)
+    try:
+        yield cache
+    finally:
+        cache.unsubscribe_all()
+        active = previous
+
+
+def invalidate() -> None:
+    """Stops serving the volatile values read so far from the active property cache, if any."""
+    cache = active
+    if cache is not None:
+        cache.invalidate()
+
+
+def invalidates_properties(func: F) -> F:
+    """Decorator for action methods, invalidates the volatile cached values and the cached captures (see
+    `capture_cache`) once the action ran (or failed).
+
+    :param func: Action method
+    :return: Decorated method
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """Runs the action, then invalidates the volatile values and the captures."""
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if active is not None:
+                active.invalidate()
+            capture_cache.invalidate()
+
+    return wrapper  # type: ignore[return-value]
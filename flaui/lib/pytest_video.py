@@ -0,0 +1,94 @@
+"""pytest plugin recording videos of tests with `ScreenRecorder`, according to the `VideoRecordingMode`.
+
+Enable it in a conftest.py and provide the recorded element by overriding the `flaui_video_target` fixture:
+
+    pytest_plugins = ["flaui.lib.pytest_video"]
+
+    @pytest.fixture(scope="session")
+    def flaui_video_target(app):
+        return app.get_main_window(automation)
+
+The mode is read from `--flaui-video OnePerTest|OnePerFixture`, else from the VIDEO_RECORDING_MODE setting.
+"OnePerTest" records a video per test, "OnePerFixture" one per test class (tests outside of classes get one each).
+Videos are named after the test node id and written to `--flaui-video-dir` (VIDEO_OUTPUT_DIR setting).
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+import re
+from typing import Any, Generator, Optional
+
+import pytest
+
+from flaui.lib.config import VideoRecordingMode, settings
+from flaui.lib.recorder import ScreenRecorder
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds the video recording options."""
+    group = parser.getgroup("flaui")
+    group.addoption(
+        "--flaui-video",
+        choices=[_.value for _ in VideoRecordingMode if _.value is not None],
+        default=None,
+        help="Record a video of the flaui_video_target per test or per test class.",
+    )
+    group.addoption("--flaui-video-dir", default=None, help="Directory of the recorded videos.")
+
+
+def _mode(config: pytest.Config) -> VideoRecordingMode:
+    """The recording mode of the session.
+
+    :param config: pytest config
+    :return: Mode
+    """
+    option = config.getoption("--flaui-video", default=None)
+    return VideoRecordingMode(option) if option else settings.VIDEO_RECORDING_MODE
+
+
+@pytest.fixture(scope="session")
+def flaui_video_target() -> Any:
+    """The element (or capture function) recorded, override it to record eg. the main window of the application.
+
+    :return: Element wrapper or function returning a capture array, None records nothing
+    """
+    return None
+
+
+def _start(request: pytest.FixtureRequest, mode: VideoRecordingMode) -> Optional[ScreenRecorder]:
+    """Starts a recorder named after the requesting node, if the session records videos in the given mode.
+
+    :param request: Fixture request
+    :param mode: Mode of the requesting fixture
+    :return: Started recorder, None if nothing is recorded
+    """
+    if _mode(request.config) != mode:
+        return None
+    target = request.getfixturevalue("flaui_video_target")
+    if target is None:
+        return None
+    directory = Path(request.config.getoption("--flaui-video-dir", default=None) or settings.VIDEO_OUTPUT_DIR)
+    name = re.sub(r"[^\w.-]+", "_", request.node.nodeid).strip("_")
+    # Elements are captured past the capture cache, which would serve the same frame until the next action
+    capture = functools.partial(target.capture_array, cached=False) if hasattr(target, "capture_array") else target
+    return ScreenRecorder(capture, directory.joinpath(name), fps=settings.VIDEO_FPS).start()
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _flaui_video_per_fixture(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Records a video per test class in "OnePerFixture" mode."""
+    recorder = _start(request, VideoRecordingMode.ONEPERFIXTURE)
+    yield
+    if recorder is not None:
+        recorder.stop()
+
+
+@pytest.fixture(autouse=True)
+def _flaui_video_per_test(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Records a video per test in "OnePerTest" mode."""
+    recorder = _start(request, VideoRecordingMode.ONEPERTEST)
+    yield
+    if recorder is not None:
+        recorder.stop()
@@ -1,37 +1,159 @@
-"""This module provides a bridge between Python and .NET using Python.NET."""
+"""This module provides a bridge between Python and .NET using Python.NET.
 
+Assemblies are loaded from a manifest rather than by globbing every DLL under BIN_HOME: FlaUI.Core is always loaded,
+while the UIA2/UIA3 backend assemblies are only loaded for the backend that is actually used. Assembly metadata is
+kept in a small on-disk index keyed by file mtime and size, and the time spent loading every assembly is recorded.
+"""
+
+import json
 import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import clr
-from System.Reflection import Assembly  # pyright: ignore[reportMissingImports]
 
 import flaui.lib.config as config
+from flaui.lib.enums import UIAutomationTypes
 
 # Global variable to hold the FlaUI C# version
 FLAUI_CSHARP_VERSION = None
 
+# Assemblies required regardless of the automation backend in use
+CORE_ASSEMBLIES: Tuple[str, ...] = ("FlaUI.Core",)
+
+# Assemblies required per automation backend, in load order
+BACKEND_ASSEMBLIES: Dict[UIAutomationTypes, Tuple[str, ...]] = {
+    UIAutomationTypes.UIA2: ("FlaUI.UIA2",),
+    UIAutomationTypes.UIA3: ("Interop.UIAutomationClient", "FlaUI.UIA3"),
+}
+
+# Time spent loading each assembly (in milliseconds), keyed by assembly name
+LOAD_TIMINGS: Dict[str, float] = {}
+
+_load_lock = threading.RLock()
+
+
+def _file_signature(path: Path) -> Dict[str, int]:
+    """Builds the index key for an assembly file.
 
-def setup_pythonnet_bridge() -> None:
+    :param path: Path to the assembly file
+    :return: Modification time (ns) and size of the file
     """
-    Sets up Python.NET bridge for FlaUI and automation dependencies for UI Automation
-    so that the interlinked C# .NET dependencies are injected into the Python environment
-    listed under flaui/bin folder.
+    stat = path.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
 
-    :raises err: On failure to load the existing C# dependencies listed under flaui/bin
+
+def _read_assembly_index(index_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Reads the on-disk assembly metadata index.
+
+    :param index_path: Path to the index file
+    :return: Index contents, empty if the index is missing or unreadable
+    """
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_assembly_index(index_path: Path, index: Dict[str, Dict[str, Any]]) -> None:
+    """Writes the assembly metadata index, a failure to write only costs the next cold start.
+
+    :param index_path: Path to the index file
+    :param index: Index contents
+    """
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError as err:
+        logging.debug("Could not write assembly index to %s: %s", index_path, err)
+
+
+def _assembly_version(path: Path, assembly: Any, index: Dict[str, Dict[str, Any]]) -> Tuple[str, bool]:
+    """Resolves the version of a loaded assembly, preferring a fresh entry from the index.
+
+    :param path: Path to the assembly file
+    :param assembly: Loaded C# Assembly object
+    :param index: Assembly metadata index, updated in place on a miss
+    :return: Tuple[version, index updated flag]
+    """
+    signature = _file_signature(path)
+    entry = index.get(path.name)
+    if entry is not None and all(entry.get(key) == value for key, value in signature.items()):
+        return entry["version"], False
+    version = str(assembly.GetName().Version)
+    index[path.name] = {**signature, "version": version}
+    return version, True
+
+
+def _load_assemblies(names: Tuple[str, ...]) -> None:
+    """Loads the given assemblies from BIN_HOME, skipping the ones already loaded.
+
+    :param names: Assembly names (without the .dll extension)
+    :raises err: On failure to load any of the assemblies
     """
-    BIN_HOME = config.settings.BIN_HOME
-    # logging.info("Looking for valid binaries at - %s", BIN_HOME)
     global FLAUI_CSHARP_VERSION
+    pending = [name for name in names if name not in LOAD_TIMINGS]
+    if not pending:
+        return
+
+    index_path = config.settings.ASSEMBLY_INDEX_PATH
+    index = _read_assembly_index(index_path)
+    index_changed = False
     try:
-        for _ in BIN_HOME.glob("*.dll"):
-            clr.AddReference(_.as_posix())  # pyright: ignore
-            clr.AddReference(_.stem)  # pyright: ignore
-            assembly = Assembly.LoadFile(_.as_posix())
-            version = assembly.GetName().Version
-            logging.info("Added %s v%s DLL to Python.NET bridge", _.name, version)
-            if _.name == "FlaUI.Core.dll":
-                FLAUI_CSHARP_VERSION = str(version)
+        for name in pending:
+            path = config.settings.BIN_HOME.joinpath(f"{name}.dll")
+            start = time.perf_counter()
+            assembly = clr.AddReference(path.as_posix())  # pyright: ignore
+            LOAD_TIMINGS[name] = (time.perf_counter() - start) * 1000.0
+            version, updated = _assembly_version(path, assembly, index)
+            index_changed = index_changed or updated
+            logging.info("Added %s v%s DLL to Python.NET bridge in %.1f ms", path.name, version, LOAD_TIMINGS[name])
+            if name == "FlaUI.Core":
+                FLAUI_CSHARP_VERSION = version
     except Exception as err:
         logging.exception("Failed to setup Python.NET bridge: %s", err)
         raise err
-    logging.info("Python.NET bridge setup complete")
+    finally:
+        if index_changed:
+            _write_assembly_index(index_path, index)
+
+
+def ensure_backend_loaded(ui_automation_type: UIAutomationTypes) -> None:
+    """Loads the assemblies of the given automation backend on first use, no-op once loaded.
+
+    :param ui_automation_type: UIA2 or UIA3 backend
+    """
+    with _load_lock:
+        _load_assemblies(CORE_ASSEMBLIES + BACKEND_ASSEMBLIES[ui_automation_type])
+
+
+def get_load_timings() -> Dict[str, float]:
+    """Returns the time spent loading each assembly so far.
+
+    :return: Load time in milliseconds keyed by assembly name
+    """
+    return dict(LOAD_TIMINGS)
+
+
+def setup_pythonnet_bridge(ui_automation_type: Optional[UIAutomationTypes] = None) -> None:
+    """
+    Sets up Python.NET bridge for FlaUI and automation dependencies for UI Automation
+    so that the interlinked C# .NET dependencies are injected into the Python environment
+    listed under flaui/bin folder.
+
+    Only FlaUI.Core and the assemblies of the requested backend are loaded. When no backend is given, both UIA2 and
+    UIA3 assemblies are loaded. A backend that is not loaded here is loaded on first use by `Automation`.
+
+    :param ui_automation_type: Automation backend to load, defaults to None (all backends)
+    :raises err: On failure to load the existing C# dependencies listed under flaui/bin
+    """
+    backends = list(BACKEND_ASSEMBLIES) if ui_automation_type is None else [ui_automation_type]
+    start = time.perf_counter()
+    with _load_lock:
+        _load_assemblies(CORE_ASSEMBLIES)
+        for backend in backends:
+            ensure_backend_loaded(backend)
+    logging.info("Python.NET bridge setup complete in %.1f ms", (time.perf_counter() - start) * 1000.0)
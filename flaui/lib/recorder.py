@@ -0,0 +1,273 @@
+"""This module records a window or element as a video, from captures taken on a background thread.
+
+`ScreenRecorder` captures at a target frame rate (see `AutomationElement.capture_array`) and delta-encodes every frame
+against the previous one with the tile hashes of `flaui.lib.image_compare`: only the changed tiles are kept, plus a
+full key frame every `key_interval` frames. Encoded frames go to a bounded ring buffer, which a writer thread flushes
+to disk in chunks, so memory stays flat however long the recording runs. When the writer falls behind and the buffer
+is full, new frames are dropped (and counted) rather than old ones, keeping the delta chain intact. Failed captures
+and writes are counted and logged, after a failed write the writer resumes at the next key frame.
+
+Output formats:
+- "mjpeg": one Motion JPEG stream, `<path>.mjpeg` (eg. `ffmpeg -f mjpeg -framerate 5 -i test.mjpeg test.mp4`),
+- "png": a lossless image sequence, `<path>/frame_000000.png`, ...
+
+Unchanged frames reuse the encoding of the previous frame. Use `flaui.lib.pytest_video` to record tests according to
+the `VideoRecordingMode`.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import nullcontext
+import io
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Deque, List, Literal, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from flaui.lib.image_compare import DEFAULT_TILE, tile_hashes
+from flaui.lib.screenshots import PixelOrder, to_image
+
+logger = logging.getLogger(__name__)
+
+VideoFormat = Literal["mjpeg", "png"]
+
+
+class DeltaFrame(NamedTuple):
+    """A captured frame, stored as the tiles which changed since the previous frame."""
+
+    time: float  # Seconds since the start of the recording
+    shape: Tuple[int, ...]
+    key: bool  # True if the frame is stored whole
+    patches: List[Tuple[int, int, np.ndarray]]  # (y, x, pixels) of the changed tiles, the whole frame for key frames
+
+
+class ScreenRecorder:
+    """Records captures at a target frame rate into a video file or an image sequence."""
+
+    def __init__(
+        self,
+        capture: Callable[[], np.ndarray],
+        path: Union[str, Path],
+        fps: float = 5.0,
+        format: VideoFormat = "mjpeg",
+        order: PixelOrder = "BGRA",
+        tile: int = DEFAULT_TILE,
+        buffer_frames: int = 256,
+        chunk_frames: int = 32,
+        key_interval: int = 300,
+        quality: int = 80,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Creates a recorder, call `start()` to start recording.
+
+        :param capture: Takes a capture as a new (H, W, 4) uint8 array, eg. `element.capture_array`
+        :param path: Output path, without extension
+        :param fps: Target frames per second, defaults to 5.0
+        :param format: Output format, defaults to "mjpeg"
+        :param order: Channel order of the captures, defaults to "BGRA"
+        :param tile: Tile side in pixels of the delta encoding, defaults to DEFAULT_TILE
+        :param buffer_frames: Maximum number of frames waiting to be written, defaults to 256
+        :param chunk_frames: Number of frames written at once, defaults to 32
+        :param key_interval: Frames between two full key frames, defaults to 300
+        :param quality: JPEG quality, defaults to 80
+        :param clock: Clock in seconds, defaults to time.monotonic
+        """
+        self.capture = capture
+        self.path = Path(path)
+        self.interval = 1.0 / fps
+        self.format = format
+        self.order = order
+        self.tile = tile
+        self.buffer_frames = buffer_frames
+        self.chunk_frames = chunk_frames
+        self.key_interval = key_interval
+        self.quality = quality
+        self.captured = 0
+        self.dropped = 0  # Frames dropped while the buffer was full, or lost with the canvas after a write error
+        self.skipped = 0  # Frame slots missed because a capture took longer than the interval
+        self.errors = 0  # Failed captures and writes
+        self.written = 0
+        self._clock = clock
+        self._ring: Deque[DeltaFrame] = deque()
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # Reference of the delta encoding: tile hashes and shape of the last buffered frame, frames since the last key
+        # frame, and whether the writer lost its canvas and needs a key frame
+        self._hashes: Optional[np.ndarray] = None
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._since_key = 0
+        self._key_requested = False
+        self._started_at = 0.0
+
+    @property
+    def output(self) -> Path:
+        """The video file, or the image sequence directory
+
+        :return: Output path
+        """
+        return self.path.with_name(f"{self.path.name}.mjpeg") if self.format == "mjpeg" else self.path
+
+    def start(self) -> ScreenRecorder:
+        """Starts the capture and writer threads.
+
+        :return: The recorder
+        """
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "png":
+            self.output.mkdir(parents=True, exist_ok=True)
+        self._stopping.clear()
+        self._started_at = self._clock()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="flaui-recorder-capture", daemon=True),
+            threading.Thread(target=self._write_loop, name="flaui-recorder-writer", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> Path:
+        """Stops capturing and waits until all buffered frames are written.
+
+        :return: Output path
+        """
+        self._stopping.set()
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        return self.output
+
+    def __enter__(self) -> ScreenRecorder:
+        """Starts recording."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops recording and writes the buffered frames."""
+        self.stop()
+
+    def _capture_loop(self) -> None:
+        """Captures a frame per interval until stopped, missed slots are skipped rather than caught up."""
+        next_at = self._clock()
+        while not self._stopping.is_set():
+            try:
+                self._push(self.capture())
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Recorder capture failed: {e}")
+            next_at += self.interval
+            delay = next_at - self._clock()
+            if delay < 0:
+                self.skipped += int(-delay // self.interval) + 1
+                next_at = self._clock()
+                delay = 0
+            self._stopping.wait(delay)
+
+    def _push(self, image: np.ndarray) -> None:
+        """Delta-encodes a capture into the ring buffer.
+
+        :param image: (H, W, 4) uint8 capture
+        """
+        self.captured += 1
+        hashes = tile_hashes(image, self.tile)
+        # A resized capture can keep the tile grid of the previous one, so the whole shape is compared
+        key = (
+            self._hashes is None
+            or self._shape != image.shape
+            or self._since_key >= self.key_interval
+            or self._key_requested
+        )
+        if key:
+            patches = [(0, 0, image)]
+        else:
+            tile = self.tile
+            patches = [
+                (y, x, image[y : y + tile, x : x + tile].copy())
+                for y, x in (np.argwhere(hashes != self._hashes) * tile).tolist()
+            ]
+        frame = DeltaFrame(self._clock() - self._started_at, image.shape, key, patches)
+        with self._condition:
+            if len(self._ring) >= self.buffer_frames:
+                self.dropped += 1
+                return
+            self._ring.append(frame)
+            if len(self._ring) >= self.chunk_frames:
+                self._condition.notify()
+        self._hashes, self._shape = hashes, image.shape
+        self._since_key = 0 if key else self._since_key + 1
+        if key:
+            self._key_requested = False
+
+    def _write_loop(self) -> None:
+        """Writes the buffered frames in chunks until stopped and drained."""
+        canvas: Optional[np.ndarray] = None
+        encoded: Optional[bytes] = None
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._ring) >= self.chunk_frames or self._stopping.is_set(), timeout=1.0
+                )
+                chunk = list(self._ring)
+                self._ring.clear()
+            if chunk:
+                try:
+                    canvas, encoded = self._write(chunk, canvas, encoded)
+                except Exception as e:
+                    # The canvas may be patched halfway, the frames are rebuilt again from the next key frame
+                    self.errors += 1
+                    logger.debug(f"Recorder write failed: {e}")
+                    canvas, encoded = None, None
+                    self._key_requested = True
+            elif self._stopping.is_set():
+                return
+
+    def _write(
+        self, chunk: List[DeltaFrame], canvas: Optional[np.ndarray], encoded: Optional[bytes]
+    ) -> Tuple[Optional[np.ndarray], Optional[bytes]]:
+        """Rebuilds the frames of a chunk from their deltas, encodes and writes them.
+
+        :param chunk: Frames, oldest first
+        :param canvas: The last frame written, patched in place
+        :param encoded: Encoding of the last frame written
+        :return: The canvas and the encoding of the last frame
+        """
+        with open(self.output, "ab") if self.format == "mjpeg" else nullcontext() as stream:
+            for frame in chunk:
+                if frame.key:
+                    canvas, encoded = frame.patches[0][2].copy(), None
+                elif canvas is None:
+                    with self._condition:
+                        self.dropped += 1  # Delta of a frame lost with a failed write
+                    continue
+                else:
+                    for y, x, pixels in frame.patches:
+                        canvas[y : y + pixels.shape[0], x : x + pixels.shape[1]] = pixels
+                    if frame.patches:
+                        encoded = None
+                if encoded is None:
+                    encoded = self._encode(canvas)
+                if stream is not None:
+                    stream.write(encoded)
+                else:
+                    self.output.joinpath(f"frame_{self.written:06d}.png").write_bytes(encoded)
+                self.written += 1
+        return canvas, encoded
+
+    def _encode(self, frame: np.ndarray) -> bytes:
+        """Encodes a frame in the output format.
+
+        :param frame: (H, W, 4) uint8 frame
+        :return: JPEG or PNG bytes
+        """
+        buffer = io.BytesIO()
+        image = to_image(frame, self.order)
+        if self.format == "mjpeg":
+            image.convert("RGB").save(buffer, format="JPEG", quality=self.quality)
+        else:
+            image.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
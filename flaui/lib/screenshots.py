@@ -0,0 +1,101 @@
+"""This module converts the .NET Bitmaps returned by FlaUI captures into NumPy arrays and Pillow images in memory.
+
+`bitmap_to_array` locks the bitmap bits with `ImageLockMode.UserInputBuffer`, pointing GDI+ at the memory of a NumPy
+array: the pixels are copied once, straight from the bitmap into the (H, W, 4) uint8 array, without PNG encoding or a
+temporary file. The array keeps the in-memory order of Format32bppArgb bitmaps, "BGRA", unless "RGBA" is requested.
+
+`to_image` wraps an "RGBA" array into a Pillow image sharing its memory, "BGRA" arrays are converted (one copy).
+
+System.Drawing is only imported when a bitmap is converted.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional
+
+import numpy as np
+from PIL import Image
+
+# Channel order of the arrays: "BGRA" is the memory layout of the captured bitmaps, "RGBA" the one of Pillow
+PixelOrder = Literal["BGRA", "RGBA"]
+
+
+def empty_frame(height: int, width: int) -> np.ndarray:
+    """Allocates an uninitialised array for a capture of the given size.
+
+    :param height: Height in pixels
+    :param width: Width in pixels
+    :return: (height, width, 4) uint8 array
+    """
+    return np.empty((height, width, 4), dtype=np.uint8)
+
+
+def swap_red_blue(array: np.ndarray) -> np.ndarray:
+    """Converts an array between "BGRA" and "RGBA" in place.
+
+    :param array: (H, W, 4) array
+    :return: The array
+    """
+    array[..., [0, 2]] = array[..., [2, 0]]
+    return array
+
+
+def _copy_pixels(bitmap: Any, array: np.ndarray) -> None:
+    """Copies the pixels of a bitmap into a C-contiguous (H, W, 4) uint8 array, as Format32bppArgb.
+
+    :param bitmap: System.Drawing.Bitmap of the same size as the array
+    :param array: Destination array
+    """
+    from System import IntPtr  # pyright: ignore
+    from System.Drawing import Rectangle  # pyright: ignore
+    from System.Drawing.Imaging import BitmapData, ImageLockMode, PixelFormat  # pyright: ignore
+
+    height, width = array.shape[:2]
+    data = BitmapData()
+    data.Width = width
+    data.Height = height
+    data.Stride = width * 4
+    data.PixelFormat = PixelFormat.Format32bppArgb
+    data.Scan0 = IntPtr(array.ctypes.data)
+    # ReadOnly | UserInputBuffer is no member of the (non-flags) enum, hence the forced conversion
+    mode = ImageLockMode(int(ImageLockMode.ReadOnly) | int(ImageLockMode.UserInputBuffer), True)
+    bitmap.LockBits(Rectangle(0, 0, width, height), mode, PixelFormat.Format32bppArgb, data)
+    bitmap.UnlockBits(data)
+
+
+def bitmap_to_array(
+    bitmap: Any, order: PixelOrder = "BGRA", out: Optional[np.ndarray] = None, dispose: bool = True
+) -> np.ndarray:
+    """Copies the pixels of a bitmap into a NumPy array.
+
+    :param bitmap: System.Drawing.Bitmap, eg. returned by `AutomationElement.capture()`
+    :param order: Channel order of the array, defaults to "BGRA"
+    :param out: Array to fill, reused if it has the size of the bitmap (eg. for repeated captures), defaults to None
+    :param dispose: Dispose the bitmap afterwards, defaults to True
+    :return: (H, W, 4) uint8 array
+    """
+    try:
+        height, width = bitmap.Height, bitmap.Width
+        array = (
+            out
+            if out is not None and out.shape == (height, width, 4) and out.dtype == np.uint8 and out.flags.c_contiguous
+            else empty_frame(height, width)
+        )
+        _copy_pixels(bitmap, array)
+    finally:
+        if dispose:
+            bitmap.Dispose()
+    return swap_red_blue(array) if order == "RGBA" else array
+
+
+def to_image(array: np.ndarray, order: PixelOrder = "BGRA") -> Image.Image:
+    """Wraps an array into a Pillow image.
+
+    :param array: (H, W, 4) uint8 array
+    :param order: Channel order of the array, defaults to "BGRA"
+    :return: "RGBA" image, sharing the memory of "RGBA" arrays
+    """
+    height, width = array.shape[:2]
+    if order == "RGBA" and array.flags.c_contiguous:
+        return Image.frombuffer("RGBA", (width, height), array, "raw", "RGBA", 0, 1)
+    return Image.frombuffer("RGBA", (width, height), np.ascontiguousarray(array), "raw", order, 0, 1)
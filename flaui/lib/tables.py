@@ -0,0 +1,86 @@
+"""This module converts row based table contents read from grid controls into columnar structures.
+
+The "dict" and "numpy" formats are always available, "pandas" and "arrow" require the optional pandas and PyArrow
+packages (`pip install flaui-uiautomation-wrapper[dataframe]`).
+"""
+
+import importlib
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set
+
+TableFormat = Literal["dict", "numpy", "pandas", "arrow"]
+
+_OPTIONAL_MODULES = {"numpy": "numpy", "pandas": "pandas", "arrow": "pyarrow"}
+
+
+def _import_optional(output: str) -> Any:
+    """Imports the optional package backing the given output format.
+
+    :param output: Output format
+    :raises ImportError: If the package is not installed
+    :return: Imported module
+    """
+    module = _OPTIONAL_MODULES[output]
+    try:
+        return importlib.import_module(module)
+    except ImportError as err:
+        raise ImportError(
+            f'Output format "{output}" requires {module}, install it with `pip install flaui-uiautomation-wrapper[dataframe]`'
+        ) from err
+
+
+def column_names(headers: Sequence[Optional[str]], column_count: int) -> List[str]:
+    """Builds unique column names from header texts, missing or blank headers are named column_<index>.
+
+    A name already taken gets the first free numbered suffix, eg. the second "Name" becomes "Name_2" if a header
+    "Name_1" came before it.
+
+    :param headers: Header texts
+    :param column_count: Number of columns in the table
+    :return: Column names
+    """
+    names: List[str] = []
+    # Last suffix given per name, taken names
+    suffixes: Dict[str, int] = {}
+    taken: Set[str] = set()
+    for index in range(max(column_count, len(headers))):
+        name = headers[index] if index < len(headers) and headers[index] else f"column_{index}"
+        if name in taken:
+            suffix = suffixes.get(name, 0) + 1
+            while f"{name}_{suffix}" in taken:
+                suffix += 1
+            suffixes[name] = suffix
+            name = f"{name}_{suffix}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def to_columns(headers: Sequence[Optional[str]], rows: Sequence[Sequence[Any]], output: TableFormat = "dict") -> Any:
+    """Transposes table rows into columns.
+
+    Short rows are padded with None so every column has one value per row.
+
+    :param headers: Header texts, used as column names
+    :param rows: Row values
+    :param output: dict (dict of lists), numpy (dict of arrays), pandas (DataFrame) or arrow (pyarrow Table)
+    :raises ValueError: On an unknown output format
+    :return: Columnar table in the requested format
+    """
+    if output != "dict" and output not in _OPTIONAL_MODULES:
+        raise ValueError(f'Unknown output format "{output}", expected one of dict, numpy, pandas, arrow')
+
+    names = column_names(headers, max((len(_) for _ in rows), default=0))
+    width = len(names)
+    padded = [row if len(row) == width else list(row) + [None] * (width - len(row)) for row in rows]
+    columns: Dict[str, List[Any]] = {name: [row[index] for row in padded] for index, name in enumerate(names)}
+
+    if output == "dict":
+        return columns
+    module = _import_optional(output)
+    if output == "numpy":
+        return {
+            name: module.asarray(values, dtype=object if None in values else None) for name, values in columns.items()
+        }
+    if output == "pandas":
+        return module.DataFrame(columns, columns=names)
+    return module.table(columns)
@@ -17,6 +17,8 @@ from typing import Any, Callable, Optional, Tuple
 
 from System.Threading import ApartmentState, Thread, ThreadStart  # type: ignore
 
+from flaui.lib import tracing
+
 
 class _Result:
     """Hold the outcome of a scheduled callable.
@@ -100,6 +102,24 @@ class STAThreadExecutor:
         :return: The callable's return value.
         :raises BaseException: Any exception raised by the callable.
         """
+        tracer = tracing.active
+        if tracer is not None:
+            name = getattr(func, "__qualname__", repr(func))
+            # The element is the bound instance or the first argument, never the dispatched callable itself
+            target = getattr(func, "__self__", None)
+            if target is None and args:
+                target = args[0]
+            return tracer.call(name, "sta", self._dispatch, (func, *args), kwargs, identity_target=target)
+        return self._dispatch(func, *args, **kwargs)
+
+    def _dispatch(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Queue the callable for the STA thread and wait for its result.
+
+        :param func: Callable to execute on the STA thread.
+        :param args: Positional arguments forwarded to the callable.
+        :param kwargs: Keyword arguments forwarded to the callable.
+        :return: The callable's return value.
+        """
         res = _Result()
         self._queue.put((func, args, kwargs, res))
         return res.result()
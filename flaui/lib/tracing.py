@@ -0,0 +1,255 @@
+"""This module provides opt-in tracing of the calls crossing the Python / .NET boundary.
+
+While a tracer is active, every method or property wrapped with `handle_csharp_exceptions` and every callable run
+through `STAThreadExecutor.run` is recorded into a ring buffer: name, element identity (AutomationId/ControlType),
+start, duration, thread and outcome. Traces are exported as Chrome trace-event JSON (open them in chrome://tracing or
+https://ui.perfetto.dev) or aggregated per method.
+
+When no tracer is active the hooks only check `tracing.active` for None, so tracing costs next to nothing when off.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+# Number of calls kept by default, older calls are dropped first
+DEFAULT_CAPACITY = 100_000
+
+
+class TraceEvent(NamedTuple):
+    """A traced call, kept as a tuple to keep recording cheap."""
+
+    name: str
+    category: str  # "wrapper" for handle_csharp_exceptions, "sta" for STAThreadExecutor.run
+    element: Optional[str]  # AutomationId/ControlType of the element the call was made on
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    outcome: str  # "ok" or the name of the raised exception type
+
+
+class MethodStats(BaseModel):
+    """Aggregated timings of all traced calls of a method."""
+
+    name: str
+    calls: int
+    errors: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+def element_identity(target: Any) -> Optional[str]:
+    """Describes the element a call was made on as AutomationId/ControlType.
+
+    Properties are read from the raw C# element, so reading them is not traced itself.
+
+    :param target: First argument of the traced call (eg. an element wrapper)
+    :return: Element identity, None if the target is not an element or cannot be read
+    """
+    raw = getattr(target, "raw_element", None)
+    if raw is None:
+        return None
+    try:
+        properties = raw.Properties
+        return f"{properties.AutomationId.ValueOrDefault}/{properties.ControlType.ValueOrDefault}"
+    except Exception:
+        return None
+
+
+class Tracer:
+    """Records traced calls into a ring buffer."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        capture_elements: bool = True,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        """Creates a tracer.
+
+        :param capacity: Number of calls kept, defaults to DEFAULT_CAPACITY
+        :param capture_elements: Record the identity of the element every call is made on, defaults to True
+        :param clock: Monotonic clock in nanoseconds, defaults to time.perf_counter_ns
+        """
+        self._events: Deque[TraceEvent] = deque(maxlen=capacity)
+        self._capture_elements = capture_elements
+        self._clock = clock
+        self.dropped = 0  # Calls pushed out of the ring buffer
+
+    def __len__(self) -> int:
+        """Number of calls in the ring buffer."""
+        return len(self._events)
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        """Traced calls, oldest first."""
+        return list(self._events)
+
+    def clear(self) -> None:
+        """Drops all traced calls."""
+        self._events.clear()
+        self.dropped = 0
+
+    def call(
+        self,
+        name: str,
+        category: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        identity_target: Any = None,
+    ) -> Any:
+        """Calls the function and records the call.
+
+        :param name: Traced name of the call
+        :param category: Trace category
+        :param func: Function to call
+        :param args: Positional arguments, the first one is used for the element identity unless identity_target is set
+        :param kwargs: Keyword arguments
+        :param identity_target: Object the element identity is read from, defaults to the first positional argument
+        :return: The return value of the function
+        """
+        outcome = "ok"
+        start = self._clock()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            duration = self._clock() - start
+            element = None
+            if self._capture_elements:
+                if identity_target is None and args:
+                    identity_target = args[0]
+                element = element_identity(identity_target)
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(TraceEvent(name, category, element, start, duration, threading.get_ident(), outcome))
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Exports the traced calls as Chrome trace-event complete ("X") events.
+
+        :return: Trace in the Chrome trace-event JSON object format
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": event.start_ns / 1000.0,
+                "dur": event.duration_ns / 1000.0,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": {"element": event.element, "outcome": event.outcome},
+            }
+            for event in self._events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"dropped": self.dropped}}
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Writes the traced calls as a Chrome trace-event JSON file.
+
+        :param path: Output file path
+        :return: Output file path
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+    def aggregate(self) -> List[MethodStats]:
+        """Aggregates the traced calls per method.
+
+        :return: Timings per method, the most expensive in total first
+        """
+        totals: Dict[str, List[int]] = {}  # name: [calls, errors, total ns, max ns]
+        for event in self._events:
+            stats = totals.setdefault(event.name, [0, 0, 0, 0])
+            stats[0] += 1
+            stats[1] += event.outcome != "ok"
+            stats[2] += event.duration_ns
+            stats[3] = max(stats[3], event.duration_ns)
+        return sorted(
+            (
+                MethodStats(
+                    name=name,
+                    calls=calls,
+                    errors=errors,
+                    total_ms=total / 1e6,
+                    mean_ms=total / calls / 1e6,
+                    max_ms=maximum / 1e6,
+                )
+                for name, (calls, errors, total, maximum) in totals.items()
+            ),
+            key=lambda _: _.total_ms,
+            reverse=True,
+        )
+
+    def format_table(self, limit: Optional[int] = 20) -> str:
+        """Formats the per method aggregate as a text table.
+
+        :param limit: Number of methods shown, None shows all, defaults to 20
+        :return: Text table
+        """
+        rows = self.aggregate()[:limit]
+        width = max([len(_.name) for _ in rows] + [len("method")])
+        lines = [f"{'method':<{width}} {'calls':>8} {'errors':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        lines += [
+            f"{_.name:<{width}} {_.calls:>8} {_.errors:>6} {_.total_ms:>10.3f} {_.mean_ms:>9.3f} {_.max_ms:>9.3f}"
+            for _ in rows
+        ]
+        return "\n".join(lines)
+
+
+# The active tracer, checked by the hooks on every call, None while tracing is off
+active: Optional[Tracer] = None
+
+
+def enable(capacity: int = DEFAULT_CAPACITY, capture_elements: bool = True) -> Tracer:
+    """Starts tracing with a new tracer.
+
+    :param capacity: Number of calls kept, defaults to DEFAULT_CAPACITY
+    :param capture_elements: Record the identity of the element every call is made on, defaults to True
+    :return: The active tracer
+    """
+    global active
+    active = Tracer(capacity=capacity, capture_elements=capture_elements)
+    return active
+
+
+def disable() -> Optional[Tracer]:
+    """Stops tracing.
+
+    :return: The tracer which was active, if any
+    """
+    global active
+    tracer, active = active, None
+    return tracer
+
+
+@contextmanager
+def trace(capacity: int = DEFAULT_CAPACITY, capture_elements: bool = True) -> Iterator[Tracer]:
+    """Traces the calls made within the context, the previously active tracer (if any) is restored on exit.
+
+    :param capacity: Number of calls kept, defaults to DEFAULT_CAPACITY
+    :param capture_elements: Record the identity of the element every call is made on, defaults to True
+    :return: The active tracer
+    """
+    global active
+    previous = active
+    tracer = enable(capacity=capacity, capture_elements=capture_elements)
+    try:
+        yield tracer
+    finally:
+        active = previous
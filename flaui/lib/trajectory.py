@@ -0,0 +1,216 @@
+"""This module plans input trajectories (mouse moves, drags, touch transitions) up front as NumPy arrays.
+
+FlaUI's Interpolation calls back from C# into Python on every interval tick and builds the intermediate points one by
+one. The planner computes every step of a linear, bezier or rotation path in a single vectorised pass instead, and the
+trajectory is then either handed to an action as one batch or replayed at the target cadence with the timing jitter
+measured. Points are truncated to integer pixels the same way FlaUI's Interpolation does.
+"""
+
+from enum import Enum
+import math
+import time
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+Coordinate = Tuple[float, float]
+
+# Remaining time (in seconds) below which the replay busy-waits instead of sleeping, sleep granularity is ~1 ms or worse
+_SPIN_THRESHOLD = 0.002
+
+
+class Easing(Enum):
+    """Easing curves mapping the elapsed time fraction to the travelled distance fraction."""
+
+    Linear = "linear"
+    EaseIn = "ease_in"
+    EaseOut = "ease_out"
+    EaseInOut = "ease_in_out"
+
+
+_EASING_FUNCTIONS: Dict[Easing, Callable[[np.ndarray], np.ndarray]] = {
+    Easing.Linear: lambda t: t,
+    Easing.EaseIn: lambda t: t**3,
+    Easing.EaseOut: lambda t: 1 - (1 - t) ** 3,
+    Easing.EaseInOut: lambda t: np.where(t < 0.5, 4 * t**3, 1 - (-2 * t + 2) ** 3 / 2),
+}
+
+
+class Trajectory(BaseModel):
+    """A planned trajectory of one or more points (eg. fingers)."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    times_ms: np.ndarray  # Planned time offset of each step in milliseconds, shape (steps,)
+    points: np.ndarray  # Integer positions per step, shape (steps, number of points, 2)
+
+    def __len__(self) -> int:
+        """Number of steps in the trajectory."""
+        return len(self.times_ms)
+
+    @property
+    def duration_ms(self) -> float:
+        """Planned duration of the trajectory in milliseconds."""
+        return float(self.times_ms[-1]) if len(self.times_ms) else 0.0
+
+
+class ReplayReport(BaseModel):
+    """Timing report of a trajectory replay, jitter is the delay of each step against its planned time."""
+
+    steps: int
+    planned_duration_ms: float
+    actual_duration_ms: float
+    mean_jitter_ms: float
+    p95_jitter_ms: float
+    max_jitter_ms: float
+
+
+def _timeline(duration_ms: float, interval_ms: float, skip_initial_position: bool) -> np.ndarray:
+    """Builds the planned step times, one per interval and always ending exactly at the duration.
+
+    :param duration_ms: The total duration in milliseconds
+    :param interval_ms: The interval of each step in milliseconds
+    :param skip_initial_position: Skip the step at time 0
+    :raises ValueError: On a non-positive interval or a negative duration
+    :return: Step times in milliseconds
+    """
+    if interval_ms <= 0 or duration_ms < 0:
+        raise ValueError("`interval_ms` must be positive and `duration_ms` must not be negative")
+    steps = max(math.ceil(duration_ms / interval_ms), 1)
+    times = np.minimum(np.arange(steps + 1, dtype=np.float64) * interval_ms, duration_ms)
+    return times[1:] if skip_initial_position else times
+
+
+def _fractions(times_ms: np.ndarray, duration_ms: float, easing: Easing) -> np.ndarray:
+    """Maps the step times to eased progress fractions in [0, 1].
+
+    :param times_ms: Step times in milliseconds
+    :param duration_ms: The total duration in milliseconds
+    :param easing: Easing curve
+    :return: Progress fraction per step
+    """
+    progress = times_ms / duration_ms if duration_ms > 0 else np.ones_like(times_ms)
+    return _EASING_FUNCTIONS[easing](progress)
+
+
+def plan_linear(
+    start_end_points: Sequence[Tuple[Coordinate, Coordinate]],
+    duration_ms: float,
+    interval_ms: float = 10,
+    easing: Easing = Easing.Linear,
+    skip_initial_position: bool = False,
+) -> Trajectory:
+    """Plans the transition of the given points from their start to their end position.
+
+    :param start_end_points: (start, end) coordinates per point
+    :param duration_ms: The total duration for the transition in milliseconds
+    :param interval_ms: The interval of each step in milliseconds, defaults to 10
+    :param easing: Easing curve, defaults to Easing.Linear
+    :param skip_initial_position: Skip the step for the initial position, defaults to False
+    :return: Planned trajectory
+    """
+    times = _timeline(duration_ms, interval_ms, skip_initial_position)
+    fractions = _fractions(times, duration_ms, easing)[:, None, None]
+    ends = np.asarray(start_end_points, dtype=np.float64).reshape(-1, 2, 2)
+    points = ends[None, :, 0] + (ends[None, :, 1] - ends[None, :, 0]) * fractions
+    return Trajectory(times_ms=times, points=points.astype(np.int32))
+
+
+def plan_bezier(
+    control_points: Sequence[Coordinate],
+    duration_ms: float,
+    interval_ms: float = 10,
+    easing: Easing = Easing.Linear,
+    skip_initial_position: bool = False,
+) -> Trajectory:
+    """Plans the transition of a single point along a bezier curve of any degree.
+
+    :param control_points: Control points of the curve, the first and last being the start and end positions
+    :param duration_ms: The total duration for the transition in milliseconds
+    :param interval_ms: The interval of each step in milliseconds, defaults to 10
+    :param easing: Easing curve, defaults to Easing.Linear
+    :param skip_initial_position: Skip the step for the initial position, defaults to False
+    :raises ValueError: If less than two control points are given
+    :return: Planned trajectory
+    """
+    controls = np.asarray(control_points, dtype=np.float64).reshape(-1, 2)
+    if len(controls) < 2:
+        raise ValueError("A bezier curve needs at least two control points")
+    times = _timeline(duration_ms, interval_ms, skip_initial_position)
+    t = _fractions(times, duration_ms, easing)[:, None]
+    degree = len(controls) - 1
+    # Bernstein basis polynomials, shape (steps, number of control points)
+    basis = np.stack(
+        [math.comb(degree, i) * t[:, 0] ** i * (1 - t[:, 0]) ** (degree - i) for i in range(degree + 1)], axis=1
+    )
+    points = basis @ controls
+    return Trajectory(times_ms=times, points=points[:, None, :].astype(np.int32))
+
+
+def plan_rotation(
+    center: Coordinate,
+    radius: float,
+    start_angle: float,
+    end_angle: float,
+    duration_ms: float,
+    interval_ms: float = 10,
+    easing: Easing = Easing.Linear,
+    skip_initial_position: bool = False,
+) -> Trajectory:
+    """Plans the rotation of a single point around the given center.
+
+    :param center: The center point of the rotation
+    :param radius: The radius of the rotation
+    :param start_angle: The starting angle (in radians)
+    :param end_angle: The ending angle (in radians)
+    :param duration_ms: The total duration for the transition in milliseconds
+    :param interval_ms: The interval of each step in milliseconds, defaults to 10
+    :param easing: Easing curve, defaults to Easing.Linear
+    :param skip_initial_position: Skip the step for the initial position, defaults to False
+    :return: Planned trajectory
+    """
+    times = _timeline(duration_ms, interval_ms, skip_initial_position)
+    angles = start_angle + (end_angle - start_angle) * _fractions(times, duration_ms, easing)
+    points = np.stack([center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)], axis=1)
+    return Trajectory(times_ms=times, points=points[:, None, :].astype(np.int32))
+
+
+def replay(
+    trajectory: Trajectory,
+    action: Callable[[np.ndarray], Any],
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayReport:
+    """Replays a trajectory at its planned cadence, calling the action with the (number of points, 2) array of every step.
+
+    Every step is scheduled against the start time rather than the previous step, so delays do not accumulate.
+
+    :param trajectory: Planned trajectory
+    :param action: The action to execute for each step
+    :param clock: Monotonic clock in seconds, defaults to time.perf_counter
+    :param sleep: Sleep function in seconds, defaults to time.sleep
+    :return: Timing report of the replay
+    """
+    offsets = trajectory.times_ms / 1000.0
+    actual = np.empty_like(offsets)
+    start = clock()
+    for index, points in enumerate(trajectory.points):
+        remaining = start + offsets[index] - clock()
+        if remaining > _SPIN_THRESHOLD:
+            sleep(remaining - _SPIN_THRESHOLD)
+        while clock() < start + offsets[index]:
+            pass
+        actual[index] = clock() - start
+        action(points)
+    end = clock()
+
+    jitter = (actual - offsets) * 1000.0
+    return ReplayReport(
+        steps=len(trajectory),
+        planned_duration_ms=trajectory.duration_ms,
+        actual_duration_ms=(end - start) * 1000.0,
+        mean_jitter_ms=float(jitter.mean()) if len(jitter) else 0.0,
+        p95_jitter_ms=float(np.percentile(jitter, 95)) if len(jitter) else 0.0,
+        max_jitter_ms=float(jitter.max()) if len(jitter) else 0.0,
+    )
@@ -1,13 +1,12 @@
 """This module contains the wrapper for FlaUI's UIAutomation class. This class is a custom class designed to ease the usage of FlaUI's UIAutomation class in Python."""
 
-from typing import Any
-
-from FlaUI.UIA2 import UIA2Automation  # pyright: ignore
-from FlaUI.UIA3 import UIA3Automation  # pyright: ignore
+from typing import Any, Callable, Union
 
 from flaui.core.application import Application
 from flaui.core.condition_factory import ConditionFactory
 from flaui.lib.enums import UIAutomationTypes
+from flaui.lib.events import EventQueue
+from flaui.lib.pythonnet_bridge import ensure_backend_loaded
 
 
 class Automation:
@@ -36,7 +35,37 @@ class Automation:
         """
         self._ui_automation_types: UIAutomationTypes = ui_automation_type
         self.timeout: int = timeout
-        self.cs_automation: Any = UIA3Automation() if ui_automation_type == UIAutomationTypes.UIA3 else UIA2Automation()
+        # Backend assemblies are loaded on first use, so only the chosen backend pays the load cost
+        ensure_backend_loaded(ui_automation_type)
+        if ui_automation_type == UIAutomationTypes.UIA3:
+            from FlaUI.UIA3 import UIA3Automation  # pyright: ignore
+
+            self.cs_automation: Any = UIA3Automation()
+        else:
+            from FlaUI.UIA2 import UIA2Automation  # pyright: ignore
+
+            self.cs_automation = UIA2Automation()
         self.cf = ConditionFactory(raw_cf=self.cs_automation.ConditionFactory)
         self.tree_walker: Any = self.cs_automation.TreeWalkerFactory.GetRawViewWalker()
         self.application: Application = Application()
+
+    def register_focus_changed_event(self, action: Union[Callable[..., None], EventQueue]) -> Any:
+        """Registers a focus changed event, raised whenever the keyboard focus moves to another element.
+
+        :param action: Called with the newly focused element, or an EventQueue receiving the events
+        :return: Registered event handler, pass it to `unregister_focus_changed_event` to unregister
+        """
+        if isinstance(action, EventQueue):
+            action = action.callback("focus_changed")
+        return self.cs_automation.RegisterFocusChangedEvent(action)
+
+    def unregister_focus_changed_event(self, handler: Any) -> None:
+        """Unregisters a focus changed event.
+
+        :param handler: Event handler returned by `register_focus_changed_event`
+        """
+        self.cs_automation.UnregisterFocusChangedEvent(handler)
+
+    def unregister_all_events(self) -> None:
+        """Unregisters all event handlers registered on this automation."""
+        self.cs_automation.UnregisterAllEvents()
@@ -4,6 +4,7 @@ from typing import Any, Generator
 
 from dirty_equals import HasAttributes, IsList
 from flaui.core.automation_elements import Grid
+from flaui.lib.enums import UIAutomationTypes
 import pytest
 
 from tests.test_utilities.elements.winforms_application import WinFormsApplicationElements
@@ -69,3 +70,33 @@ class TestGrid:
                 },
                 length=2,
             )
+
+
+@pytest.mark.wpf_only
+class TestDataGridRows:
+    """Tests streaming the rows of the WPF DataGrid page by page."""
+
+    @pytest.fixture(name="data_grid")
+    def get_data_grid(
+        self,
+        test_application: WinFormsApplicationElements | WPFApplicationElements,
+        ui_automation_type: UIAutomationTypes,
+        skip_on_winforms: None,
+    ) -> Generator[Grid, Any, None]:
+        """Returns the WPF DataGrid as a grid element.
+
+        :param test_application: Test application elements.
+        :param ui_automation_type: UI automation type.
+        :param skip_on_winforms: Fixture that skips WinForms tests.
+        :yield: DataGrid element.
+        """
+        if ui_automation_type == UIAutomationTypes.UIA2:
+            pytest.skip("Fails on UIA2 WPF applications.")
+        yield test_application.complex_controls_tab.data_grid_view.as_grid()
+
+    def test_iter_rows(self, data_grid: Grid) -> None:
+        """Tests that every row is yielded once, in order, with its row index."""
+        rows = list(data_grid.iter_rows())
+
+        assert [row_index for row_index, _ in rows] == list(range(data_grid.row_count))
+        assert [values[:2] for _, values in rows[:2]] == [["John", "12"], ["Doe", "24"]]
@@ -1,51 +1,52 @@
-"""Test for focus changed event handling, ported from C# FocusChangedTests.cs."""
-# TODO: Implement this test when RegisterFocusChangedEvent is created in UIA3
-# """
-# Test for focus changed event handling, ported from C# FocusChangedTests.cs.
-# """
-
-# import os
-# import time
-
-# from flaui.lib.enums import UIAutomationTypes
-# from flaui.modules.automation import Automation
-# import pytest
-
-
-# # Only run this test on Windows with mspaint available
-# @pytest.mark.skipif(os.name != "nt", reason="Requires Windows and mspaint.exe")
-# def test_focus_changed_with_paint():
-#     """Test focus changed event handling in mspaint (parity with C#)."""
-#     automation = Automation(UIAutomationTypes.UIA3)
-#     app = automation.application.launch("mspaint")
-#     try:
-#         app.wait_while_main_handle_is_missing(5)
-#         focus_changed_elements = []
-#         main_window = app.get_main_window(automation)
-#         # Register focus changed event
-#         x = automation.register_focus_changed_event(lambda element: focus_changed_elements.append(str(element)))
-#         time.sleep(0.1)
-#         # Find and click the Resize button
-#         resize_text = "Resize"
-#         button1 = main_window.find_first_descendant(
-#             lambda cf: cf.by_control_type("Button").and_(cf.by_text(resize_text))
-#         )
-#         button1.as_button().invoke()
-#         time.sleep(0.1)
-#         # Find and click the Pixels radio button
-#         pixels_text = "Pixels"
-#         radio2 = main_window.find_first_descendant(
-#             lambda cf: cf.by_control_type("RadioButton").and_(cf.by_text(pixels_text))
-#         )
-#         radio2.get_clickable_point().click()
-#         time.sleep(0.1)
-#         # Press Escape to close dialog
-#         from flaui.core.input import Keyboard, VirtualKeyShort
-
-#         Keyboard.press(VirtualKeyShort.ESCAPE)
-#         time.sleep(0.1)
-#         x.dispose()
-#         main_window.close()
-#         assert len(focus_changed_elements) > 0, "Should have received focus changed events."
-#     finally:
-#         app.close()
+"""Test for focus changed event handling, ported from C# FocusChangedTests.cs.
+
+The C# test moves the focus within mspaint, this port moves it between the text boxes of the test applications.
+"""
+
+from typing import Any, Generator
+
+from flaui.lib.events import EventQueue
+from flaui.modules.automation import Automation
+import pytest
+
+from tests.test_utilities.base import FlaUITestBase
+from tests.test_utilities.elements.winforms_application import WinFormsApplicationElements
+from tests.test_utilities.elements.wpf_application import WPFApplicationElements
+
+
+class TestFocusChanged:
+    """Tests for the focus changed event of the automation."""
+
+    @pytest.fixture(name="automation")
+    def get_automation(self, setup_ui_testing_environment: FlaUITestBase) -> Generator[Automation, Any, None]:
+        """Fixture to get the automation of the test application.
+
+        :param setup_ui_testing_environment: Test application under test.
+        :yield: Automation object.
+        """
+        yield setup_ui_testing_environment.automation
+
+    def test_focus_changed(
+        self, automation: Automation, test_application: WinFormsApplicationElements | WPFApplicationElements
+    ) -> None:
+        """Test that moving the focus between two text boxes raises focus changed events for them."""
+        text_box, password_box = (
+            test_application.main_window.find_first_descendant(condition=test_application._cf.by_automation_id(_))
+            for _ in ("TextBox", "PasswordBox")
+        )
+        text_box.focus()
+        focus_events = EventQueue()
+        handler = automation.register_focus_changed_event(focus_events)
+        try:
+            password_box.focus()
+            text_box.focus()
+            records = focus_events.get_batch(timeout=1.0)
+            for _ in range(10):
+                if len(records) >= 2:
+                    break
+                records += focus_events.get_batch(timeout=0.1)
+        finally:
+            automation.unregister_focus_changed_event(handler)
+        focused = [_.sender.Properties.AutomationId.ValueOrDefault for _ in records]
+        assert "PasswordBox" in focused and "TextBox" in focused, "Should have received focus changed events."
+        assert {_.kind for _ in records} == {"focus_changed"}
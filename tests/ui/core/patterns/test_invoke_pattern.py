@@ -4,15 +4,13 @@ Test for Invoke pattern, ported from C# InvokePatternTests.cs.
 C# InvokePatternTests only runs on WPF (2 fixtures):
 [TestFixture(AutomationType.UIA2, TestApplicationType.Wpf)]
 [TestFixture(AutomationType.UIA3, TestApplicationType.Wpf)]
-
-TODO: Update this test once RegisterAutomationEvent is ported to Python wrapper.
-Currently simplified without event handling.
 """
 
 from typing import Any, Generator
 
 from flaui.core.automation_elements import AutomationElement
-from flaui.core.definitions import ControlType
+from flaui.core.definitions import ControlType, TreeScope
+from flaui.lib.events import EventQueue
 from hamcrest import assert_that, not_none
 import pytest
 
@@ -43,55 +41,32 @@ class TestInvokePattern:
         button = tab_item.find_first_descendant(condition=test_application._cf.by_automation_id("InvokableButton"))
         yield button
 
-    @pytest.mark.bug(
-        id="GH-77",
-        url="https://github.com/amruthvvkp/flaui-uiautomation-wrapper/issues/77",
-        reason="RegisterAutomationEvent not yet ported to Python wrapper",
-    )
-    @pytest.mark.skip(reason="TODO: Implement once RegisterAutomationEvent is ported to Python wrapper")
-    def test_invoke_with_event(
-        self,
-        invokable_button: AutomationElement,
-    ) -> None:
-        """Test invoke pattern and event on InvokableButton control.
+    def test_invoke_with_event(self, invokable_button: AutomationElement) -> None:
+        """Test that invoking the button raises the Invoked event and changes its name.
 
-        This is a simplified version that will be enhanced once event handling is available.
+        Ported from InvokePatternTests.cs::InvokeWithEventTest
         """
         assert_that(invokable_button, not_none())
-        orig_button_text = invokable_button.properties.name  # noqa: F841
+        orig_button_text = invokable_button.properties.name
         invoke_pattern = (
             invokable_button.patterns.Invoke.Pattern
         )  # TODO: Move Patterns to Py-wrapper once it is created
         assert_that(invoke_pattern, not_none())
-
-        # TODO: Add event registration when RegisterAutomationEvent is ported
-        # For now, just test basic invoke without event verification
-        invoke_pattern.Invoke()
-        # Button text should change after invoke (verification without event handler)
-        # This may need refinement based on actual behavior
-
-
-#         orig_button_text = invokable_button.properties.name
-#         invoke_pattern = (
-#             invokable_button.patterns.Invoke.Pattern
-#         )  # TODO: Move Patterns to Py-wrapper once it is created
-#         assert_that(invoke_pattern, not_none())
-#         invoke_fired = threading.Event()
-
-#         # Register event handler (PythonNet interop, may need adjustment for your wrapper)
-#         def on_invoked(element, event_id):
-#             invoke_fired.set()
-
-#         # This assumes RegisterAutomationEvent is exposed and works as in C#
-#         registered_event = invokable_button.register_automation_event(
-#             invoke_pattern.EventIds.InvokedEvent,
-#             0,
-#             on_invoked,  # 0 = TreeScope.Element
-#         )
-#         invoke_pattern.Invoke()
-#         event_received = invoke_fired.wait(timeout=1.0)
-#         assert event_received, "Invoke event was not received within timeout"
-#         assert invokable_button.properties.name != orig_button_text, "Button text should change after invoke"
-#         # Clean up event handler if needed
-#         if hasattr(registered_event, "dispose"):
-#             registered_event.dispose()
+        invoked_events, name_events = EventQueue(), EventQueue()
+        property_library = invokable_button.raw_element.Automation.PropertyLibrary
+        invoked_handler = invokable_button.register_automation_event(
+            invoke_pattern.EventIds.InvokedEvent, TreeScope.Element, invoked_events
+        )
+        name_handler = invokable_button.register_property_changed_event(
+            TreeScope.Element, name_events, [property_library.Element.Name, property_library.Element.HelpText]
+        )
+        try:
+            invoke_pattern.Invoke()
+            assert invoked_events.get_batch(timeout=1.0), "Invoke event was not received within timeout"
+            assert {_.kind for _ in name_events.get_batch(timeout=1.0)} == {"property_changed"}, (
+                "Name change event was not received within timeout"
+            )
+        finally:
+            invoked_handler.Dispose()
+            name_handler.Dispose()
+        assert invokable_button.properties.name != orig_button_text, "Button text should change after invoke"
@@ -0,0 +1,95 @@
+"""This module contains unit tests to the paging of virtualized grids in Grid.iter_rows."""
+
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+
+from flaui.core.automation_elements import Grid
+import pytest
+
+
+class FakeScrollPattern:
+    """Scroll pattern of a virtualized grid realising `page_size` rows and scrolling by `step` rows per page."""
+
+    def __init__(self, rows: List[Tuple[Optional[int], List[Any]]], page_size: int = 3, step: int = 2) -> None:
+        self.rows = rows
+        self.page_size = page_size
+        self.step = step
+        self.top = 0
+        self.VerticallyScrollable = SimpleNamespace(ValueOrDefault=True)
+
+    @property
+    def VerticalScrollPercent(self) -> SimpleNamespace:
+        """Scroll position in percent, 100 once the last row is realised."""
+        end = len(self.rows) - self.page_size
+        return SimpleNamespace(ValueOrDefault=100.0 * self.top / end if end > 0 else 100.0)
+
+    def Scroll(self, horizontal_amount: int, vertical_amount: int) -> None:
+        """Scrolls one page down."""
+        self.top = min(self.top + self.step, max(len(self.rows) - self.page_size, 0))
+
+    def SetScrollPercent(self, horizontal_percent: float, vertical_percent: float) -> None:
+        """Scrolls to the top."""
+        self.top = 0
+
+    def page(self) -> List[Tuple[Optional[int], List[Any]]]:
+        """Returns the rows realised at the current position."""
+        return self.rows[self.top : self.top + self.page_size]
+
+
+@pytest.fixture(name="make_grid")
+def get_make_grid(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Returns a function building a grid over the given rows, reading the realised rows of the fake scroll pattern.
+
+    :param monkeypatch: Pytest monkeypatch fixture
+    :return: Function taking the rows and returning the grid and its scroll pattern
+    """
+
+    def make_grid(rows: List[Tuple[Optional[int], List[Any]]]) -> Tuple[Grid, FakeScrollPattern]:
+        """Builds the grid.
+
+        :param rows: (row index, cell values) per row
+        :return: Grid and its scroll pattern
+        """
+        pattern = FakeScrollPattern(rows)
+        raw_element = SimpleNamespace(
+            RowCount=len(rows), Patterns=SimpleNamespace(Scroll=SimpleNamespace(PatternOrDefault=pattern))
+        )
+        monkeypatch.setattr(Grid, "_read_visible_rows", lambda self, read_header=False: ([], pattern.page()))
+        return Grid(raw_element=raw_element), pattern
+
+    return make_grid
+
+
+class TestGridRows:
+    """Tests streaming the rows of a virtualized grid page by page."""
+
+    def test_rows_are_yielded_once_in_order(self, make_grid: Any) -> None:
+        """Test that rows realised on two pages are yielded once, including identical rows across a page boundary."""
+        rows = [(_, ["same", "row"] if _ in (2, 3) else [str(_)]) for _ in range(7)]
+        grid, pattern = make_grid(rows)
+        pattern.top = 4
+
+        assert list(grid.iter_rows()) == rows
+
+    def test_rows_without_index_are_never_skipped(self, make_grid: Any) -> None:
+        """Test that rows without row index are numbered in reading order and yielded for every scroll position."""
+        grid, _ = make_grid([(None, ["same"]), (None, ["same"]), (None, ["same"]), (None, ["last"])])
+
+        assert [values for _, values in grid.iter_rows()] == [["same"]] * 3 + [["same"], ["same"], ["last"]]
+
+    def test_rows_without_index_stop_once_the_grid_does_not_scroll(self, make_grid: Any) -> None:
+        """Test that pages read again at the same scroll position are not yielded and end the stream."""
+        grid, pattern = make_grid([(None, [str(_)]) for _ in range(5)])
+        pattern.step = 0
+
+        assert list(grid.iter_rows()) == [(0, ["0"]), (1, ["1"]), (2, ["2"])]
+
+    def test_scroll_page(self, make_grid: Any) -> None:
+        """Test that the grid scrolls one page at a time until the last row is realised."""
+        grid, pattern = make_grid([(_, [str(_)]) for _ in range(5)])
+
+        assert grid._scroll_page() is True and pattern.top == 2
+        assert grid._scroll_page() is False
+        assert grid._scroll_page(to_top=True) is True and pattern.top == 0
+        pattern.VerticallyScrollable.ValueOrDefault = False
+        assert grid._scroll_page() is False
@@ -0,0 +1,39 @@
+"""This module contains unit tests to the post-waits of the input module."""
+
+from typing import Any, List, Optional
+
+from flaui.core.input import Mouse, Wait
+import pytest
+
+
+@pytest.fixture(name="waits")
+def get_waits(monkeypatch: pytest.MonkeyPatch) -> List[Optional[float]]:
+    """Records the timeouts passed to Wait.until_input_is_processed instead of waiting.
+
+    :param monkeypatch: Pytest monkeypatch fixture
+    :return: Recorded timeouts
+    """
+    waits: List[Optional[float]] = []
+    monkeypatch.setattr(Wait, "until_input_is_processed", lambda timeout=None, until=None: waits.append(timeout))
+    return waits
+
+
+class TestMousePostWait:
+    """Tests how the post_wait argument of the mouse methods selects the wait."""
+
+    @pytest.mark.parametrize(
+        "post_wait, expected",
+        [(None, []), (False, []), (0, []), (True, [None]), (1, [1.0]), (0.25, [0.25])],
+    )
+    def test_apply_post_wait(
+        self, waits: List[Optional[float]], post_wait: Any, expected: List[Optional[float]]
+    ) -> None:
+        """Test that True waits for the input to be processed with the default timeout and numbers are timeouts."""
+        Mouse._apply_post_wait(post_wait)
+        assert waits == expected
+
+    def test_callable_post_wait(self, waits: List[Optional[float]]) -> None:
+        """Test that callables are called instead of waiting."""
+        calls = []
+        Mouse._apply_post_wait(lambda: calls.append("called"))
+        assert calls == ["called"] and waits == []
@@ -0,0 +1,146 @@
+"""This module contains unit tests to the input_recorder module."""
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from flaui.core.input_recorder import InputRecorder, InputRecording, RecordedEvent, _decode, schedule
+from flaui.lib.trajectory import plan_linear
+
+
+class FakeButton(Enum):
+    """Stands in for the MouseButton enum."""
+
+    Left = 0
+    Right = 1
+
+
+class FakeMouse:
+    """Stands in for the Mouse input class, records its calls instead of sending input."""
+
+    calls = []
+
+    @staticmethod
+    def click(mouse_button=FakeButton.Left, post_wait=0.1):
+        """Records a click, which presses the button through `down`."""
+        FakeMouse.calls.append(("click", mouse_button))
+        FakeMouse.down(mouse_button)
+
+    @staticmethod
+    def down(mouse_button=FakeButton.Left):
+        """Records a button press."""
+        FakeMouse.calls.append(("down", mouse_button))
+
+    @staticmethod
+    def move_along(trajectory, post_wait=0.1):
+        """Records a move along a planned trajectory."""
+        FakeMouse.calls.append(("move_along", len(trajectory)))
+
+
+class FakeElement:
+    """Stands in for a button wrapper."""
+
+    automation_id = "OkButton"
+    name = "OK"
+
+    def invoke(self):
+        """Returns a marker instead of invoking."""
+        return "invoked"
+
+
+class FakeClock:
+    """Clock returning the given times, one per read."""
+
+    def __init__(self, *times):
+        self.times = list(times)
+
+    def __call__(self):
+        """Returns the next time."""
+        return self.times.pop(0)
+
+
+class TestInputRecorder:
+    """Tests recording, storing and scheduling recordings without sending any input."""
+
+    def test_record(self):
+        """
+        Test that outermost calls are recorded with encoded arguments and that the original methods are restored.
+        """
+        original = FakeMouse.__dict__["click"]
+        targets = [("Mouse", FakeMouse, ("click", "down")), ("element", FakeElement, ("invoke",))]
+        with InputRecorder(targets=targets, clock=FakeClock(10.0, 10.5, 12.0)) as recorder:
+            FakeMouse.click(FakeButton.Right)
+            assert FakeElement().invoke() == "invoked"
+
+        assert FakeMouse.__dict__["click"] is original
+        assert FakeMouse.calls == [("click", FakeButton.Right), ("down", FakeButton.Right)]
+        assert recorder.recording.events == [
+            RecordedEvent(
+                t=0.5, target="Mouse", method="click", args={"mouse_button": {"enum": "FakeButton", "name": "Right"}}
+            ),
+            RecordedEvent(
+                t=2.0,
+                target="element",
+                method="invoke",
+                element={"class": "FakeElement", "automation_id": "OkButton", "name": "OK"},
+            ),
+        ]
+
+    def test_save_load(self, tmp_path):
+        """
+        Test that a recording survives a JSONL round trip and that foreign files are rejected.
+        """
+        recording = InputRecording(
+            events=[
+                RecordedEvent(t=0.25, target="Keyboard", method="type", args={"text": "abc"}),
+                RecordedEvent(t=1.5, target="Mouse", method="move_to", args={"point": {"point": [10, 20]}}),
+            ]
+        )
+        path = tmp_path / "recording.jsonl"
+        recording.save(path)
+
+        assert len(path.read_text().splitlines()) == 3
+        assert InputRecording.load(path) == recording
+        assert InputRecording.load(path).duration == 1.5
+
+        path.write_text('{"format": "something-else"}\n')
+        with pytest.raises(ValueError):
+            InputRecording.load(path)
+
+    def test_trajectory_round_trip(self, tmp_path):
+        """
+        Test that a recorded trajectory argument is restored with its timestamps and points after a JSONL round trip.
+        """
+        trajectory = plan_linear([((0, 0), (30, 15))], duration_ms=40)
+        with InputRecorder(targets=[("Mouse", FakeMouse, ("move_along",))], clock=FakeClock(0.0, 1.0)) as recorder:
+            FakeMouse.move_along(trajectory)
+        path = tmp_path / "recording.jsonl"
+        recorder.recording.save(path)
+
+        replayed = _decode(InputRecording.load(path).events[0].args["trajectory"])
+        np.testing.assert_array_equal(replayed.times_ms, trajectory.times_ms)
+        np.testing.assert_array_equal(replayed.points, trajectory.points)
+        assert replayed.points.dtype == trajectory.points.dtype
+
+    @pytest.mark.parametrize(
+        "speed,max_gap,expected",
+        [
+            (1.0, None, [0.5, 3.5, 3.75]),
+            (1.0, 0.5, [0.5, 1.0, 1.25]),
+            (2.0, 0.5, [0.25, 0.5, 0.625]),
+        ],
+    )
+    def test_schedule(self, speed, max_gap, expected):
+        """
+        Test that idle gaps are capped before the speed-up factor is applied.
+        """
+        events = [RecordedEvent(t=t, target="Mouse", method="click") for t in (0.5, 3.5, 3.75)]
+
+        assert schedule(events, speed=speed, max_gap=max_gap) == pytest.approx(expected)
+
+    def test_schedule_invalid_speed(self):
+        """
+        Test that a non-positive speed is rejected.
+        """
+        with pytest.raises(ValueError):
+            schedule([], speed=0)
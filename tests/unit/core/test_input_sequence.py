@@ -0,0 +1,106 @@
+"""This module contains unit tests to the input_sequence module."""
+import sys
+import types
+
+import pytest
+
+from flaui.core.input_sequence import InputEvent, InputSequence, dispatch
+from flaui.lib import capture_cache, property_cache
+
+
+class FakeExecutor:
+    """Stands in for the STA executor, records the dispatches instead of sending input."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    def run(self, func, *args):
+        """Records the dispatch, raises the given error if any."""
+        self.calls.append((func, args))
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture(name="executor")
+def get_executor(monkeypatch):
+    """Replaces the STA executor (whose module needs Python.NET) with a fake one.
+
+    :param monkeypatch: Pytest monkeypatch fixture
+    :return: The fake executor
+    """
+    executor = FakeExecutor()
+    module = types.ModuleType("flaui.lib.threading_utils")
+    module.get_sta_executor = lambda: executor
+    monkeypatch.setitem(sys.modules, "flaui.lib.threading_utils", module)
+    return executor
+
+
+class TestInputSequence:
+    """Tests building and compiling input sequences without sending any input."""
+
+    def test_compile(self):
+        """
+        Test that the builder records one event per step with keys, buttons and points kept by name and coordinates.
+        """
+        events = (
+            InputSequence()
+            .press("SHIFT")
+            .type_key("TAB")
+            .release("SHIFT")
+            .move_to((10, 20))
+            .click((30, 40), mouse_button="Right")
+            .drag((0, 0), (5, 5))
+            .scroll(-3, horizontal=True)
+            .execute(dry_run=True)
+        )
+
+        assert events == [
+            InputEvent(kind="press", args=("SHIFT",)),
+            InputEvent(kind="type_key", args=("TAB",)),
+            InputEvent(kind="release", args=("SHIFT",)),
+            InputEvent(kind="move_to", args=(10, 20)),
+            InputEvent(kind="click", args=("Right", (30, 40))),
+            InputEvent(kind="drag", args=((0, 0), (5, 5), "Left")),
+            InputEvent(kind="horizontal_scroll", args=(-3,)),
+        ]
+
+    def test_merge_sleeps_and_text(self):
+        """
+        Test that adjacent waits and text typing are merged and zero waits are dropped.
+        """
+        sequence = (
+            InputSequence()
+            .type("ab", post_wait=0.1)
+            .wait(0.05)
+            .wait(0)
+            .click()
+            .type("c")
+            .type("d", post_wait=0.2)
+            .wait(0.3)
+        )
+
+        compiled = sequence.compile()
+
+        assert len(sequence) == 9
+        assert [_.kind for _ in compiled] == ["type", "sleep", "click", "type", "sleep"]
+        assert compiled[0].args == ("ab",) and compiled[3].args == ("cd",)
+        assert compiled[1].args[0] == pytest.approx(0.15)
+        assert compiled[4].args[0] == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("error", [None, RuntimeError("Input failed")])
+    def test_execute_invalidates_the_caches(self, executor, error):
+        """
+        Test that executing a sequence dispatches it once and starts new cache generations, even if the input failed.
+        """
+        executor.error = error
+        with capture_cache.cache_captures() as captures, property_cache.cache_properties() as properties:
+            sequence = InputSequence().type("ab").click()
+            if error is None:
+                sequence.execute()
+            else:
+                with pytest.raises(RuntimeError):
+                    sequence.execute()
+
+        assert executor.calls == [(dispatch, (sequence.compile(),))]
+        assert (captures.generation, properties.generation) == (1, 1)
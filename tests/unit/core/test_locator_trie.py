@@ -0,0 +1,146 @@
+"""This module contains unit tests to the locator_trie module."""
+
+from flaui.core.locator_trie import LocatorTrie, child, descendant
+
+
+class FakeConditionFactory:
+    """Builds (property, value) tuples as conditions."""
+
+    def by_automation_id(self, value):
+        """AutomationId condition."""
+        return ("automation_id", value)
+
+    def by_name(self, value):
+        """Name condition."""
+        return ("name", value)
+
+
+class FakeElement:
+    """Element wrapper recording its finds into a list shared by the whole tree."""
+
+    def __init__(self, name, finds, parent=None):
+        self.name = name
+        self.finds = finds
+        self.parent = parent
+        self.available = True
+        self.condition_factory = FakeConditionFactory()
+
+    @property
+    def is_available(self):
+        """Elements are unloaded with their ancestors."""
+        return self.available and (self.parent is None or self.parent.is_available)
+
+    def find_first_child(self, condition):
+        """Records the find and returns a new child."""
+        self.finds.append((self.name, "child", condition[1]))
+        return FakeElement(condition[1], self.finds, self)
+
+    def find_first_descendant(self, condition):
+        """Records the find and returns a new descendant."""
+        self.finds.append((self.name, "descendant", condition[1]))
+        return FakeElement(condition[1], self.finds, self)
+
+
+TAB = [descendant("automation_id", "Tab"), child("name", "Simple Controls")]
+GROUP = [*TAB, child("automation_id", "Group")]
+
+
+def test_siblings_share_resolved_ancestors():
+    """Test that paths sharing a prefix find it once, and live leaves are served without a find."""
+    finds = []
+    trie = LocatorTrie(FakeElement("window", finds))
+
+    ok = trie.resolve([*GROUP, child("name", "Ok")])
+    cancel = trie.resolve([*GROUP, child("name", "Cancel")])
+
+    assert (ok.name, cancel.name) == ("Ok", "Cancel")
+    assert finds == [
+        ("window", "descendant", "Tab"),
+        ("Tab", "child", "Simple Controls"),
+        ("Simple Controls", "child", "Group"),
+        ("Group", "child", "Ok"),
+        ("Group", "child", "Cancel"),
+    ]
+    assert trie.resolve([*GROUP, child("name", "Ok")]) is ok
+    assert (trie.hits, trie.finds, len(trie)) == (1, 5, 5)
+
+
+def test_stale_leaf_is_found_below_its_live_parent():
+    """Test that a stale leaf is found again with a single find below its parent."""
+    finds = []
+    trie = LocatorTrie(FakeElement("window", finds))
+    ok = trie.resolve([*GROUP, child("name", "Ok")])
+    del finds[:]
+
+    ok.available = False
+    assert trie.resolve([*GROUP, child("name", "Ok")]) is not ok
+    assert finds == [("Group", "child", "Ok")]
+
+
+def test_stale_ancestor_drops_its_subtree():
+    """Test that the path below a stale ancestor is found again, and its other descendants are dropped."""
+    finds = []
+    trie = LocatorTrie(FakeElement("window", finds))
+    trie.resolve([*GROUP, child("name", "Ok")])
+    trie.resolve([*GROUP, child("name", "Cancel")])
+    tab_item = trie.resolve(TAB)
+    del finds[:]
+
+    tab_item.available = False
+    trie.resolve([*GROUP, child("name", "Ok")])
+
+    assert finds == [
+        ("Tab", "child", "Simple Controls"),
+        ("Simple Controls", "child", "Group"),
+        ("Group", "child", "Ok"),
+    ]
+    assert len(trie) == 4
+
+
+def test_stale_root_is_fetched_again():
+    """Test that a stale root is fetched again from the root function, and the path found below it."""
+    finds = []
+    windows = []
+
+    def main_window():
+        """Returns a new main window."""
+        windows.append(FakeElement("window", finds))
+        return windows[-1]
+
+    trie = LocatorTrie(main_window)
+    trie.resolve(TAB)
+    windows[-1].available = False
+    trie.resolve(TAB)
+
+    assert len(windows) == 2 and trie.finds == 4
+
+
+def test_empty_path_resolves_the_root():
+    """Test that an empty path returns the root, fetched again when it is stale."""
+    windows = []
+
+    def main_window():
+        """Returns a new main window."""
+        windows.append(FakeElement("window", []))
+        return windows[-1]
+
+    trie = LocatorTrie(main_window)
+    assert trie.resolve([]) is windows[0]
+    assert trie.resolve([]) is windows[0]
+    windows[0].available = False
+
+    assert trie.resolve([]) is windows[1]
+    assert (trie.hits, trie.finds, len(trie)) == (1, 0, 0)
+
+
+def test_invalidate():
+    """Test that invalidating a path drops the elements at and below it, unknown paths are ignored."""
+    finds = []
+    trie = LocatorTrie(FakeElement("window", finds))
+    trie.resolve(GROUP)
+
+    trie.invalidate(TAB)
+    trie.invalidate([child("name", "Unknown"), child("name", "Path")])
+    assert len(trie) == 1
+    trie.invalidate()
+    assert len(trie) == 0
@@ -0,0 +1,129 @@
+"""This module contains unit tests to the page_object module."""
+
+from typing import Any
+
+from flaui.core.page_object import PageObject, locator
+from flaui.lib import cache_profile
+
+
+class FakeElement:
+    """Stands in for an element wrapper, stale once `available` is False, disconnected once it is None."""
+
+    def __init__(self, name):
+        self.name = name
+        self.available = True
+
+    @property
+    def is_available(self):
+        """Tells if the element is still available, raises like a disconnected COM object."""
+        if self.available is None:
+            raise RuntimeError("COM object disconnected")
+        return self.available
+
+
+class Finder:
+    """Counts the finds per name."""
+
+    def __init__(self):
+        self.calls = []
+
+    def find(self, name):
+        """Records the find and returns a new element."""
+        self.calls.append(name)
+        return FakeElement(name)
+
+
+class SubPage(PageObject):
+    """Page object nested in `Page`."""
+
+    finder: Any
+
+    @locator
+    def button(self) -> FakeElement:
+        """Finds the button."""
+        return self.finder.find("button")
+
+
+class Page(PageObject):
+    """Page object whose group is found below its window."""
+
+    finder: Any
+
+    @locator
+    def window(self) -> FakeElement:
+        """Finds the window."""
+        return self.finder.find("window")
+
+    @locator
+    def group(self) -> FakeElement:
+        """Resolves the window, then finds the group."""
+        _ = self.window
+        return self.finder.find("group")
+
+    @locator
+    def sub_page(self) -> SubPage:
+        """Creates the nested page object."""
+        return SubPage(finder=self.finder)
+
+
+def test_locators_resolve_once():
+    """Test that a locator finds its element once, and reuses it while it is live."""
+    page = Page(finder=Finder())
+
+    first = page.group
+    assert page.group is first
+    assert page.finder.calls == ["window", "group"]
+
+
+def test_stale_elements_are_resolved_again():
+    """Test that stale and disconnected elements are found again, their live ancestors are not."""
+    page = Page(finder=Finder())
+    group = page.group
+
+    group.available = False
+    assert page.group is not group
+    page.group.available = None
+    _ = page.group
+    assert page.finder.calls == ["window", "group", "group", "group"]
+
+
+def test_sub_pages_are_memoised():
+    """Test that nested page objects are created once, and keep their own memoised elements."""
+    page = Page(finder=Finder())
+
+    assert page.sub_page is page.sub_page
+    assert page.sub_page.button is page.sub_page.button
+    assert page.finder.calls == ["button"]
+
+
+def test_invalidate_locators():
+    """Test that invalidated locators find their elements again, and are not part of the model."""
+    page = Page(finder=Finder())
+    _ = page.group
+
+    page.invalidate_locators("group")
+    _ = page.group
+    page.invalidate_locators()
+    _ = page.group
+
+    assert page.finder.calls == ["window", "group", "group", "window", "group"]
+    assert page.model_dump() == {"finder": page.finder}
+
+
+def test_locators_resolve_within_a_cache_profile_scope():
+    """Test that every locator resolves within the cache profile scope named after it."""
+    scopes = []
+
+    class Recording(Finder):
+        def find(self, name):
+            """Records the current scope before finding."""
+            scopes.append(cache_profile.active.current)
+            return super().find(name)
+
+    cache_profile.enable(record=True)
+    try:
+        _ = Page(finder=Recording()).group
+    finally:
+        cache_profile.disable()
+
+    assert scopes == ["Page.window", "Page.group"]
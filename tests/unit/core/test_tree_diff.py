@@ -0,0 +1,106 @@
+"""This module contains unit tests to the tree_diff module."""
+from flaui.core.tree_diff import diff_snapshots
+from flaui.core.tree_snapshot import SnapshotNode, TreeSnapshot
+
+
+def tree(spec):
+    """Builds a snapshot from nested (id, automation_id, children) tuples, ids become RuntimeIds (42, id)."""
+    nodes = {}
+    stack = [(spec, None)]
+    while stack:
+        (number, automation_id, children), parent = stack.pop()
+        node = SnapshotNode((42, number), {"automation_id": automation_id, "control_type": "Pane"}, parent=parent)
+        nodes[node.runtime_id] = node
+        if parent is not None:
+            nodes[parent].children.append(node.runtime_id)
+        stack.extend((child, node.runtime_id) for child in reversed(children))
+    return TreeSnapshot((42, spec[0]), nodes)
+
+
+def window(**overrides):
+    """Window > (toolbar > (ok, cancel), list > (item_1, item_2))."""
+    specs = {
+        "toolbar": (2, "toolbar", [(3, "ok", []), (4, "cancel", [])]),
+        "list": (5, "list", [(6, "item_1", []), (7, "item_2", [])]),
+    }
+    specs.update(overrides)
+    return tree((1, "window", list(specs.values())))
+
+
+def ids(nodes):
+    """Numbers of the nodes, the second part of their RuntimeIds."""
+    return [_.runtime_id[1] for _ in nodes]
+
+
+def test_identical_trees():
+    """Test that identical snapshots are skipped as one identical region."""
+    diff = diff_snapshots(window(), window())
+
+    assert not diff
+    assert diff.unchanged == 7
+    assert diff.summary() == "0 added, 0 removed, 0 moved, 0 changed, 7 unchanged"
+
+
+def test_added_removed_and_changed():
+    """Test that added, removed and changed nodes are reported, unchanged siblings are not."""
+    before = window()
+    after = window(list=(5, "list", [(7, "item_2", []), (8, "item_3", [])]))
+    after.nodes[(42, 3)].properties["automation_id"] = "okay"
+
+    diff = diff_snapshots(before, after)
+
+    assert ids(diff.added) == [8]
+    assert ids(diff.removed) == [6]
+    assert [(ids([_.after]), _.changes) for _ in diff.changed] == [([3], {"automation_id": ("ok", "okay")})]
+    assert not diff.moved
+
+
+def test_moved_subtree_is_skipped():
+    """Test that a node moved to another parent is reported as moved only."""
+    before = window()
+    after = window(toolbar=(2, "toolbar", [(4, "cancel", [])]), list=(5, "list", [(6, "item_1", []), (7, "item_2", []), (3, "ok", [])]))
+
+    diff = diff_snapshots(before, after)
+
+    assert [ids([_.after]) for _ in diff.moved] == [[3]]
+    assert not diff.added and not diff.removed and not diff.changed
+
+
+def test_path_fallback_for_recreated_elements():
+    """Test that recreated elements are matched by their path, unless the path matching is off."""
+    before = window()
+    after = window(list=(5, "list", [(16, "item_1", []), (17, "item_2", [])]))
+    after.nodes[(42, 17)].properties["control_type"] = "ListItem"
+
+    diff = diff_snapshots(before, after)
+
+    assert ids(diff.added) == [17] and ids(diff.removed) == [7]
+    assert not diff.changed and not diff.moved
+    assert ids(diff_snapshots(before, after, match_by_path=False).added) == [16, 17]
+
+
+def test_same_labels_are_matched_by_order():
+    """Test that recreated siblings with the same path are matched in order."""
+    before = tree((1, "window", [(2, "", []), (3, "", [])]))
+    after = tree((1, "window", [(12, "", []), (13, "", [])]))
+
+    diff = diff_snapshots(before, after)
+
+    assert not diff
+    assert diff.unchanged == 0
+
+
+def test_large_tree_with_one_change():
+    """Test that only the path to a single change is compared in a tree of 50k nodes."""
+    def wide():
+        """Builds a root with 100 groups of 499 cells."""
+        return tree((1, "root", [(1000 * i, f"group_{i}", [(1000 * i + j, f"cell_{j}", []) for j in range(1, 500)]) for i in range(1, 101)]))
+
+    before, after = wide(), wide()
+    after.nodes[(42, 50_250)].properties["automation_id"] = "edited"
+
+    diff = diff_snapshots(before, after)
+
+    assert len(before) == 50_001
+    assert ids([_.after for _ in diff.changed]) == [50_250]
+    assert diff.unchanged == 50_001 - 3  # The root, group_50 and the edited cell are compared
@@ -0,0 +1,129 @@
+"""This module contains unit tests to the tree_snapshot and tree_mirror modules."""
+from flaui.core.tree_mirror import LiveTreeMirror
+from flaui.core.tree_snapshot import TreeSnapshot
+
+from tests.unit.fakes import FakePropertyId, FakeRawElement
+
+
+class FakeElement(FakeRawElement):
+    """Stands in for a (cached) C# element."""
+
+    def __init__(self, runtime_id, automation_id, control_type="Pane", children=()):
+        super().__init__(
+            RuntimeId=[42, runtime_id],
+            AutomationId=automation_id,
+            ControlType=control_type,
+            Name=automation_id,
+            IsEnabled=True,
+            Parent=None,
+            CachedChildren=[],
+        )
+        for child in children:
+            self.add(child)
+
+    def add(self, child, index=None):
+        """Appends the child, or inserts it at the index, and returns it."""
+        child.Parent = self
+        self.CachedChildren.insert(len(self.CachedChildren) if index is None else index, child)
+        return child
+
+
+def capture(element, columns):
+    """Captures the fake tree, counting the captures."""
+    capture.calls.append(element.AutomationId)
+    return TreeSnapshot.from_cached(element, columns)
+
+
+def build():
+    """Window > (toolbar > (ok, cancel), list > item_1)."""
+    ok, cancel = FakeElement(3, "ok", "Button"), FakeElement(4, "cancel", "Button")
+    toolbar = FakeElement(2, "toolbar", children=[ok, cancel])
+    items = FakeElement(5, "list", "List", children=[FakeElement(6, "item_1", "ListItem")])
+    return FakeElement(1, "window", "Window", children=[toolbar, items])
+
+
+def start(window, **kwargs):
+    """Captures a mirror of the fake tree without subscribing to events."""
+    capture.calls = []
+    mirror = LiveTreeMirror(window, capture=capture, **kwargs)
+    mirror.resync()
+    return mirror
+
+
+class TestTreeSnapshot:
+    """Tests copying a cached tree into a snapshot."""
+
+    def test_capture(self):
+        """
+        Test that nodes are keyed by RuntimeId with their properties, links and tree order.
+        """
+        snapshot = TreeSnapshot.from_cached(build())
+
+        assert len(snapshot) == 6 and snapshot.root == (42, 1)
+        assert [_.properties["automation_id"] for _ in snapshot.walk()] == [
+            "window", "toolbar", "ok", "cancel", "list", "item_1"
+        ]
+        assert snapshot[(42, 3)].parent == (42, 2)
+        assert [_.runtime_id for _ in snapshot.find(control_type="Button")] == [(42, 3), (42, 4)]
+        assert snapshot.path((42, 4)) == (("toolbar", "Pane", 0), ("cancel", "Button", 1))
+
+    def test_remove_subtree(self):
+        """
+        Test that removing a node removes its descendants and unlinks it from its parent.
+        """
+        snapshot = TreeSnapshot.from_cached(build())
+        snapshot.remove_subtree((42, 2))
+
+        assert sorted(snapshot.nodes) == [(42, 1), (42, 5), (42, 6)]
+        assert snapshot[(42, 1)].children == [(42, 5)]
+
+
+class TestLiveTreeMirror:
+    """Tests patching the mirror from events."""
+
+    def test_property_changed(self):
+        """
+        Test that property changes update the node without capturing anything.
+        """
+        mirror = start(build())
+        mirror.queue.put("property_changed", FakeElement(3, "ok"), FakePropertyId("Name"), "OK!")
+        mirror.queue.put("property_changed", FakeElement(99, "unknown"), FakePropertyId("Name"), "ignored")
+
+        assert mirror.get((42, 3)).properties["name"] == "OK!"
+        assert capture.calls == ["window"] and mirror.patches == 1
+
+    def test_structure_changed(self):
+        """
+        Test that structure changes capture only the outermost changed subtree, once.
+        """
+        window = build()
+        mirror = start(window)
+        toolbar = window.CachedChildren[0]
+        help_button = toolbar.add(FakeElement(7, "help", "Button"), index=0)
+        del window.CachedChildren[1].CachedChildren[0]
+        mirror.queue.put("structure_changed", help_button, "ChildAdded")
+        mirror.queue.put("structure_changed", toolbar, "ChildrenReordered")
+        mirror.queue.put("structure_changed", window.CachedChildren[1], "ChildRemoved")
+
+        assert [_.properties["automation_id"] for _ in mirror.find(control_type="Button")] == ["help", "ok", "cancel"]
+        assert capture.calls == ["window", "toolbar", "list"]
+        assert mirror.get((42, 6)) is None and mirror.snapshot[(42, 5)].children == []
+        assert mirror.resyncs == 1
+
+    def test_resync(self):
+        """
+        Test that unknown nodes, dropped events and old captures fall back to capturing the whole tree.
+        """
+        now = [0.0]
+        mirror = start(build(), resync_interval=60.0, queue_capacity=1, clock=lambda: now[0])
+
+        mirror.queue.put("structure_changed", FakeElement(99, "unknown"), "ChildrenInvalidated")
+        mirror.refresh()
+        mirror.queue.put("property_changed", FakeElement(3, "ok"), FakePropertyId("Name"), "a")
+        mirror.queue.put("property_changed", FakeElement(3, "ok"), FakePropertyId("Name"), "b")
+        mirror.refresh()
+        now[0] = 60.0
+        mirror.refresh()
+        mirror.refresh()
+
+        assert capture.calls == ["window"] * 4 and mirror.resyncs == 4
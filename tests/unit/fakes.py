@@ -0,0 +1,49 @@
+"""Stand-ins for the clock and the raw C# elements shared by the unit tests."""
+
+from typing import Any
+
+
+class FakeClock:
+    """Clock set by the test, optionally advancing by a fixed step on every read."""
+
+    def __init__(self, now: float = 0, step: float = 0) -> None:
+        self.now = now
+        self.step = step
+
+    def __call__(self) -> float:
+        """Advances the clock by its step and returns the time."""
+        self.now += self.step
+        return self.now
+
+
+class FakeProperty:
+    """Stands in for a C# AutomationProperty."""
+
+    def __init__(self, value: Any) -> None:
+        self.ValueOrDefault = value
+
+
+class FakeProperties:
+    """Stands in for the C# FrameworkAutomationElement properties, reads the attributes of the element."""
+
+    def __init__(self, element: Any) -> None:
+        self._element = element
+
+    def __getattr__(self, name: str) -> FakeProperty:
+        """Returns the element attribute as property, None if the element has no such attribute."""
+        return FakeProperty(getattr(self._element, name, None))
+
+
+class FakeRawElement:
+    """Stands in for a raw C# element, its keyword arguments are its properties (eg. RuntimeId=[42, 1])."""
+
+    def __init__(self, **properties: Any) -> None:
+        self.__dict__.update(properties)
+        self.Properties = FakeProperties(self)
+
+
+class FakePropertyId:
+    """Stands in for a C# PropertyId."""
+
+    def __init__(self, name: str = "Name") -> None:
+        self.Name = name
@@ -0,0 +1,151 @@
+"""This module contains unit tests to the cache_profile module."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from flaui.core.automation_elements import AutomationElement
+from flaui.lib import cache_profile, identity_map
+from flaui.lib.cache_profile import CacheProfile, CacheProfiles
+
+from tests.unit.fakes import FakeRawElement
+
+
+class FakeType:
+    """Stands in for the C# type of the automation."""
+
+    Name = "UIA3Automation"
+
+
+class FakeAutomation:
+    """Stands in for the C# UIA3Automation."""
+
+    def GetType(self):
+        """Returns the type of the automation."""
+        return FakeType()
+
+
+class FakeRequest:
+    """Stands in for the CacheRequest wrapper, tracks whether it is active."""
+
+    def __init__(self):
+        self.is_active = False
+
+    @contextmanager
+    def activate(self):
+        """Marks the request active within the context."""
+        self.is_active = True
+        try:
+            yield
+        finally:
+            self.is_active = False
+
+
+class FakeElement:
+    """Stands in for an element wrapper, not prefetched with any profile."""
+
+    def __init__(self):
+        self.raw_element = FakeRawElement(Automation=FakeAutomation())
+        self._cache_profile = None
+
+
+def profile_with_request(*properties):
+    """Builds a profile whose CacheRequest is already built."""
+    profile = CacheProfile(properties=list(properties))
+    request = profile._requests["UIA3Automation"] = FakeRequest()
+    return profile, request
+
+
+class TestCacheProfiles:
+    """Tests recording the properties read per scope and applying them to finds."""
+
+    def test_record(self, tmp_path):
+        """
+        Test that the profiled properties read within scopes are recorded per key and persisted.
+        """
+        profiles = CacheProfiles(record=True)
+        element = FakeElement()
+        profiles.fetch(element, "name", lambda: "outside")
+        with profiles.scope("page.items"):
+            for name in ("name", "toggle_state", "name", "automation_type"):
+                assert profiles.fetch(element, name, lambda: "value")() == "value"
+            with profiles.scope("page.header"):
+                profiles.fetch(element, "is_enabled", lambda: True)
+        assert profiles.current is None
+
+        loaded = CacheProfiles.load(profiles.save(tmp_path / "profiles.json"))
+        assert {key: _.properties for key, _ in loaded.profiles.items()} == {
+            "page.header": ["is_enabled"],
+            "page.items": ["name", "toggle_state"],
+        }
+        assert loaded.profiles["page.items"].patterns == ["TogglePattern"]
+
+    def test_apply(self):
+        """
+        Test that finds within a scope run under the CacheRequest, and only prefetched properties are read from it.
+        """
+        profile, request = profile_with_request("name")
+        profiles = CacheProfiles(profiles={"page.items": profile})
+        root, found = FakeElement(), [FakeElement(), FakeElement()]
+
+        def find(element):
+            """Checks that the find runs under the CacheRequest."""
+            assert request.is_active
+            return found
+
+        assert profiles.resolve(root, lambda element: found, (), {}) is found
+        assert found[0]._cache_profile is None
+        with profiles.scope("page.items"):
+            assert profiles.resolve(root, find, (), {}) is found
+        assert [_._cache_profile for _ in found] == [profile, profile]
+
+        assert profiles.fetch(found[0], "name", lambda: request.is_active)() is True
+        assert profiles.fetch(found[0], "is_enabled", lambda: request.is_active)() is False
+        assert profiles.fetch(root, "name", lambda: request.is_active)() is False
+
+    def test_apply_to_reused_handles(self):
+        """
+        Test that a handle reused by the identity map holds the raw element of its latest find, and its profile only
+        while that find was profiled.
+        """
+        profile, _ = profile_with_request("name")
+        profiles = CacheProfiles(profiles={"page.items": profile})
+        root = FakeElement()
+        raw_elements = [FakeRawElement(Automation=FakeAutomation(), RuntimeId=[42, 1]) for _ in range(3)]
+
+        with identity_map.reuse_elements():
+            handle = AutomationElement(raw_element=raw_elements[0])
+            with profiles.scope("page.items"):
+                assert (
+                    profiles.resolve(root, lambda element: AutomationElement(raw_element=raw_elements[1]), (), {})
+                    is handle
+                )
+            assert handle.raw_element is raw_elements[1] and handle._cache_profile is profile
+
+            assert AutomationElement(raw_element=raw_elements[2]) is handle
+            assert handle.raw_element is raw_elements[2] and handle._cache_profile is None
+
+    def test_enable_disable(self, tmp_path):
+        """
+        Test that recorded profiles are saved on disable, and loaded to be applied on the next enable.
+        """
+        path = tmp_path / "profiles.json"
+        profiles = cache_profile.enable(path, record=True)
+        with cache_profile.scope("page"):
+            profiles.fetch(FakeElement(), "class_name", lambda: "Button")
+        assert cache_profile.disable() is profiles
+
+        applied = cache_profile.enable(path)
+        assert not applied.record and applied.profiles["page"].properties == ["class_name"]
+        cache_profile.disable()
+        with cache_profile.scope("page"):
+            assert cache_profile.active is None
+
+    def test_invalid_file(self, tmp_path):
+        """
+        Test that files which are not profiles are rejected.
+        """
+        path = tmp_path / "other.json"
+        path.write_text('{"format": "other"}')
+        with pytest.raises(ValueError):
+            CacheProfiles.load(path)
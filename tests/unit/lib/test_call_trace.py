@@ -0,0 +1,104 @@
+"""This module contains unit tests to the call_trace module."""
+import gzip
+
+import pytest
+
+from flaui.lib.call_trace import CallRecorder, CallReplay
+
+from tests.unit.fakes import FakeClock, FakeRawElement
+
+
+class Node(FakeRawElement):
+    """Stands in for a C# element."""
+
+    def __init__(self, automation_id, children=()):
+        super().__init__(AutomationId=automation_id, ControlType="Button")
+        self.children = list(children)
+
+    def FindAllChildren(self):
+        """Returns the children."""
+        return self.children
+
+    def FindChild(self, automation_id):
+        """Returns the child with the given AutomationId, None if there is none."""
+        return next((_ for _ in self.children if _.AutomationId == automation_id), None)
+
+    def Focus(self):
+        """Raises, so the recording of exceptions is tested."""
+        raise ValueError("Element is not focusable")
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """Records a short session and returns the saved trace file."""
+    recorder = CallRecorder(clock=FakeClock(step=500))
+    root = recorder.wrap(Node("root", [Node("a"), Node("b")]), "root")
+
+    assert isinstance(root, Node)
+    assert [_.AutomationId for _ in root.FindAllChildren()] == ["a", "b"]
+    assert root.FindChild("b").AutomationId == "b"
+    assert root.FindChild("c") is None
+    with pytest.raises(ValueError):
+        root.Focus()
+    assert root.AutomationId == "root"
+    root.AutomationId = "renamed"
+    assert root.AutomationId == "renamed"
+
+    assert len(recorder) == 10
+    return recorder.save(tmp_path / "session.trace.jsonl.gz")
+
+
+class TestCallTrace:
+    """Tests recording call traffic and replaying it."""
+
+    def test_replay(self, recorded):
+        """
+        Test that recorded responses are served by object, member and arguments, and recorded exceptions are raised.
+        """
+        replay = CallReplay.load(recorded)
+        root = replay.root("root")
+
+        assert isinstance(root, Node)
+        children = root.FindAllChildren()
+        assert [_.AutomationId for _ in children] == ["a", "b"]
+        assert root.FindChild("c") is None
+        assert root.FindChild("b").AutomationId == "b"
+        with pytest.raises(ValueError, match="not focusable"):
+            root.Focus()
+        assert replay.objects[1]["id"] == "a/Button"
+
+    def test_repeated_responses(self, recorded):
+        """
+        Test that repeated reads get the recorded responses in order and the last one once they are used up.
+        """
+        root = CallReplay.load(recorded).root("root")
+
+        assert [root.AutomationId for _ in range(3)] == ["root", "renamed", "renamed"]
+
+    def test_unknown_member(self, recorded):
+        """
+        Test that members which were never accessed while recording are reported.
+        """
+        with pytest.raises(AttributeError):
+            _ = CallReplay.load(recorded).root("root").Name
+
+    def test_recorded_timing(self, recorded):
+        """
+        Test that the recorded durations are replayed with the speed-up factor applied.
+        """
+        sleeps = []
+        replay = CallReplay.load(recorded, timing="recorded", speed=2.0)
+        replay._sleep = sleeps.append
+        replay.root("root").FindAllChildren()
+
+        assert sleeps == [pytest.approx(500 / 1e9 / 2.0)]
+
+    def test_invalid_file(self, tmp_path):
+        """
+        Test that files which are not traces are rejected.
+        """
+        path = tmp_path / "other.gz"
+        with gzip.open(path, "wt") as stream:
+            stream.write('{"format": "other"}\n')
+        with pytest.raises(ValueError):
+            CallReplay.load(path)
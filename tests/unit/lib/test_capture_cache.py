@@ -0,0 +1,89 @@
+"""This module contains unit tests to the capture_cache module."""
+
+import numpy as np
+import pytest
+
+from flaui.lib import capture_cache
+from flaui.lib.capture_cache import CaptureCache, invalidates_captures
+from flaui.lib.property_cache import invalidates_properties
+
+
+class FakeElement:
+    """Stands in for an element wrapper, counts its captures."""
+
+    def __init__(self, runtime_key=(42, 1), bounding_rectangle=(0, 0, 10, 5)):
+        self.runtime_key = runtime_key
+        self.bounding_rectangle = bounding_rectangle
+        self.captures = 0
+
+    def capture(self):
+        """Captures a black 10x5 frame."""
+        self.captures += 1
+        return np.zeros((5, 10, 4), dtype=np.uint8)
+
+
+def test_repeated_captures_are_served_within_a_generation():
+    """Test that the element is captured once per generation, and the shared array is read-only."""
+    cache = CaptureCache()
+    element = FakeElement()
+
+    first = cache.get(element, "BGRA", element.capture)
+    second = cache.get(element, "BGRA", element.capture)
+
+    assert first is second
+    assert element.captures == 1 and (cache.hits, cache.misses) == (1, 1)
+    assert not first.flags.writeable
+
+
+def test_key_includes_rectangle_and_order():
+    """Test that another channel order or a moved element is captured again."""
+    cache = CaptureCache()
+    element = FakeElement()
+
+    cache.get(element, "BGRA", element.capture)
+    cache.get(element, "RGBA", element.capture)
+    element.bounding_rectangle = (5, 0, 10, 5)
+    cache.get(element, "BGRA", element.capture)
+
+    assert element.captures == 3
+
+
+def test_invalidate_starts_a_new_generation():
+    """Test that captures of a former generation are dropped and not served."""
+    cache = CaptureCache()
+    element = FakeElement()
+
+    cache.get(element, "BGRA", element.capture)
+    cache.invalidate()
+    cache.get(element, "BGRA", element.capture)
+
+    assert element.captures == 2
+    assert cache.generation == 1 and len(cache) == 1
+
+
+def test_elements_without_runtime_id_and_eviction():
+    """Test that elements without RuntimeId are never cached, and the least recently used capture is evicted."""
+    cache = CaptureCache(max_entries=2)
+    anonymous = FakeElement(runtime_key=None)
+    cache.get(anonymous, "BGRA", anonymous.capture)
+    cache.get(anonymous, "BGRA", anonymous.capture)
+    assert anonymous.captures == 2 and len(cache) == 0
+
+    elements = [FakeElement(runtime_key=(42, _)) for _ in range(3)]
+    for element in elements:
+        cache.get(element, "BGRA", element.capture)
+    cache.get(elements[0], "BGRA", elements[0].capture)
+    assert elements[0].captures == 2 and len(cache) == 2
+
+
+@pytest.mark.parametrize("decorator", [invalidates_captures, invalidates_properties])
+def test_actions_invalidate_the_active_cache(decorator):
+    """Test that input and action methods start a new generation of the active cache."""
+    element = FakeElement()
+    with capture_cache.cache_captures() as cache:
+        action = decorator(lambda: None)
+        cache.get(element, "BGRA", element.capture)
+        action()
+        cache.get(element, "BGRA", element.capture)
+    assert element.captures == 2
+    assert capture_cache.active is None
@@ -42,3 +42,105 @@ class TestTypeCast:
 
         for k, v in test_dict.items():
             assert converted[k] == v
+
+    def test_py_list_primitive_arrays(self):
+        """
+        Test the bulk conversion of C# primitive and string arrays to Python lists.
+        """
+        from System import Array, Double, Int32, String  # pyright: ignore
+
+        numbers = list(range(100))
+        strings = [str(_) for _ in numbers] + ["", "A B"]
+
+        assert TypeCast.py_list(Array[Int32]([1, 2, 3])) == [1, 2, 3]
+        assert TypeCast.py_list(Array[Int32](numbers)) == numbers
+        assert TypeCast.py_list(Array[Double]([_ / 2 for _ in numbers])) == [_ / 2 for _ in numbers]
+        assert TypeCast.py_list(Array[String](strings)) == strings
+        assert TypeCast.py_list(Array[String](strings + [None])) == strings + [None]
+        assert TypeCast.py_list(Array[Int32]([])) == []
+
+    def test_py_list_generic_collections(self):
+        """
+        Test the conversion of C# generic collections copied through CopyTo.
+        """
+        from System.Collections.Generic import Dictionary, List  # pyright: ignore
+
+        numbers = List[int]()
+        for value in range(1000):
+            numbers.Add(value)
+        assert TypeCast.py_list(numbers) == list(range(1000))
+
+        test_object = Dictionary[str, int]()
+        for value in range(100):
+            test_object[str(value)] = value
+        assert TypeCast.py_list(test_object.Keys) == [str(_) for _ in range(100)]
+        assert TypeCast.py_list(test_object.Values) == list(range(100))
+        assert TypeCast.py_dict(test_object) == {str(_): _ for _ in range(100)}
+
+    def test_date_time_conversions(self):
+        """
+        Test the tick based conversions between Python date/datetime/timedelta and C# DateTime/TimeSpan.
+        """
+        from datetime import date, datetime, timedelta, timezone
+
+        from System import DateTime, DateTimeKind  # pyright: ignore
+
+        cs_date = TypeCast.cs_datetime(date(2021, 5, 17))
+        assert (cs_date.Year, cs_date.Month, cs_date.Day, cs_date.Hour) == (2021, 5, 17, 0)
+        assert cs_date.Kind == DateTimeKind.Unspecified
+
+        value = datetime(2021, 5, 17, 13, 45, 30, 123456)
+        assert TypeCast.cs_datetime(value).Equals(DateTime(2021, 5, 17, 13, 45, 30).AddTicks(1234560))
+        assert TypeCast.py_datetime(TypeCast.cs_datetime(value)) == value
+        assert TypeCast.py_date(TypeCast.cs_datetime(value)) == date(2021, 5, 17)
+
+        aware = datetime(2021, 5, 17, 12, tzinfo=timezone(timedelta(hours=2)))
+        cs_aware = TypeCast.cs_datetime(aware)
+        assert cs_aware.Kind == DateTimeKind.Utc and cs_aware.Hour == 10
+        assert TypeCast.py_datetime(cs_aware) == aware
+
+        delta = timedelta(days=2, seconds=5, microseconds=7)
+        assert TypeCast.py_timedelta(TypeCast.cs_timespan(delta)) == delta
+        assert TypeCast.cs_timespan(1500).TotalMilliseconds == 1500
+        assert TypeCast.py_date(None) is None and TypeCast.py_datetime(None) is None
+
+    def test_date_time_arrays(self):
+        """
+        Test the vectorised conversion of Python dates to and from C# DateTime arrays.
+        """
+        from datetime import date, timedelta
+
+        for count in (3, 365):
+            dates = [date(2024, 1, 1) + timedelta(days=_) for _ in range(count)]
+            converted = TypeCast.cs_datetimes(dates)
+            assert converted.Length == count
+            assert (converted[count - 1].Year, converted[count - 1].Month, converted[count - 1].Day) == (
+                dates[-1].year,
+                dates[-1].month,
+                dates[-1].day,
+            )
+            assert TypeCast.py_dates(converted) == dates
+
+    def test_large_date_time_arrays(self):
+        """
+        Test that date ranges above the bulk threshold convert on .NET Framework, which refuses to pin DateTime arrays.
+        """
+        from datetime import date, datetime, timedelta, timezone
+
+        from System import DateTime, DateTimeKind  # pyright: ignore
+        from System.Collections.Generic import List  # pyright: ignore
+
+        from flaui.lib.collections import _BULK_THRESHOLD
+
+        count = _BULK_THRESHOLD * 2
+        start = datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc)
+        converted = TypeCast.cs_datetimes([start + timedelta(days=_) for _ in range(count)])
+        assert converted.Length == count
+        assert (converted[0].Kind, converted[0].Hour) == (DateTimeKind.Utc, 23)
+
+        raw = List[DateTime]()
+        for index in range(count):
+            raw.Add(DateTime(2024, 1, 1).AddDays(index))
+        expected = [date(2024, 1, 1) + timedelta(days=_) for _ in range(count)]
+        assert TypeCast.py_dates(raw.ToArray()) == expected
+        assert TypeCast.py_dates(raw) == expected
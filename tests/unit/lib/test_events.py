@@ -0,0 +1,172 @@
+"""This module contains unit tests to the events module."""
+
+import asyncio
+import threading
+
+from flaui.lib.events import EventCoalescer, EventQueue, EventRecord
+
+from tests.unit.fakes import FakeClock, FakePropertyId, FakeRawElement
+
+
+def changed(time_ms, element, value, kind="property_changed"):
+    """Builds a property-changed record of the Name property."""
+    return EventRecord(kind, time_ms * 1_000_000, FakeRawElement(RuntimeId=[42, element]), FakePropertyId(), value)
+
+
+def fill(queue, count):
+    """Enqueues property-changed events carrying their index as value."""
+    for index in range(count):
+        queue.put("property_changed", None, FakePropertyId(), index)
+
+
+class TestEventQueue:
+    """Tests buffering events between UIA callbacks and consumers."""
+
+    def test_callback(self):
+        """
+        Test that the callbacks enqueue compact records, packing extra event arguments into the value.
+        """
+        queue = EventQueue(clock=lambda: 42)
+        queue.callback("property_changed")("sender", FakePropertyId(), "new name")
+        queue.callback("notification")("sender", "kind", "processing", "display", "activity")
+        queue.callback("focus_changed")("sender")
+
+        changed, notification, focus = queue.drain()
+        assert changed == EventRecord("property_changed", 42, "sender", changed.detail, "new name")
+        assert changed.detail_name == "Name"
+        assert notification.value == ("processing", "display", "activity")
+        assert (focus.kind, focus.detail, focus.detail_name) == ("focus_changed", None, None)
+        assert len(queue) == 0 and queue.received == 3
+
+    def test_drain_batches(self):
+        """
+        Test that records are drained in order, in batches of the requested size.
+        """
+        queue = EventQueue()
+        fill(queue, 5)
+
+        assert [_.value for _ in queue.drain(max_items=2)] == [0, 1]
+        assert [_.value for _ in queue.get_batch(timeout=0)] == [2, 3, 4]
+        assert queue.get_batch(timeout=0) == []
+
+    def test_drop_policies(self):
+        """
+        Test that a full queue drops the oldest or the incoming records, and counts them.
+        """
+        oldest, newest = EventQueue(capacity=3), EventQueue(capacity=3, policy="drop_newest")
+        fill(oldest, 5)
+        fill(newest, 5)
+
+        assert [_.value for _ in oldest.drain()] == [2, 3, 4]
+        assert [_.value for _ in newest.drain()] == [0, 1, 2]
+        assert (oldest.dropped, newest.dropped) == (2, 2)
+
+    def test_block_policy(self):
+        """
+        Test that a full queue makes callbacks wait for room, and drops records once the wait times out.
+        """
+        queue = EventQueue(capacity=2, policy="block", block_timeout=5.0)
+        fill(queue, 2)
+        producer = threading.Thread(target=fill, args=(queue, 1))
+        producer.start()
+        while not producer.is_alive() or queue._room.is_set():
+            pass
+        assert len(queue.drain(max_items=1)) == 1
+        producer.join(timeout=5.0)
+        assert [_.value for _ in queue.drain()] == [1, 0] and queue.dropped == 0
+
+        timed_out = EventQueue(capacity=1, policy="block", block_timeout=0.01)
+        fill(timed_out, 2)
+        assert (len(timed_out), timed_out.dropped) == (1, 1)
+
+    def test_iterate_until_closed(self):
+        """
+        Test that iterating yields every record and stops once the queue is closed and drained.
+        """
+        queue = EventQueue()
+        fill(queue, 3)
+        threading.Timer(0.01, queue.close).start()
+
+        assert [_.value for _ in queue] == [0, 1, 2]
+        fill(queue, 1)
+        assert queue.dropped == 1
+
+    def test_stream(self):
+        """
+        Test that the asyncio stream yields the records in batches until the queue is closed.
+        """
+        queue = EventQueue()
+
+        async def consume():
+            """Collects the batches of the stream, adding a record and closing the queue after the first one."""
+            batches = []
+            async for batch in queue.stream(max_items=2, poll_interval=0.001):
+                batches.append([_.value for _ in batch])
+                if len(batches) == 1:
+                    fill(queue, 1)
+                    queue.close()
+            return batches
+
+        fill(queue, 3)
+        assert asyncio.run(consume()) == [[0, 1], [2, 0]]
+
+
+class TestEventCoalescer:
+    """Tests merging bursts of events into single updates."""
+
+    def test_window(self):
+        """
+        Test that events are merged per element and property within a window, keeping the latest value.
+        """
+        clock = FakeClock()
+        coalescer = EventCoalescer(window=0.010, clock=clock)
+        coalescer.push([changed(0, 1, "a"), changed(2, 2, "x"), changed(4, 1, "b"), changed(6, 1, "c")])
+        coalescer.push([changed(7, 1, "d", kind="structure_changed")])
+
+        assert [_.record.value for _ in coalescer.pop_ready()] == ["d"]
+        clock.now = 10_000_000
+        (first,) = coalescer.pop_ready()
+        assert (first.record.value, first.count, first.first_ns) == ("c", 3, 0)
+        assert coalescer.next_due() == 0.002
+        assert [(_.record.value, _.count) for _ in coalescer.pop_ready(flush=True)] == [("x", 1)]
+        assert coalescer.next_due() is None and coalescer.merged == 2
+
+    def test_debounce(self):
+        """
+        Test that a debounced burst is emitted once its element and property are quiet for a window.
+        """
+        clock = FakeClock()
+        coalescer = EventCoalescer(window=0.010, mode="debounce", clock=clock)
+        coalescer.push([changed(0, 1, "a"), changed(8, 1, "b")])
+
+        clock.now = 12_000_000
+        assert coalescer.pop_ready() == []
+        clock.now = 18_000_000
+        assert [(_.record.value, _.count) for _ in coalescer.pop_ready()] == [("b", 2)]
+
+    def test_throttle(self):
+        """
+        Test that the first update is emitted at once, and the rest at most once per window.
+        """
+        clock = FakeClock()
+        coalescer = EventCoalescer(window=0.010, mode="throttle", clock=clock)
+        coalescer.push([changed(0, 1, "a"), changed(3, 1, "b"), changed(6, 1, "c")])
+
+        assert [_.record.value for _ in coalescer.pop_ready()] == ["a"]
+        clock.now = 10_000_000
+        assert [(_.record.value, _.count) for _ in coalescer.pop_ready()] == [("c", 2)]
+        clock.now = 30_000_000
+        coalescer.push([changed(30, 1, "d")])
+        assert [_.record.value for _ in coalescer.pop_ready()] == ["d"]
+
+    def test_coalesce_queue(self):
+        """
+        Test that the updates of a queue are merged and flushed once the queue is closed.
+        """
+        queue = EventQueue()
+        for value in "abc":
+            queue.put("property_changed", FakeRawElement(RuntimeId=[42, 1]), FakePropertyId(), value)
+        queue.close()
+
+        batches = list(EventCoalescer(window=60.0).coalesce(queue))
+        assert [[(_.record.value, _.count) for _ in batch] for batch in batches] == [[("c", 3)]]
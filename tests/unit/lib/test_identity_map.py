@@ -0,0 +1,62 @@
+"""This module contains unit tests to the identity_map module."""
+import gc
+
+from flaui.lib import identity_map
+from flaui.lib.identity_map import IdentityMap, runtime_id
+
+from tests.unit.fakes import FakeRawElement
+
+
+class Handle:
+    """Stands in for an element wrapper, keeps the key it was created for."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+class TestIdentityMap:
+    """Tests reusing element handles by RuntimeId."""
+
+    def test_runtime_id(self):
+        """
+        Test that RuntimeIds are read as tuples, and missing ones as None.
+        """
+        assert runtime_id(FakeRawElement(RuntimeId=[42, 7])) == (42, 7)
+        assert runtime_id(FakeRawElement(RuntimeId=[])) is None
+        assert runtime_id(FakeRawElement(RuntimeId=None)) is None
+        assert runtime_id(object()) is None
+
+    def test_get_or_create(self):
+        """
+        Test that handles are reused per wrapper class and RuntimeId, and elements without one get new handles.
+        """
+        handles = IdentityMap()
+        first = handles.get_or_create(Handle, FakeRawElement(RuntimeId=[42, 1]), Handle)
+        assert first.key == (42, 1)
+        assert handles.get_or_create(Handle, FakeRawElement(RuntimeId=[42, 1]), Handle) is first
+        assert handles.get_or_create(object, FakeRawElement(RuntimeId=[42, 1]), Handle) is not first
+        assert handles.get_or_create(Handle, FakeRawElement(RuntimeId=[42, 2]), Handle) is not first
+        assert handles.get_or_create(Handle, FakeRawElement(RuntimeId=None), Handle).key is None
+        assert (handles.hits, handles.misses, len(handles)) == (1, 3, 1)
+
+    def test_weak_handles(self):
+        """
+        Test that handles are dropped once nothing else references them.
+        """
+        handles = IdentityMap()
+        handle = handles.get_or_create(Handle, FakeRawElement(RuntimeId=[42, 1]), Handle)
+        assert len(handles) == 1
+        del handle
+        gc.collect()
+        assert len(handles) == 0
+
+    def test_reuse_elements(self):
+        """
+        Test that the context manager activates an identity map and restores the previous one.
+        """
+        assert identity_map.active is None
+        with identity_map.reuse_elements() as handles:
+            assert identity_map.active is handles
+        assert identity_map.active is None
+        assert identity_map.enable() is identity_map.active
+        assert identity_map.disable() is not None and identity_map.active is None
@@ -0,0 +1,122 @@
+"""This module contains unit tests to the image_compare module."""
+
+import numpy as np
+import pytest
+
+from flaui.lib import image_compare
+from flaui.lib.image_compare import compare, hamming_distance, perceptual_hash, tile_hashes, wait_until_stable
+
+
+def image(height=100, width=130):
+    """Gradient image, so that every tile differs from its neighbours."""
+    ys, xs = np.mgrid[0:height, 0:width]
+    pixels = np.stack([xs % 256, ys % 256, (xs + ys) % 256, np.full_like(xs, 255)], axis=-1)
+    return pixels.astype(np.uint8)
+
+
+def test_identical_images():
+    """Test that identical images have no changed region and a zero score."""
+    diff = compare(image(), image())
+
+    assert diff.identical
+    assert diff.score == 0.0 and diff.changed == []
+
+
+def test_changed_regions_are_tight_and_merged():
+    """Test that changed regions are cropped to the changed pixels, and regions of adjacent tiles merged."""
+    after = image()
+    after[10:20, 30:40, 0] += 50  # Spans two tiles, merged into one region
+    after[90:95, 120:125, 1] += 50  # Partial tile at the bottom right edge
+
+    diff = compare(image(), after)
+
+    assert diff.changed == [(30, 10, 10, 10), (120, 90, 5, 5)]
+    assert diff.changed_pixels == 125
+    assert diff.score == pytest.approx(125 / 13000)
+
+
+def test_tolerance_and_alpha():
+    """Test that channel differences within the tolerance and alpha differences are ignored."""
+    after = image()
+    after[0:5, 0:5, 0] += 3
+    after[50:60, 50:60, 3] = 0
+
+    assert compare(image(), after, tolerance=3).identical
+    assert not compare(image(), after).identical
+
+
+def test_masks_in_screen_coordinates():
+    """Test that masked screen regions are ignored, relative to the origin of the images."""
+    after = image()
+    after[10:20, 30:40, 0] += 50
+
+    diff = compare(image(), after, masks=[(1030, 2010, 10, 10)], origin=(1000, 2000))
+
+    assert diff.identical
+    assert diff.score == 0.0
+
+
+def test_tile_hashes_detect_single_pixel_changes():
+    """Test that a single changed byte changes the hash of its tile only."""
+    after = image()
+    after[65, 97, 2] += 1
+
+    changed = tile_hashes(image()) != tile_hashes(after)
+
+    assert changed.shape == (4, 5)
+    assert np.argwhere(changed).tolist() == [[2, 3]]
+
+
+def test_different_sizes():
+    """Test that images of different sizes are rejected."""
+    with pytest.raises(ValueError):
+        compare(image(), image(width=10))
+
+
+def test_perceptual_hash():
+    """Test that perceptual hashes ignore a brightness change, and tell mirrored images apart."""
+    base = image()
+    brighter = np.clip(base.astype(int) + 10, 0, 255).astype(np.uint8)
+
+    assert hamming_distance(perceptual_hash(base), perceptual_hash(brighter)) <= 2
+    assert hamming_distance(perceptual_hash(base), perceptual_hash(base[:, ::-1])) > 20
+
+
+def test_wait_until_stable(monkeypatch):
+    """Test that captures stop once the screen stayed unchanged for the stable period."""
+    frames = [image(), image(), image(), image(), image()]
+    frames[1][0, 0, 0] = 99
+    now = [0]
+    monkeypatch.setattr(image_compare.time, "monotonic", lambda: now[0] / 1000)
+    monkeypatch.setattr(image_compare.Retry, "_sleep_ms", staticmethod(lambda ms: None))
+    captures = iter(frames)
+
+    def capture():
+        """Advances the clock by 100 ms and returns the next frame."""
+        now[0] += 100
+        return next(captures)
+
+    # Changes at 200 ms (frame 1) and 300 ms (frame 2), stable for 200 ms at 500 ms
+    assert wait_until_stable(capture, stable_for=200, timeout=10_000)
+    assert next(captures, None) is None
+
+
+def test_wait_until_stable_captures_elements_past_the_cache(monkeypatch):
+    """Test that elements are captured with the capture cache bypassed."""
+    monkeypatch.setattr(image_compare.Retry, "_sleep_ms", staticmethod(lambda ms: None))
+
+    class Element:
+        """Stands in for an element wrapper, records the arguments of its captures."""
+
+        def __init__(self):
+            self.calls = []
+
+        def capture_array(self, cached=True):
+            """Records the call and returns the same image."""
+            self.calls.append(cached)
+            return image()
+
+    element = Element()
+
+    assert wait_until_stable(element, stable_for=0, timeout=1000)
+    assert element.calls and not any(element.calls)
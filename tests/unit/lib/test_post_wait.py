@@ -0,0 +1,101 @@
+"""This module contains unit tests to the post_wait module."""
+import pytest
+
+from flaui.lib.post_wait import PostWaitRecord, PostWaitTelemetry, telemetry, wait_after_input
+
+
+class FakeTime:
+    """Clock which only advances when sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        """Returns the time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Records the sleep and advances the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time():
+    """Returns a fake clock, with the telemetry reset around the test."""
+    telemetry.reset()
+    yield FakeTime()
+    telemetry.reset()
+
+
+class TestPostWait:
+    """Tests fixed and idle post-waits and their telemetry."""
+
+    def test_fixed(self, fake_time):
+        """
+        Test that without probe or condition the whole budget is slept.
+        """
+        record = wait_after_input(0.1, clock=fake_time.clock, sleep=fake_time.sleep)
+
+        assert (record.outcome, record.waited, record.saved) == ("fixed", 0.1, 0.0)
+        assert fake_time.sleeps == [0.1]
+
+    def test_idle(self, fake_time):
+        """
+        Test that the wait returns as soon as the probe reports idle and that the saved time is recorded.
+        """
+        answers = iter([False, False, True])
+        remaining = []
+
+        def probe(seconds):
+            """Records the remaining budget and answers the next idle state."""
+            remaining.append(seconds)
+            return next(answers)
+
+        record = wait_after_input(0.1, probe=probe, poll_interval=0.01, clock=fake_time.clock, sleep=fake_time.sleep)
+
+        assert record.outcome == "idle"
+        assert record.waited == pytest.approx(0.02)
+        assert record.saved == pytest.approx(0.08)
+        assert remaining == pytest.approx([0.1, 0.09, 0.08])
+        assert telemetry.summary().saved == pytest.approx(0.08)
+
+    def test_condition_takes_precedence(self, fake_time):
+        """
+        Test that a condition is used instead of the idle probe.
+        """
+        record = wait_after_input(
+            0.1, probe=lambda _: False, condition=lambda: True, clock=fake_time.clock, sleep=fake_time.sleep
+        )
+
+        assert (record.outcome, record.waited) == ("condition", 0.0)
+        assert fake_time.sleeps == []
+
+    def test_timeout(self, fake_time):
+        """
+        Test that the wait never exceeds the budget.
+        """
+        record = wait_after_input(
+            0.1, condition=lambda: False, poll_interval=0.03, clock=fake_time.clock, sleep=fake_time.sleep
+        )
+
+        assert record.outcome == "timeout"
+        assert record.waited == pytest.approx(0.1)
+        assert fake_time.sleeps[-1] == pytest.approx(0.01)
+        assert telemetry.summary().timeouts == 1
+
+    def test_telemetry(self):
+        """
+        Test that totals cover every post-wait while the history is bounded.
+        """
+        store = PostWaitTelemetry(history_size=2)
+        for waited in (0.1, 0.05, 0.0):
+            store.record(PostWaitRecord(budget=0.1, waited=waited, outcome="idle"))
+
+        summary = store.summary()
+        assert (summary.calls, len(store.history())) == (3, 2)
+        assert summary.saved == pytest.approx(0.15)
+        assert summary.waited == pytest.approx(0.15)
+        store.reset()
+        assert store.summary().calls == 0
@@ -0,0 +1,80 @@
+"""This module contains unit tests to the property_cache module."""
+import math
+
+from flaui.lib import property_cache
+from flaui.lib.property_cache import PropertyCache, invalidates_properties
+
+from tests.unit.fakes import FakeClock
+
+
+class Counter:
+    """Counts the reads of a property."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def __call__(self):
+        """Counts the read and returns the count."""
+        self.reads += 1
+        return self.reads
+
+
+class TestPropertyCache:
+    """Tests caching property reads per element."""
+
+    def test_time_to_live(self):
+        """
+        Test that volatile values are served until their time to live runs out, and static ones until invalidated.
+        """
+        clock = FakeClock()
+        cache = PropertyCache(ttls={"name": 10.0}, clock=clock)
+        values, name, automation_id = {}, Counter(), Counter()
+
+        assert [cache.read(values, "name", name) for _ in range(3)] == [1, 1, 1]
+        clock.now = 0.011
+        assert cache.read(values, "name", name) == 2
+        clock.now = 1e6
+        assert cache.read(values, "automation_id", automation_id) == cache.read(values, "automation_id", automation_id)
+        assert (cache.hits, cache.misses) == (3, 3)
+
+    def test_uncached_properties(self):
+        """
+        Test that properties without a time to live are always read.
+        """
+        cache = PropertyCache(ttls={"name": 0})
+        values, name, other = {}, Counter(), Counter()
+
+        assert [cache.read(values, "name", name) for _ in range(2)] == [1, 2]
+        assert [cache.read(values, "other", other) for _ in range(2)] == [1, 2]
+        assert values == {}
+
+    def test_invalidate(self):
+        """
+        Test that actions invalidate the volatile values of all elements and keep the static ones.
+        """
+        cache = PropertyCache(ttls={"class_name": math.inf})
+        values, name, class_name = {}, Counter(), Counter()
+        cache.read(values, "name", name)
+        cache.read(values, "class_name", class_name)
+
+        @invalidates_properties
+        def click():
+            """Stands in for an action method."""
+            return "clicked"
+
+        with property_cache.cache_properties() as active:
+            assert property_cache.active is active
+            property_cache.active = cache
+            assert click() == "clicked"
+        assert property_cache.active is None
+        assert cache.read(values, "name", name) == 2
+        assert cache.read(values, "class_name", class_name) == 1
+
+    def test_enable_disable(self):
+        """
+        Test that custom time to live values are merged into the defaults.
+        """
+        cache = property_cache.enable(ttls={"name": 500.0})
+        assert property_cache.active is cache
+        assert cache.ttls["name"] == 500.0 and cache.ttls["control_type"] == math.inf
+        assert property_cache.disable() is cache and property_cache.active is None
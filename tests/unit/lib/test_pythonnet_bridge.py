@@ -19,3 +19,52 @@ def test_setup_pythonnet_bridge() -> None:
     except Exception as err:
         logger.exception(f"{err}")
         pytest.fail("Failed to setup Python.NET bridge for FlaUI dependencies")
+
+
+def test_load_timings_recorded_for_manifest_assemblies() -> None:
+    """Tests that every assembly listed in the manifest is loaded once and has its load time recorded."""
+    from flaui.lib.enums import UIAutomationTypes
+    from flaui.lib.pythonnet_bridge import (
+        BACKEND_ASSEMBLIES,
+        CORE_ASSEMBLIES,
+        ensure_backend_loaded,
+        get_load_timings,
+    )
+
+    ensure_backend_loaded(UIAutomationTypes.UIA3)
+    timings = get_load_timings()
+
+    for name in CORE_ASSEMBLIES + BACKEND_ASSEMBLIES[UIAutomationTypes.UIA3]:
+        assert name in timings
+        assert timings[name] >= 0.0
+    assert next(iter(timings)) == "FlaUI.Core"  # The core assembly is loaded before any backend
+
+
+def test_assembly_index_is_keyed_by_mtime_and_size(tmp_path) -> None:
+    """Tests that the assembly index is reused while the file is unchanged and refreshed once it changes."""
+    from flaui.lib.pythonnet_bridge import _assembly_version, _read_assembly_index, _write_assembly_index
+
+    class _Assembly:
+        """Minimal stand-in for a loaded C# Assembly exposing GetName().Version."""
+
+        def __init__(self, version: str) -> None:
+            self.version = version
+
+        def GetName(self):
+            """Returns self so that GetName().Version resolves to the given version."""
+            return type("AssemblyName", (), {"Version": self.version})()
+
+    dll = tmp_path.joinpath("Sample.dll")
+    dll.write_bytes(b"v1")
+    index_path = tmp_path.joinpath("index", "assembly_index.json")
+
+    index = _read_assembly_index(index_path)
+    assert index == {}
+    assert _assembly_version(dll, _Assembly("1.0.0.0"), index) == ("1.0.0.0", True)
+    _write_assembly_index(index_path, index)
+
+    index = _read_assembly_index(index_path)
+    assert _assembly_version(dll, _Assembly("9.9.9.9"), index) == ("1.0.0.0", False)
+
+    dll.write_bytes(b"version-2")
+    assert _assembly_version(dll, _Assembly("2.0.0.0"), index) == ("2.0.0.0", True)
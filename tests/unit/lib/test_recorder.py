@@ -0,0 +1,141 @@
+"""This module contains unit tests to the recorder module."""
+
+import threading
+import time
+
+import numpy as np
+from PIL import Image
+
+from flaui.lib.recorder import ScreenRecorder
+
+
+def frames(count, height=70, width=90):
+    """Frames with a moving square, every third frame repeats the previous one."""
+    result = []
+    for index in range(count):
+        frame = np.full((height, width, 4), 255, dtype=np.uint8)
+        position = (index // 3 * 3) * 4
+        frame[position : position + 10, position : position + 10, :3] = (index * 20) % 256
+        result.append(frame)
+    return result
+
+
+class Capture:
+    """Returns the given frames, then signals that all were captured."""
+
+    def __init__(self, frames):
+        self.frames = iter(frames)
+        self.done = threading.Event()
+
+    def __call__(self):
+        """Returns a copy of the next frame, raises once all frames were returned."""
+        frame = next(self.frames, None)
+        if frame is None:
+            self.done.set()
+            raise RuntimeError("No more frames")
+        return frame.copy()
+
+
+def record(tmp_path, expected, **kwargs):
+    """Records the frames at 500 fps, returns the stopped recorder and its output."""
+    capture = Capture(expected)
+    recorder = ScreenRecorder(capture, tmp_path / "video", fps=500, **kwargs).start()
+    assert capture.done.wait(10)
+    return recorder, recorder.stop()
+
+
+def test_png_sequence_is_lossless(tmp_path):
+    """
+    Test that the frames rebuilt from key frames and deltas are written unchanged as PNG files.
+    """
+    expected = frames(12)
+
+    recorder, output = record(tmp_path, expected, format="png", order="RGBA", chunk_frames=5, key_interval=4)
+
+    files = sorted(output.iterdir())
+    assert [_.name for _ in files[:2]] == ["frame_000000.png", "frame_000001.png"]
+    assert recorder.captured == recorder.written == 12 and not recorder.dropped
+    assert len(files) == len(expected)
+    for frame, file in zip(expected, files):  # noqa: B905, lengths are checked above
+        assert np.array_equal(np.asarray(Image.open(file)), frame)
+
+
+def test_mjpeg_stream(tmp_path):
+    """
+    Test that every frame is written as a JPEG into one stream.
+    """
+    recorder, output = record(tmp_path, frames(10))
+
+    data = output.read_bytes()
+    assert output.name == "video.mjpeg"
+    assert data.count(b"\xff\xd8\xff") == recorder.written == 10
+
+
+def test_full_buffer_drops_new_frames(tmp_path):
+    """
+    Test that frames captured while the buffer is full are dropped, and the buffered ones written.
+    """
+    expected = frames(9)
+    recorder = ScreenRecorder(Capture([]), tmp_path / "video", format="png", order="RGBA", buffer_frames=4)
+    recorder.output.mkdir()
+    for frame in expected:
+        recorder._push(frame.copy())
+    recorder._stopping.set()
+    recorder._write_loop()
+
+    files = sorted(recorder.output.iterdir())
+    assert recorder.dropped == 5
+    assert len(files) == 4
+    for frame, file in zip(expected[:4], files):  # noqa: B905, lengths are checked above
+        assert np.array_equal(np.asarray(Image.open(file)), frame)
+
+
+def test_resize_within_the_tile_grid(tmp_path):
+    """
+    Test that a capture resized within the same tile grid is written as a key frame.
+    """
+    expected = frames(3) + frames(3, height=75, width=95)
+
+    recorder, output = record(tmp_path, expected, format="png", order="RGBA")
+
+    files = sorted(output.iterdir())
+    assert recorder.written == 6
+    assert len(files) == len(expected)
+    for frame, file in zip(expected, files):  # noqa: B905, lengths are checked above
+        assert np.array_equal(np.asarray(Image.open(file)), frame)
+
+
+def test_write_error_resumes_from_a_key_frame(tmp_path):
+    """
+    Test that a failed write is counted, and the writer keeps writing from the next frame on.
+    """
+    expected = frames(6)
+    recorder = ScreenRecorder(Capture([]), tmp_path / "video", format="png", order="RGBA", chunk_frames=3)
+    recorder.output.mkdir()
+    encode = recorder._encode
+
+    def failing_encode(frame):
+        """Fails until the first error is counted, then encodes the frame."""
+        if not recorder.errors:
+            raise OSError("Disk full")
+        return encode(frame)
+
+    recorder._encode = failing_encode
+    writer = threading.Thread(target=recorder._write_loop)
+    writer.start()
+    for frame in expected[:3]:
+        recorder._push(frame.copy())
+    for _ in range(500):
+        if recorder.errors:
+            break
+        time.sleep(0.01)
+    for frame in expected[3:]:
+        recorder._push(frame.copy())
+    recorder.stop()
+    writer.join()
+
+    files = sorted(recorder.output.iterdir())
+    assert recorder.errors == 1 and recorder.written == 3
+    assert len(files) == len(expected[3:])
+    for frame, file in zip(expected[3:], files):  # noqa: B905, lengths are checked above
+        assert np.array_equal(np.asarray(Image.open(file)), frame)
@@ -0,0 +1,92 @@
+"""This module contains unit tests to the screenshots module."""
+import numpy as np
+import pytest
+
+from flaui.lib import screenshots
+
+
+class FakeBitmap:
+    """Stands in for a System.Drawing.Bitmap of BGRA pixels."""
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.Height, self.Width = pixels.shape[:2]
+        self.disposed = False
+
+    def Dispose(self):
+        """Releases the bitmap."""
+        self.disposed = True
+
+
+@pytest.fixture
+def copy_pixels(monkeypatch):
+    """Replaces the GDI+ copy with a NumPy one, records the destination arrays."""
+    targets = []
+
+    def fake_copy(bitmap, array):
+        """Copies the pixels of the fake bitmap into the array."""
+        targets.append(array)
+        array[...] = bitmap.pixels
+
+    monkeypatch.setattr(screenshots, "_copy_pixels", fake_copy)
+    return targets
+
+
+def pixels():
+    """A 3x2 frame whose bytes count up from 0."""
+    return np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+
+
+def test_bitmap_to_array(copy_pixels):
+    """Test that the bitmap is copied into a new HxWx4 BGRA array and disposed."""
+    bitmap = FakeBitmap(pixels())
+
+    array = screenshots.bitmap_to_array(bitmap)
+
+    assert array.shape == (2, 3, 4) and array.dtype == np.uint8
+    assert np.array_equal(array, pixels())
+    assert bitmap.disposed
+
+
+def test_bitmap_to_array_rgba_and_reused_buffer(copy_pixels):
+    """Test that the pixels are reordered to RGBA, and a buffer is reused only if it has the frame shape."""
+    out = screenshots.empty_frame(2, 3)
+
+    array = screenshots.bitmap_to_array(FakeBitmap(pixels()), order="RGBA", out=out)
+
+    assert array is out
+    assert array[0, 0].tolist() == [2, 1, 0, 3]
+    assert screenshots.bitmap_to_array(FakeBitmap(pixels()), out=screenshots.empty_frame(3, 3)).shape == (2, 3, 4)
+
+
+def test_bitmap_is_disposed_on_error(monkeypatch):
+    """Test that the bitmap is disposed when the copy fails."""
+    def failing_copy(bitmap, array):
+        """Fails like GDI+ would."""
+        raise RuntimeError("GDI+ error")
+
+    monkeypatch.setattr(screenshots, "_copy_pixels", failing_copy)
+    bitmap = FakeBitmap(pixels())
+
+    with pytest.raises(RuntimeError):
+        screenshots.bitmap_to_array(bitmap)
+    assert bitmap.disposed
+
+
+def test_to_image_shares_rgba_memory():
+    """Test that RGBA arrays are wrapped into an image without copying the pixels."""
+    array = pixels()
+
+    image = screenshots.to_image(array, order="RGBA")
+    array[0, 0, 0] = 99
+
+    assert image.size == (3, 2) and image.mode == "RGBA"
+    assert image.getpixel((0, 0)) == (99, 1, 2, 3)
+
+
+def test_to_image_converts_bgra():
+    """Test that BGRA arrays are converted to RGBA images."""
+    image = screenshots.to_image(pixels())
+
+    assert image.getpixel((0, 0)) == (2, 1, 0, 3)
+    assert screenshots.swap_red_blue(pixels())[0, 0].tolist() == [2, 1, 0, 3]
@@ -0,0 +1,54 @@
+"""This module contains unit tests to the tables module."""
+import pytest
+
+from flaui.lib.tables import column_names, to_columns
+
+
+class TestTables:
+    """Tests the conversion of table rows into columns."""
+
+    def test_column_names(self):
+        """
+        Test that blank, missing and duplicate headers get unique names.
+        """
+        assert column_names(["Name", "", None, "Name"], 5) == ["Name", "column_1", "column_2", "Name_1", "column_4"]
+        assert column_names([], 0) == []
+
+    def test_generated_names_never_collide(self):
+        """
+        Test that suffixed and generated names skip the names of other headers, so no column is dropped.
+        """
+        assert column_names(["Name", "Name_1", "Name"], 3) == ["Name", "Name_1", "Name_2"]
+        assert column_names(["Name", "Name", "Name_1"], 3) == ["Name", "Name_1", "Name_1_1"]
+        assert column_names(["", "column_0", "column_0"], 3) == ["column_0", "column_0_1", "column_0_2"]
+        assert to_columns(["Name", "Name_1", "Name"], [[1, 3, 2]]) == {"Name": [1], "Name_1": [3], "Name_2": [2]}
+
+    def test_to_columns_dict(self):
+        """
+        Test the transposition of rows into a dict of lists, padding short rows with None.
+        """
+        rows = [["John", "Doe", "42"], ["Jane", "Doe"]]
+        assert to_columns(["First", "Last", "Age"], rows) == {
+            "First": ["John", "Jane"],
+            "Last": ["Doe", "Doe"],
+            "Age": ["42", None],
+        }
+        assert to_columns(["First"], []) == {"First": []}
+
+    def test_to_columns_numpy(self):
+        """
+        Test the conversion into a dict of NumPy arrays.
+        """
+        numpy = pytest.importorskip("numpy")
+
+        columns = to_columns(["A", "B"], [["1", "2"], ["3"]], output="numpy")
+        assert isinstance(columns["A"], numpy.ndarray)
+        assert columns["A"].tolist() == ["1", "3"]
+        assert columns["B"].dtype == object
+
+    def test_to_columns_unknown_format(self):
+        """
+        Test that an unknown output format is rejected.
+        """
+        with pytest.raises(ValueError):
+            to_columns(["A"], [["1"]], output="csv")  # type: ignore[arg-type]
@@ -0,0 +1,102 @@
+"""This module contains unit tests to the tracing module."""
+import json
+
+import pytest
+
+from flaui.lib import tracing
+from flaui.lib.tracing import Tracer
+
+from tests.unit.fakes import FakeClock, FakeRawElement
+
+
+class FakeElement:
+    """Stands in for a button wrapper."""
+
+    raw_element = FakeRawElement(AutomationId="OkButton", ControlType="Button")
+
+    def click(self):
+        """Returns a marker instead of clicking."""
+        return "clicked"
+
+
+class TestTracer:
+    """Tests recording, exporting and aggregating traced calls."""
+
+    def test_call(self):
+        """
+        Test that calls are recorded with element identity and outcome, and exceptions are re-raised.
+        """
+        tracer = Tracer(clock=FakeClock(step=1000))
+        element = FakeElement()
+
+        assert tracer.call("Button.click", "wrapper", FakeElement.click, (element,), {}) == "clicked"
+        with pytest.raises(ValueError):
+            tracer.call("int", "sta", int, ("x",), {})
+
+        first, second = tracer.events
+        assert (first.name, first.element, first.duration_ns, first.outcome) == ("Button.click", "OkButton/Button", 1000, "ok")
+        assert (second.category, second.element, second.outcome) == ("sta", None, "ValueError")
+
+    def test_identity_target(self):
+        """
+        Test that the element identity is read from the identity target instead of the first argument when given.
+        """
+        tracer = Tracer(clock=FakeClock(step=1000))
+        element = FakeElement()
+
+        def dispatch(func, *args):
+            """Calls the function, like the STA executor does on its thread."""
+            return func(*args)
+
+        assert tracer.call("Button.click", "sta", dispatch, (element.click,), {}, identity_target=element) == "clicked"
+        assert tracer.call("Button.click", "sta", dispatch, (FakeElement.click, element), {}) == "clicked"
+
+        assert [_.element for _ in tracer.events] == ["OkButton/Button", None]
+
+    def test_ring_buffer(self):
+        """
+        Test that the oldest calls are dropped once the capacity is reached.
+        """
+        tracer = Tracer(capacity=2)
+        for value in range(3):
+            tracer.call(f"call_{value}", "wrapper", abs, (value,), {})
+
+        assert [_.name for _ in tracer.events] == ["call_1", "call_2"]
+        assert tracer.dropped == 1
+
+    def test_chrome_trace(self, tmp_path):
+        """
+        Test that calls are exported as complete events in microseconds.
+        """
+        tracer = Tracer(clock=FakeClock(step=2000))
+        tracer.call("Button.click", "wrapper", FakeElement.click, (FakeElement(),), {})
+
+        trace = json.loads(tracer.write_chrome_trace(tmp_path / "trace.json").read_text())
+        (event,) = trace["traceEvents"]
+        assert (event["ph"], event["ts"], event["dur"]) == ("X", 2.0, 2.0)
+        assert event["args"] == {"element": "OkButton/Button", "outcome": "ok"}
+
+    def test_aggregate(self):
+        """
+        Test that calls are aggregated per method, the most expensive in total first.
+        """
+        tracer = Tracer(clock=FakeClock(step=1_000_000), capture_elements=False)
+        for name in ("cheap", "expensive", "expensive", "expensive"):
+            tracer.call(name, "wrapper", abs, (1,), {})
+        with pytest.raises(TypeError):
+            tracer.call("cheap", "wrapper", abs, ("x",), {})
+
+        stats = tracer.aggregate()
+        assert [(_.name, _.calls, _.errors, _.total_ms) for _ in stats] == [("expensive", 3, 0, 3.0), ("cheap", 2, 1, 2.0)]
+        assert tracer.format_table().splitlines()[1].startswith("expensive")
+
+    def test_trace_context(self):
+        """
+        Test that the context manager activates a tracer and restores the previous one.
+        """
+        assert tracing.active is None
+        with tracing.trace() as tracer:
+            assert tracing.active is tracer
+        assert tracing.active is None
+        assert tracing.enable() is tracing.active
+        assert tracing.disable() is not None and tracing.active is None
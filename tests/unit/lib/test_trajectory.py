@@ -0,0 +1,79 @@
+"""This module contains unit tests to the trajectory module."""
+import math
+
+import numpy as np
+import pytest
+
+from flaui.lib.trajectory import Easing, plan_bezier, plan_linear, plan_rotation, replay
+
+
+class TestTrajectory:
+    """Tests the trajectory planner."""
+
+    def test_plan_linear(self):
+        """
+        Test that a linear plan has one step per interval and ends exactly on the end points.
+        """
+        trajectory = plan_linear([((0, 0), (100, 50)), ((10, 10), (10, 110))], duration_ms=100, interval_ms=10)
+
+        assert trajectory.points.shape == (11, 2, 2)
+        assert trajectory.times_ms.tolist() == [float(_) for _ in range(0, 101, 10)]
+        assert trajectory.points[0].tolist() == [[0, 0], [10, 10]]
+        assert trajectory.points[5].tolist() == [[50, 25], [10, 60]]
+        assert trajectory.points[-1].tolist() == [[100, 50], [10, 110]]
+
+        skipped = plan_linear([((0, 0), (100, 50))], duration_ms=95, interval_ms=10, skip_initial_position=True)
+        assert len(skipped) == 10
+        assert skipped.duration_ms == 95
+        assert skipped.points[-1, 0].tolist() == [100, 50]
+
+    def test_plan_rotation(self):
+        """
+        Test that a rotation plan matches the points of FlaUI's Interpolation.ExecuteRotation.
+        """
+        trajectory = plan_rotation((100, 100), 50, 0.0, 3.14159 / 2, duration_ms=100, interval_ms=10)
+
+        assert trajectory.points[:, 0].tolist()[:3] == [[150, 100], [149, 107], [147, 115]]
+        assert trajectory.points[-1, 0].tolist() == [100, 149]
+
+    @pytest.mark.parametrize("easing", list(Easing))
+    def test_easing(self, easing: Easing):
+        """
+        Test that every easing curve starts and ends on the path ends and progresses monotonically.
+        """
+        trajectory = plan_linear([((0, 0), (1000, 0))], duration_ms=200, interval_ms=10, easing=easing)
+        xs = trajectory.points[:, 0, 0]
+
+        assert xs[0] == 0 and xs[-1] == 1000
+        assert np.all(np.diff(xs) >= 0)
+
+    def test_plan_bezier(self):
+        """
+        Test a quadratic bezier curve against its closed form.
+        """
+        trajectory = plan_bezier([(0, 0), (50, 100), (100, 0)], duration_ms=100, interval_ms=50)
+
+        assert trajectory.points[:, 0].tolist() == [[0, 0], [50, 50], [100, 0]]
+        with pytest.raises(ValueError):
+            plan_bezier([(0, 0)], duration_ms=100)
+
+    def test_replay(self):
+        """
+        Test that the replay schedules every step against the start time and reports the jitter.
+        """
+        now = [0.0]
+        calls = []
+
+        def sleep(seconds: float) -> None:
+            """Advances the fake clock and oversleeps by 3 ms."""
+            now[0] += seconds + 0.003
+
+        trajectory = plan_linear([((0, 0), (30, 0))], duration_ms=30, interval_ms=10)
+        report = replay(trajectory, lambda points: calls.append(points[0, 0]), clock=lambda: now[0], sleep=sleep)
+
+        assert calls == [0, 10, 20, 30]
+        assert report.steps == 4
+        assert report.planned_duration_ms == 30
+        # The first step is due immediately, every later one overslept by 1 ms past its deadline
+        assert math.isclose(report.max_jitter_ms, 1.0, abs_tol=1e-6)
+        assert math.isclose(report.mean_jitter_ms, 0.75, abs_tol=1e-6)